@@ -0,0 +1,75 @@
+"""
+Checkpoint write throughput of the experiment database for every connection profile.
+
+Uses the same local, no-LLM linear graph as examples/compare_arch/linear.py, so the
+measured time is dominated by SqliteSaver writing checkpoints.
+
+Usage:
+    python examples/benchmarks/checkpoint_throughput.py [iterations]
+"""
+import sys
+import time
+import tempfile
+from langgraph.graph import StateGraph, START, END, MessagesState
+from langchain_core.messages import AIMessage
+from langgraph_compare import create_experiment, run_multiple_iterations
+from langgraph_compare.experiment import CONNECTION_PROFILES
+
+
+class State(MessagesState):
+    final_answer: str
+
+
+def researcher(state: State) -> State:
+    state["messages"].append(AIMessage(content="Research completed: Found relevant information"))
+    return state
+
+
+def analyser(state: State) -> State:
+    state["messages"].append(AIMessage(content="Analysis completed: Processed research data"))
+    return state
+
+
+def writer(state: State) -> State:
+    state["final_answer"] = "Final synthesized response"
+    return state
+
+
+def build_linear_graph(memory):
+    workflow = StateGraph(State)
+
+    workflow.add_node("researcher", researcher)
+    workflow.add_node("analyser", analyser)
+    workflow.add_node("writer", writer)
+
+    workflow.add_edge(START, "researcher")
+    workflow.add_edge("researcher", "analyser")
+    workflow.add_edge("analyser", "writer")
+    workflow.add_edge("writer", END)
+
+    return workflow.compile(checkpointer=memory)
+
+
+def benchmark(profile: str, iterations: int, base_dir: str) -> None:
+    exp = create_experiment(f"throughput_{profile}", base_dir=base_dir, connection_profile=profile)
+    graph = build_linear_graph(exp.memory)
+
+    start = time.perf_counter()
+    run_multiple_iterations(graph, 1, iterations,
+                            {"messages": [("user", "Please research the topic of multi-agent systems")]},
+                            verbosity="silent")
+    elapsed = time.perf_counter() - start
+
+    checkpoints = exp.connection.execute("SELECT COUNT(*) FROM checkpoints").fetchone()[0]
+    exp.connection.close()
+
+    print(f"{profile:>8}: {iterations} runs, {checkpoints} checkpoints in {elapsed:.2f} s "
+          f"-> {checkpoints / elapsed:,.0f} checkpoints/s, {iterations / elapsed:,.1f} runs/s")
+
+
+if __name__ == "__main__":
+    iterations = int(sys.argv[1]) if len(sys.argv) > 1 else 500
+
+    with tempfile.TemporaryDirectory() as base_dir:
+        for profile in CONNECTION_PROFILES:
+            benchmark(profile, iterations, base_dir)
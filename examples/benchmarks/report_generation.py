@@ -0,0 +1,77 @@
+"""
+End-to-end time of generate_reports on a synthetic event log.
+
+The log has the same columns as the one exported by prepare_data: cases of 50 events
+drawn from a small set of activities, so there are many distinct variants.
+
+With --legacy, the reports are also computed with the per-metric functions from
+langgraph_compare.analyze, the way they were generated before the shared analysis.
+They scan the log case by case, so use a smaller log (e.g. 100000 events) with it.
+
+Usage:
+    python examples/benchmarks/report_generation.py [events] [--legacy]
+"""
+import sys
+import time
+import tempfile
+import numpy as np
+import pandas as pd
+import pm4py
+from langgraph_compare.analyze import (get_act_counts, get_global_act_reworks, get_mean_act_times, get_avg_duration,
+                                       get_starts, get_ends, get_sequence_probs)
+from langgraph_compare.create_report import generate_reports
+
+ACTIVITIES = ["__start__", "supervisor", "researcher", "analyser", "writer", "reviewer", "tool"]
+EVENTS_PER_CASE = 50
+
+
+def synthetic_event_log(events: int) -> pd.DataFrame:
+    rng = np.random.default_rng(0)
+    cases = max(events // EVENTS_PER_CASE, 1)
+    size = cases * EVENTS_PER_CASE
+
+    # Every event starts when the previous one ends, cases run one after another
+    durations = pd.Series(pd.to_timedelta(rng.exponential(0.5, size), unit="s"))
+    ends = pd.Timestamp("2025-01-01", tz="UTC") + durations.cumsum()
+    starts = ends - durations
+
+    df = pd.DataFrame({
+        "case_id": np.repeat(np.arange(1, cases + 1), EVENTS_PER_CASE),
+        "timestamp": starts,
+        "end_timestamp": ends,
+        "cost": 0,
+        "activity": rng.choice(ACTIVITIES, size),
+    })
+    df["org:resource"] = df["activity"]
+    return pm4py.format_dataframe(df, case_id="case_id", activity_key="activity", timestamp_key="timestamp")
+
+
+def legacy_reports(event_log: pd.DataFrame) -> None:
+    event_log = event_log.copy()
+    get_act_counts(event_log)
+    get_global_act_reworks(event_log)
+    get_mean_act_times(event_log)
+    get_avg_duration(event_log)
+
+    event_log = event_log.copy()
+    get_starts(event_log)
+    get_ends(event_log)
+    get_sequence_probs(event_log)
+
+
+if __name__ == "__main__":
+    args = [arg for arg in sys.argv[1:] if not arg.startswith("--")]
+    events = int(args[0]) if args else 1_000_000
+
+    event_log = synthetic_event_log(events)
+    print(f"Synthetic event log: {len(event_log):,} events, {event_log['case_id'].nunique():,} cases")
+
+    with tempfile.TemporaryDirectory() as output_dir:
+        start = time.perf_counter()
+        generate_reports(event_log, output_dir)
+        print(f"generate_reports: {time.perf_counter() - start:.2f} s")
+
+    if "--legacy" in sys.argv:
+        start = time.perf_counter()
+        legacy_reports(event_log)
+        print(f"per-metric analyze functions: {time.perf_counter() - start:.2f} s")
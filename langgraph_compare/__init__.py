@@ -1,7 +1,7 @@
 __all__ = [
     # Modules
     "load_events", "analyze", "analyze_case_id", "graph_runner", "jsons_to_csv", "sql_to_jsons", "visualize",
-    "experiment", "create_report", "create_html", "artifacts",
+    "experiment", "create_report", "create_html", "artifacts", "compact", "catalog", "dashboard",
 
     # Functions - load_csv
     "load_event_log",
@@ -20,6 +20,7 @@ __all__ = [
     "print_analysis",
     "get_avg_duration", "print_avg_duration",
     "get_global_act_reworks", "print_global_act_reworks",
+    "get_dfg_percentiles", "print_dfg_percentiles",
 
     # Functions - analyze_case_id
     "get_case_sequence", "print_case_sequence",
@@ -35,7 +36,7 @@ __all__ = [
     "print_case_analysis",
 
     # Functions - graph_runner
-    "run_multiple_iterations",
+    "run_multiple_iterations", "arun_multiple_iterations", "run_sharded_iterations",
 
     # Functions - jsons_to_csv
     "export_jsons_to_csv",
@@ -58,6 +59,18 @@ __all__ = [
     # Functions - artifacts
     "prepare_data", "generate_artifacts",
 
+    # Functions - compact
+    "compact_database",
+
+    # Functions - catalog
+    "get_experiments", "print_experiments",
+
+    # Functions - dashboard
+    "serve_dashboard",
+
+    # Classes - graph_runner
+    "StepEvent",
+
     #Classes - jsons_to_csv
     "SubgraphConfig", "SupervisorConfig", "GraphConfig",
 
@@ -65,7 +78,10 @@ __all__ = [
     "ExperimentPaths",
 
     # Classes - create_html
-    "InfrastructureDirs"
+    "InfrastructureDirs",
+
+    # Classes - dashboard
+    "DashboardServer"
 ]
 
 from . import load_events
@@ -79,6 +95,9 @@ from . import experiment
 from . import create_report
 from . import create_html
 from . import artifacts
+from . import compact
+from . import catalog
+from . import dashboard
 
 
 from .load_events import *
@@ -91,4 +110,7 @@ from .visualize import *
 from .experiment import *
 from .create_report import *
 from .create_html import *
-from .artifacts import *
\ No newline at end of file
+from .artifacts import *
+from .compact import *
+from .catalog import *
+from .dashboard import *
\ No newline at end of file
@@ -1,12 +1,19 @@
+import os
+import json
+import hashlib
+import threading
 import pandas as pd
-from typing import Union, Optional
+from typing import Any, Callable, Dict, List, Union, Optional
 from langgraph.graph.state import CompiledStateGraph
 
 from .experiment import ExperimentPaths
+from .catalog import _update_catalog, _now
 from .sql_to_jsons import export_sqlite_to_jsons
 from .jsons_to_csv import  GraphConfig, export_jsons_to_csv
-from .create_report import generate_reports
-from .visualize import generate_visualizations
+from .create_report import (_analyze_event_log, _write_report, _write_sequences_report, _write_case_table,
+                            _validate_sequence_cutoffs)
+from .visualize import (generate_mermaid, generate_prefix_tree, generate_performance_dfg, _graph_structure_hash,
+                        _run_visualizations)
 
 def prepare_data(
     source: Union[ExperimentPaths, str],
@@ -63,14 +70,100 @@ def prepare_data(
     json_source = source if isinstance(source, ExperimentPaths) else output_folder
     export_jsons_to_csv(json_source, graph_config, output_csv_dir)
 
+    if isinstance(source, ExperimentPaths):
+        _update_catalog(source, data_updated=_now())
+
+ARTIFACT_CACHE_FILENAME = "artifact_cache.json"
+
+
+def _hash_event_log(event_log: pd.DataFrame) -> str:
+    """
+    Content hash of an event log - equal for equal column names and values, regardless of the object identity.
+
+    :param event_log: Event log data
+    :type event_log: pd.DataFrame
+    :return: SHA-256 hex digest
+    :rtype: str
+    """
+    digest = hashlib.sha256()
+    digest.update(json.dumps([str(column) for column in event_log.columns]).encode())
+    digest.update(pd.util.hash_pandas_object(event_log, index=True).values.tobytes())
+    return digest.hexdigest()
+
+
+class _ArtifactCache:
+    """
+    Input hashes of the artifacts generated by the last run of :func:`generate_artifacts`.
+
+    A stage is a hit when its input hash didn't change and all of its output files still exist.
+    """
+
+    def __init__(self, cache_file: str, force: bool = False):
+        self.cache_file = cache_file
+        self.force = force
+        self.hits: List[str] = []
+        self.misses: List[str] = []
+        self.entries: Dict[str, str] = {}
+        # Stages may run concurrently - see the parallel mode of generate_artifacts
+        self.lock = threading.Lock()
+        if os.path.exists(cache_file):
+            with open(cache_file) as file:
+                self.entries = json.load(file)
+
+    def run(self, stage: str, key: str, outputs: List[str], func: Callable[[], None]) -> None:
+        """
+        Run a stage unless its outputs are up to date, then record its input hash.
+
+        :param stage: Name of the stage
+        :type stage: str
+        :param key: Hash of the stage inputs
+        :type key: str
+        :param outputs: Files written by the stage
+        :type outputs: List[str]
+        :param func: Function generating the outputs
+        :type func: Callable[[], None]
+        """
+        if not self.force and self.entries.get(stage) == key and all(os.path.exists(path) for path in outputs):
+            self.hits.append(stage)
+            print(f"Cache hit: {stage} (inputs unchanged, skipped)")
+            return
+
+        self.misses.append(stage)
+        print(f"Cache miss: {stage}")
+        func()
+
+        # Saved after every stage, so a failing stage doesn't invalidate the ones generated before it
+        with self.lock:
+            self.entries[stage] = key
+            with open(self.cache_file, "w") as file:
+                json.dump(self.entries, file, indent=4)
+
+
 def generate_artifacts(
     event_log: pd.DataFrame,
     graph: CompiledStateGraph,
-    output: Union[ExperimentPaths, str]
+    output: Union[ExperimentPaths, str],
+    force: bool = False,
+    mermaid_renderer: str = "api",
+    mermaid_cache_dir: Optional[str] = None,
+    image_format: str = "png",
+    case_table: bool = False,
+    sequences_top_k: Optional[int] = None,
+    sequences_min_probability: Optional[float] = None,
+    parallel: bool = False,
+    max_workers: Optional[int] = None,
+    dfg_percentile: Optional[int] = None,
+    prefix_tree_min_frequency: int = 1,
+    prefix_tree_max_depth: Optional[int] = None,
+    prefix_tree_top_k: Optional[int] = None
 ) -> None:
     """
     Generate all analysis artifacts including reports and visualizations.
-    Executes generate_reports followed by generate_visualizations.
+    Executes the steps of generate_reports followed by the steps of generate_visualizations.
+
+    Every step is cached by a hash of its inputs - the event log (and the graph structure for the mermaid graph).
+    Steps whose inputs didn't change since the last run and whose outputs still exist are skipped.
+    The hashes are stored in ``artifact_cache.json`` in the experiment folder (or in the output directory).
 
     :param event_log: Event log data containing process execution information
     :type event_log: pd.DataFrame
@@ -78,40 +171,159 @@ def generate_artifacts(
     :type graph: CompiledStateGraph
     :param output: ExperimentPaths instance or path to save the analysis outputs
     :type output: Union[ExperimentPaths, str]
+    :param force: If True, every step is regenerated regardless of the cache
+    :type force: bool
+    :param mermaid_renderer: Renderer of the mermaid graph, "api" or "local" - see :func:`generate_mermaid`
+    :type mermaid_renderer: str
+    :param mermaid_cache_dir: Directory with mermaid renders shared across experiments - see :func:`generate_mermaid`
+    :type mermaid_cache_dir: Optional[str]
+    :param image_format: Format of every visualization, "png" or "svg"
+    :type image_format: str
+    :param case_table: If True, the per-case table is saved next to the metrics report - see
+                       :func:`write_metrics_report`
+    :type case_table: bool
+    :param sequences_top_k: Maximum number of sequences in the sequences report - see :func:`write_sequences_report`
+    :type sequences_top_k: Optional[int]
+    :param sequences_min_probability: Minimum probability of a sequence in the sequences report -
+                                      see :func:`write_sequences_report`
+    :type sequences_min_probability: Optional[float]
+    :param parallel: If True, the visualizations are generated concurrently - see :func:`generate_visualizations`
+                     for what overlaps
+    :type parallel: bool
+    :param max_workers: Maximum number of concurrent visualizations in parallel mode, defaults to one per visualization
+    :type max_workers: Optional[int]
+    :param dfg_percentile: Percentile of the durations to annotate the performance DFG with (e.g. 95),
+                           defaults to None (mean) - see :func:`generate_performance_dfg`
+    :type dfg_percentile: Optional[int]
+    :param prefix_tree_min_frequency: Minimum number of cases sharing a prefix of the prefix tree,
+                                      defaults to 1 (no pruning) - see :func:`generate_prefix_tree`
+    :type prefix_tree_min_frequency: int
+    :param prefix_tree_max_depth: Maximum depth of the prefix tree, defaults to None (unlimited)
+    :type prefix_tree_max_depth: Optional[int]
+    :param prefix_tree_top_k: Number of most frequent variants in the prefix tree, defaults to None (all variants)
+    :type prefix_tree_top_k: Optional[int]
 
     **Examples:**
 
     >>> # Using ExperimentPaths:
     >>> exp = create_experiment("my_experiment")
     >>> generate_artifacts(event_log,graph,exp)
+    Cache miss: metrics_report
     Metrics report successfully generated at: experiments/my_experiment/reports/metrics_report.json
+    Cache miss: sequences_report
     Sequences report successfully generated at: experiments/my_experiment/reports/sequences_report.json
     All reports successfully generated.
     Generating all visualizations...
+    Cache miss: mermaid
     Mermaid saved as: experiments/my_experiment/img/mermaid.png
+    Cache miss: prefix_tree
     Prefix Tree saved as: experiments/my_experiment/img/prefix_tree.png
+    Cache miss: dfg_performance
     Performance DFG saved as: experiments/my_experiment/img/dfg_performance.png
     All visualizations generated successfully!
+    Artifact cache: 0 hits, 5 misses
+    Analysis generation completed successfully!
+
+    >>> # Running again with the same event log and graph:
+    >>> generate_artifacts(event_log,graph,exp)
+    Cache hit: metrics_report (inputs unchanged, skipped)
+    Cache hit: sequences_report (inputs unchanged, skipped)
+    All reports successfully generated.
+    Generating all visualizations...
+    Cache hit: mermaid (inputs unchanged, skipped)
+    Cache hit: prefix_tree (inputs unchanged, skipped)
+    Cache hit: dfg_performance (inputs unchanged, skipped)
+    All visualizations generated successfully!
+    Artifact cache: 5 hits, 0 misses
     Analysis generation completed successfully!
 
     >>> # Using direct path:
-    >>> generate_artifacts(event_log,graph,"analysis_output")
-    Metrics report successfully generated at: analysis_output/reports/metrics_report.json
-    Sequences report successfully generated at: analysis_output/reports/sequences_report.json
+    >>> generate_artifacts(event_log,graph,"analysis_output", force=True)
+    Cache miss: metrics_report
+    Metrics report successfully generated at: analysis_output/metrics_report.json
+    Cache miss: sequences_report
+    Sequences report successfully generated at: analysis_output/sequences_report.json
     All reports successfully generated.
     Generating all visualizations...
-    Mermaid saved as: analysis_output/img/mermaid.png
-    Prefix Tree saved as: analysis_output/img/prefix_tree.png
-    Performance DFG saved as: analysis_output/img/dfg_performance.png
+    Cache miss: mermaid
+    Mermaid saved as: analysis_output/mermaid.png
+    Cache miss: prefix_tree
+    Prefix Tree saved as: analysis_output/prefix_tree.png
+    Cache miss: dfg_performance
+    Performance DFG saved as: analysis_output/dfg_performance.png
     All visualizations generated successfully!
+    Artifact cache: 0 hits, 5 misses
     Analysis generation completed successfully!
     """
+    _validate_sequence_cutoffs(sequences_top_k, sequences_min_probability)
+
+    if isinstance(output, ExperimentPaths):
+        report_dir, img_dir, cache_dir = output.reports_dir, output.img_dir, output.root
+    else:
+        report_dir = img_dir = cache_dir = output
+
+    cache = _ArtifactCache(os.path.join(cache_dir, ARTIFACT_CACHE_FILENAME), force)
+    log_hash = _hash_event_log(event_log)
+
+    # Both reports share one analysis of the event log, computed only if any of them has to be written
+    analysis: Dict[str, Any] = {}
+
+    def shared_analysis() -> Dict[str, Any]:
+        if not analysis:
+            analysis.update(_analyze_event_log(event_log))
+        return analysis
+
+    def write_report(section: str, filename: str, title: str) -> None:
+        output_file = _write_report(shared_analysis()[section], output, filename)
+        print(f"{title} report successfully generated at: {output_file}")
+
+    def write_sequences_report() -> None:
+        output_file = _write_sequences_report(shared_analysis()["sequences"], output,
+                                              sequences_top_k, sequences_min_probability)
+        print(f"Sequences report successfully generated at: {output_file}")
+
+    def write_case_table() -> None:
+        output_file = _write_case_table(shared_analysis()["cases"], output)
+        print(f"Case table successfully generated at: {output_file}")
+
     # Step 1: Generate reports
-    generate_reports(event_log, output)
+    cache.run("metrics_report", log_hash, [os.path.join(report_dir, "metrics_report.json")],
+              lambda: write_report("metrics", "metrics_report.json", "Metrics"))
+    if case_table:
+        cache.run("case_table", log_hash, [os.path.join(report_dir, "case_table.csv")], write_case_table)
+    cache.run("sequences_report", f"{sequences_top_k}:{sequences_min_probability}:{log_hash}",
+              [os.path.join(report_dir, "sequences_report.json")], write_sequences_report)
+    print("All reports successfully generated.")
 
     print()
 
     # Step 2: Generate visualizations
-    generate_visualizations(event_log, graph, output)
+    prefix_tree_limits = f"{prefix_tree_min_frequency}:{prefix_tree_max_depth}:{prefix_tree_top_k}"
+    dfg_outputs = [os.path.join(img_dir, f"dfg_performance.{image_format}")]
+    if dfg_percentile is not None:
+        dfg_outputs.append(os.path.join(report_dir, "dfg_percentiles.json"))
+
+    print("Generating all visualizations...")
+    _run_visualizations({
+        "mermaid": lambda: cache.run(
+            "mermaid", f"{mermaid_renderer}:{image_format}:{_graph_structure_hash(graph)}",
+            [os.path.join(img_dir, f"mermaid.{image_format}")],
+            lambda: generate_mermaid(graph, output, mermaid_renderer, mermaid_cache_dir, force, image_format)),
+        "prefix_tree": lambda: cache.run(
+            "prefix_tree", f"{image_format}:{prefix_tree_limits}:{log_hash}",
+            [os.path.join(img_dir, f"prefix_tree.{image_format}")],
+            lambda: generate_prefix_tree(event_log, output, min_frequency=prefix_tree_min_frequency,
+                                         max_depth=prefix_tree_max_depth, top_k=prefix_tree_top_k,
+                                         image_format=image_format)),
+        "dfg_performance": lambda: cache.run(
+            "dfg_performance", f"{image_format}:{dfg_percentile}:{log_hash}", dfg_outputs,
+            lambda: generate_performance_dfg(event_log, output, image_format=image_format, percentile=dfg_percentile))
+    }, parallel, max_workers)
+    print("All visualizations generated successfully!")
+
+    print(f"Artifact cache: {len(cache.hits)} hits, {len(cache.misses)} misses")
+
+    if isinstance(output, ExperimentPaths):
+        _update_catalog(output, artifacts_updated=_now())
 
     print("Analysis generation completed successfully!")
\ No newline at end of file
@@ -0,0 +1,243 @@
+import os
+import json
+import tempfile
+import threading
+import time
+from contextlib import contextmanager
+from datetime import datetime, timezone
+from typing import Any, Dict, Iterator, Optional
+from .experiment import ExperimentPaths
+
+try:
+    import fcntl
+except ImportError:
+    # Windows
+    fcntl = None
+    import msvcrt
+
+CATALOG_FILENAME = "catalog.json"
+
+# Serializes read-modify-write cycles of the catalog within a process - the lock file serializes them across processes
+_catalog_lock = threading.Lock()
+
+# Delay between attempts to take the lock file on Windows, doubled after every failed attempt up to the maximum
+_LOCK_RETRY_DELAY = 0.01
+_LOCK_MAX_RETRY_DELAY = 0.5
+
+
+def _catalog_path(base_dir: str) -> str:
+    """Path of the catalog file of a base directory."""
+    return os.path.join(base_dir, CATALOG_FILENAME)
+
+
+@contextmanager
+def _locked_catalog(base_dir: str) -> Iterator[None]:
+    """
+    Hold the catalog lock of a base directory - within this process and, through an exclusive lock
+    on ``catalog.json.lock``, across all processes updating the catalog.
+
+    :param base_dir: Base directory of the catalog
+    :type base_dir: str
+    """
+    os.makedirs(base_dir, exist_ok=True)
+    with _catalog_lock, open(f"{_catalog_path(base_dir)}.lock", "a+") as lock_file:
+        if fcntl is not None:
+            fcntl.flock(lock_file, fcntl.LOCK_EX)
+        else:
+            lock_file.seek(0)
+            # msvcrt has no blocking lock without a timeout - retry a non-blocking one, backing off between attempts
+            delay = _LOCK_RETRY_DELAY
+            while True:
+                try:
+                    msvcrt.locking(lock_file.fileno(), msvcrt.LK_NBLCK, 1)
+                    break
+                except OSError:
+                    time.sleep(delay)
+                    delay = min(delay * 2, _LOCK_MAX_RETRY_DELAY)
+        try:
+            yield
+        finally:
+            if fcntl is not None:
+                fcntl.flock(lock_file, fcntl.LOCK_UN)
+            else:
+                lock_file.seek(0)
+                msvcrt.locking(lock_file.fileno(), msvcrt.LK_UNLCK, 1)
+
+
+def _now() -> str:
+    """Current time as an ISO 8601 string in UTC."""
+    return datetime.now(timezone.utc).isoformat()
+
+
+def _file_times(directory: str, extensions: tuple) -> Dict[str, str]:
+    """
+    Map names of the files with given extensions in a directory to their modification times.
+
+    :param directory: Directory to list
+    :type directory: str
+    :param extensions: File extensions to include
+    :type extensions: tuple
+    :return: File names mapped to ISO 8601 modification times
+    :rtype: Dict[str, str]
+    """
+    if not os.path.isdir(directory):
+        return {}
+    return {
+        entry.name: datetime.fromtimestamp(entry.stat().st_mtime, timezone.utc).isoformat()
+        for entry in sorted(os.scandir(directory), key=lambda e: e.name)
+        if entry.is_file() and entry.name.endswith(extensions)
+    }
+
+
+def _describe_experiment(paths: ExperimentPaths) -> Dict[str, Any]:
+    """
+    Collect sizes, case count and artifacts of a single experiment. Only the experiment's own folders are read.
+
+    :param paths: Experiment to describe
+    :type paths: ExperimentPaths
+    :return: Catalog fields describing the experiment
+    :rtype: Dict[str, Any]
+    """
+    db_size = 0
+    for database in paths.databases:
+        for path in (database, f"{database}-wal"):
+            if os.path.exists(path):
+                db_size += os.path.getsize(path)
+
+    json_files = os.listdir(paths.json_dir) if os.path.isdir(paths.json_dir) else []
+
+    return {
+        "path": paths.root,
+        "databases": len(paths.databases),
+        "db_size": db_size,
+        "case_count": sum(1 for name in json_files if name.startswith("thread_") and name.endswith(".json")),
+        "reports": _file_times(paths.reports_dir, (".json",)),
+        "images": _file_times(paths.img_dir, (".png", ".svg"))
+    }
+
+
+def _rebuild_catalog(base_dir: str) -> Dict[str, Dict[str, Any]]:
+    """
+    Rebuild the catalog of a base directory from its experiment folders (the ones with a ``db`` subfolder).
+    Timestamps of the pipeline stages can't be recovered.
+
+    :param base_dir: Base directory where all experiments are stored
+    :type base_dir: str
+    :return: Experiment names mapped to their catalog entries
+    :rtype: Dict[str, Dict[str, Any]]
+    """
+    catalog = {}
+    for entry in sorted(os.scandir(base_dir), key=lambda e: e.name):
+        if entry.is_dir() and os.path.isdir(os.path.join(entry.path, "db")):
+            catalog[entry.name] = {"name": entry.name, **_describe_experiment(ExperimentPaths(entry.name, base_dir))}
+    return catalog
+
+
+def _read_catalog(base_dir: str) -> Dict[str, Dict[str, Any]]:
+    """
+    Read the catalog of a base directory, returning an empty one if it doesn't exist yet.
+    A corrupt catalog is reported and rebuilt from the experiment folders.
+    """
+    catalog_path = _catalog_path(base_dir)
+    if not os.path.exists(catalog_path):
+        return {}
+    try:
+        with open(catalog_path) as file:
+            catalog = json.load(file)
+        if not isinstance(catalog, dict):
+            raise ValueError("not a mapping of experiments")
+    except (OSError, ValueError) as e:
+        print(f"Warning: catalog {catalog_path} can't be read ({e}), rebuilding it from the experiment folders")
+        return _rebuild_catalog(base_dir)
+    return catalog
+
+
+def _update_catalog(paths: ExperimentPaths, **fields: Any) -> None:
+    """
+    Refresh the catalog entry of an experiment and set the given fields on it.
+
+    :param paths: Experiment to update the entry of
+    :type paths: ExperimentPaths
+    :param fields: Additional fields to set on the entry (e.g. timestamps of pipeline stages)
+    """
+    with _locked_catalog(paths.base_dir):
+        catalog = _read_catalog(paths.base_dir)
+        entry = catalog.get(paths.name, {"name": paths.name})
+        entry.update(_describe_experiment(paths))
+        entry.update(fields)
+        entry["updated"] = _now()
+        catalog[paths.name] = entry
+
+        # Write to a temporary file first, so readers never see a partial catalog
+        # (unique per writer, so a writer never replaces the catalog with another writer's file)
+        with tempfile.NamedTemporaryFile("w", dir=paths.base_dir, prefix=f"{CATALOG_FILENAME}.", suffix=".tmp",
+                                         delete=False) as file:
+            json.dump(catalog, file, indent=4)
+        os.replace(file.name, _catalog_path(paths.base_dir))
+
+
+def get_experiments(base_dir: str = "experiments") -> Dict[str, Dict[str, Any]]:
+    """
+    Return all experiments of a base directory from its catalog, without scanning experiment folders.
+
+    Every entry contains the experiment's path, number and total size of its databases, number of exported cases,
+    report and image modification times, timestamps of the pipeline stages (``created``, ``data_updated``,
+    ``artifacts_updated``) and ``stale`` - True when the data was prepared after the artifacts were generated.
+
+    :param base_dir: Base directory where all experiments are stored, defaults to "experiments".
+    :type base_dir: str
+    :return: Experiment names mapped to their catalog entries.
+    :rtype: Dict[str, Dict[str, Any]]
+
+    **Example:**
+
+    >>> experiments = get_experiments()
+    >>> experiments["main"]["case_count"]
+    5
+    """
+    catalog = _read_catalog(base_dir)
+    for entry in catalog.values():
+        data_updated: Optional[str] = entry.get("data_updated")
+        artifacts_updated: Optional[str] = entry.get("artifacts_updated")
+        entry["stale"] = bool(data_updated) and (not artifacts_updated or artifacts_updated < data_updated)
+    return catalog
+
+
+def print_experiments(base_dir: str = "experiments") -> None:
+    """
+    Print all experiments of a base directory from its catalog.
+
+    :param base_dir: Base directory where all experiments are stored, defaults to "experiments".
+    :type base_dir: str
+
+    **Example:**
+
+    >>> print_experiments()
+    Experiment: main, cases: 5, database size: 1,437,696 bytes, reports: 2, images: 3
+    Experiment: other, cases: 10, database size: 2,875,392 bytes, reports: 2, images: 3 (artifacts outdated)
+    """
+    experiments = get_experiments(base_dir)
+    if not experiments:
+        print(f"No experiments cataloged in: {base_dir}")
+        return
+
+    for name, entry in experiments.items():
+        stale = " (artifacts outdated)" if entry["stale"] else ""
+        print(f"Experiment: {name}, cases: {entry.get('case_count', 0)}, "
+              f"database size: {entry.get('db_size', 0):,} bytes, reports: {len(entry.get('reports', {}))}, "
+              f"images: {len(entry.get('images', {}))}{stale}")
+
+
+def _resolve_experiment_path(name: str, base_dir: str) -> Optional[str]:
+    """
+    Look up the folder of an experiment in the catalog.
+
+    :param name: Name of the experiment
+    :type name: str
+    :param base_dir: Base directory of the catalog
+    :type base_dir: str
+    :return: Path to the experiment folder, or None if the experiment isn't cataloged
+    :rtype: Optional[str]
+    """
+    entry = _read_catalog(base_dir).get(name)
+    return entry.get("path") if entry else None
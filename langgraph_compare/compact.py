@@ -0,0 +1,301 @@
+import os
+import gzip
+import sqlite3
+import msgpack
+from typing import Dict, List, Optional, Set, Union
+from langgraph.checkpoint.sqlite import SqliteSaver
+from langgraph.graph.state import CompiledStateGraph
+from .experiment import ExperimentPaths, _connect, _shard_databases
+
+# Checkpoint fields kept after compaction - `ts` is all the event log needs from the checkpoint itself,
+# the remaining fields keep the stripped checkpoint loadable by LangGraph (with empty state).
+_KEPT_CHECKPOINT_FIELDS = ("v", "id", "ts")
+_EMPTY_CHECKPOINT_FIELDS = {
+    "channel_values": {},
+    "channel_versions": {},
+    "versions_seen": {},
+    "pending_sends": []
+}
+
+
+def _exported_thread_ids(json_dir: str) -> Set[str]:
+    """
+    Collect IDs of the threads exported to JSON by :func:`export_sqlite_to_jsons`.
+
+    :param json_dir: Directory with the exported thread_<id>.json files
+    :type json_dir: str
+    :return: Exported thread IDs
+    :rtype: Set[str]
+    """
+    if not os.path.isdir(json_dir):
+        return set()
+    return {
+        filename[len("thread_"):-len(".json")]
+        for filename in os.listdir(json_dir)
+        if filename.startswith("thread_") and filename.endswith(".json")
+    }
+
+
+# Channels that schedule a node which may not have run yet - the graph input, start edges and conditional edges
+_TRIGGER_CHANNEL_PREFIXES = ("__start__", "start:", "branch:")
+
+
+def _has_scheduled_nodes(blob: bytes) -> bool:
+    """
+    Check from the stored channel versions whether a checkpoint still has nodes to run, without the graph.
+
+    A node is scheduled when a channel holding a value was updated after the node last saw it,
+    or when a start or conditional edge channel holds a value no node has seen yet.
+    Without the graph, a thread stopped right before the first run of a node reached by a plain edge
+    (e.g. with ``interrupt_before``) looks finished - pass the graph to tell them apart.
+    Checkpoints that can't be decoded are treated as scheduled, so they are never compacted.
+
+    :param blob: Checkpoint as stored by SqliteSaver
+    :type blob: bytes
+    :return: True if any node may still be scheduled
+    :rtype: bool
+    """
+    try:
+        checkpoint = msgpack.loads(blob)
+    except Exception:
+        return True
+    if not isinstance(checkpoint, dict):
+        return True
+    if checkpoint.get("pending_sends"):
+        return True
+
+    versions = checkpoint.get("channel_versions", {})
+    versions_seen = checkpoint.get("versions_seen", {})
+    for channel in checkpoint.get("channel_values", {}):
+        if channel not in versions:
+            continue
+        seen = [node_seen[channel] for node_seen in versions_seen.values() if channel in node_seen]
+        try:
+            if any(version < versions[channel] for version in seen):
+                return True
+        except TypeError:
+            return True
+        if not seen and channel.startswith(_TRIGGER_CHANNEL_PREFIXES):
+            return True
+    return False
+
+
+def _finished_thread_ids(conn: sqlite3.Connection, ids: List[str],
+                         graph: Optional[CompiledStateGraph] = None) -> List[str]:
+    """
+    Select the threads of a database whose run has finished - the latest checkpoint has no pending writes
+    and no nodes left to run. Interrupted, failed and still running threads keep their state,
+    so they can be continued.
+
+    :param conn: Connection to the database
+    :type conn: sqlite3.Connection
+    :param ids: Candidate thread IDs
+    :type ids: List[str]
+    :param graph: Graph the threads were run with - if given, its next nodes decide instead of the channel versions
+    :type graph: Optional[CompiledStateGraph]
+    :return: Finished thread IDs stored in the database
+    :rtype: List[str]
+    """
+    bound_graph = graph.copy(update={"checkpointer": SqliteSaver(conn)}) if graph is not None else None
+
+    finished = []
+    for thread_id in ids:
+        latest = conn.execute(
+            "SELECT checkpoint_id, checkpoint FROM checkpoints WHERE thread_id = ? AND checkpoint_ns = '' "
+            "ORDER BY checkpoint_id DESC LIMIT 1", (thread_id,)
+        ).fetchone()
+        if latest is None:
+            continue
+        pending_writes = conn.execute(
+            "SELECT 1 FROM writes WHERE thread_id = ? AND checkpoint_ns = '' AND checkpoint_id = ? LIMIT 1",
+            (thread_id, latest[0])
+        ).fetchone()
+        if pending_writes is not None:
+            continue
+
+        if bound_graph is not None:
+            scheduled = bool(bound_graph.get_state({"configurable": {"thread_id": thread_id}}).next)
+        else:
+            scheduled = _has_scheduled_nodes(latest[1])
+        if not scheduled:
+            finished.append(thread_id)
+    return finished
+
+
+def _archive_path(database: str) -> str:
+    """
+    Path of the compressed archive of a database - ``name.sqlite`` is archived to ``name.archive.msgpack.gz``.
+    """
+    stem, _ = os.path.splitext(database)
+    return f"{stem}.archive.msgpack.gz"
+
+
+def _strip_checkpoint(blob: bytes) -> Optional[bytes]:
+    """
+    Strip the state snapshot from a msgpack encoded checkpoint.
+
+    :param blob: Checkpoint as stored by SqliteSaver
+    :type blob: bytes
+    :return: Compacted checkpoint, or None if the checkpoint is already compact or can't be decoded
+    :rtype: Optional[bytes]
+    """
+    try:
+        checkpoint = msgpack.loads(blob)
+    except Exception:
+        return None
+    if not isinstance(checkpoint, dict):
+        return None
+
+    compacted = {key: checkpoint[key] for key in _KEPT_CHECKPOINT_FIELDS if key in checkpoint}
+    compacted.update(_EMPTY_CHECKPOINT_FIELDS)
+    if checkpoint == compacted:
+        return None
+    return msgpack.packb(compacted, use_bin_type=True)
+
+
+# Thread IDs are bound as query parameters in batches, staying below SQLite's host parameter limit
+_THREAD_BATCH_SIZE = 500
+
+
+def _compact_threads(conn: sqlite3.Connection, database: str, ids: List[str], archive: bool) -> Dict[str, int]:
+    """
+    Compact the checkpoints of a batch of threads in a single database.
+
+    :return: Number of compacted checkpoints and removed pending writes
+    :rtype: Dict[str, int]
+    """
+    placeholders = ",".join("?" * len(ids))
+
+    checkpoint_rows = conn.execute(
+        f"SELECT * FROM checkpoints WHERE thread_id IN ({placeholders})", ids
+    ).fetchall()
+    write_rows = conn.execute(
+        f"SELECT * FROM writes WHERE thread_id IN ({placeholders})", ids
+    ).fetchall()
+
+    updates = []
+    for row in checkpoint_rows:
+        # thread_id, checkpoint_ns, checkpoint_id, parent_checkpoint_id, type, checkpoint, metadata
+        compacted = _strip_checkpoint(row[5])
+        if compacted is not None:
+            updates.append((compacted, row[0], row[1], row[2]))
+
+    if not updates and not write_rows:
+        return {"checkpoints": 0, "writes": 0}
+
+    if archive:
+        # Every gzip member holds msgpack encoded [table, row] records - appending a member keeps earlier archives
+        with gzip.open(_archive_path(database), "ab") as archive_file:
+            packer = msgpack.Packer(use_bin_type=True)
+            for row in checkpoint_rows:
+                archive_file.write(packer.pack(["checkpoints", list(row)]))
+            for row in write_rows:
+                archive_file.write(packer.pack(["writes", list(row)]))
+
+    with conn:
+        conn.executemany(
+            "UPDATE checkpoints SET checkpoint = ? WHERE thread_id = ? AND checkpoint_ns = ? AND checkpoint_id = ?",
+            updates
+        )
+        # Pending writes are only needed to resume an unfinished step
+        conn.execute(f"DELETE FROM writes WHERE thread_id IN ({placeholders})", ids)
+
+    return {"checkpoints": len(updates), "writes": len(write_rows)}
+
+
+def compact_database(
+        source: Union[ExperimentPaths, str],
+        json_dir: Optional[str] = None,
+        archive: bool = False,
+        thread_ids: Optional[List[str]] = None,
+        graph: Optional[CompiledStateGraph] = None
+) -> Dict[str, int]:
+    """
+    Reclaim disk space of the checkpoint database after the data was exported.
+
+    Every superstep stores a full state snapshot, but after the export only the checkpoint timestamps
+    and metadata are needed to rebuild the event log. For every finished thread the state snapshot is stripped
+    from its checkpoints (keeping `v`, `id`, `ts` and the metadata), its pending writes are removed,
+    and the database is VACUUMed. Shard databases are compacted as well.
+
+    Only threads already exported to JSON by :func:`export_sqlite_to_jsons` (or the given `thread_ids`) are candidates,
+    and of those only the finished ones are compacted - their latest checkpoint has no pending writes and no nodes
+    left to run. Interrupted, failed and still running threads keep their state, so they can be resumed.
+    Failed runs always leave pending writes. Whether nodes are left to run is decided by the graph if it's given,
+    otherwise by the channel versions stored in the checkpoint - pass the graph if runs may have been interrupted.
+
+    :param source: Either an ExperimentPaths instance or a path to the SQLite database
+    :type source: Union[ExperimentPaths, str]
+    :param json_dir: Directory with the exported JSON files (required if source is a str and thread_ids is None)
+    :type json_dir: Optional[str]
+    :param archive: If True, the original rows are appended to a gzip compressed msgpack archive
+                    (``name.archive.msgpack.gz`` next to every database) before they are stripped.
+    :type archive: bool
+    :param thread_ids: Explicit list of thread IDs to compact, instead of the exported ones.
+    :type thread_ids: Optional[List[str]]
+    :param graph: Graph the threads were run with - used to check that no nodes are left to run.
+    :type graph: Optional[CompiledStateGraph]
+    :return: Number of compacted checkpoints, removed pending writes and database sizes in bytes before and after
+    :rtype: Dict[str, int]
+    :raises ValueError: If neither json_dir nor thread_ids is provided for a database path
+
+    **Examples:**
+
+    >>> # Using ExperimentPaths:
+    >>> exp = create_experiment("my_experiment")
+    >>> prepare_data(exp, graph_config)
+    >>> compact_database(exp, archive=True)
+    Compacted experiments/my_experiment/db/my_experiment.sqlite: 149 checkpoints, 284 writes, 5,320,704 -> 348,160 bytes
+
+    >>> # Using direct paths:
+    >>> compact_database("path/to/db.sqlite", "path/to/json_output")
+    Compacted path/to/db.sqlite: 149 checkpoints, 284 writes, 5,320,704 -> 348,160 bytes
+    """
+    if isinstance(source, ExperimentPaths):
+        databases = source.databases
+        json_dir = json_dir if json_dir is not None else source.json_dir
+        connection_profile = source.connection_profile
+    else:
+        databases = ([source] if os.path.exists(source) else []) + _shard_databases(source)
+        connection_profile = "default"
+        if json_dir is None and thread_ids is None:
+            raise ValueError("json_dir or thread_ids must be provided when using a database path directly")
+
+    ids = set(thread_ids) if thread_ids is not None else _exported_thread_ids(json_dir)
+
+    totals = {"checkpoints": 0, "writes": 0, "bytes_before": 0, "bytes_after": 0}
+    for database in databases:
+        size_before = os.path.getsize(database)
+
+        # The experiment's own writer connection is reused, so compaction doesn't wait for its lock
+        if isinstance(source, ExperimentPaths) and database == source.database:
+            conn, owned = source.connection, False
+        else:
+            conn, owned = _connect(database, connection_profile), True
+
+        try:
+            result = {"checkpoints": 0, "writes": 0}
+            sorted_ids = _finished_thread_ids(conn, sorted(ids), graph)
+            for start in range(0, len(sorted_ids), _THREAD_BATCH_SIZE):
+                batch = _compact_threads(conn, database, sorted_ids[start:start + _THREAD_BATCH_SIZE], archive)
+                result["checkpoints"] += batch["checkpoints"]
+                result["writes"] += batch["writes"]
+
+            if result["checkpoints"] or result["writes"]:
+                conn.execute("VACUUM")
+                # In WAL mode the rewritten pages land in the -wal file first - move them into the database
+                conn.execute("PRAGMA wal_checkpoint(TRUNCATE)")
+        finally:
+            if owned:
+                conn.close()
+
+        size_after = os.path.getsize(database)
+        totals["checkpoints"] += result["checkpoints"]
+        totals["writes"] += result["writes"]
+        totals["bytes_before"] += size_before
+        totals["bytes_after"] += size_after
+
+        print(f"Compacted {database}: {result['checkpoints']} checkpoints, {result['writes']} writes, "
+              f"{size_before:,} -> {size_after:,} bytes")
+
+    return totals
@@ -1,10 +1,17 @@
+import re
 import json
+import shutil
+import hashlib
+import tempfile
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 import base64
+from urllib.parse import quote
 import jinja2
 from typing import Any, Dict, List, Optional, Union
 import webbrowser
 from dataclasses import dataclass
+from .catalog import _resolve_experiment_path
 
 
 @dataclass
@@ -22,6 +29,110 @@ class InfrastructureDirs:
         )
 
 
+# Image formats embedded in the report, mapped to their MIME types
+IMAGE_TYPES = {
+    ".png": "image/png",
+    ".svg": "image/svg+xml"
+}
+
+
+def _image_data_uri(img_file: Path) -> str:
+    """
+    Encode an image as a data URI. SVGs are percent-encoded text, which is smaller than base64.
+
+    :param img_file: Path to a PNG or SVG image
+    :type img_file: Path
+    :return: Data URI of the image
+    :rtype: str
+    """
+    mime_type = IMAGE_TYPES[img_file.suffix]
+    if img_file.suffix == ".svg":
+        return f"data:{mime_type};charset=utf-8,{quote(img_file.read_text(encoding='utf-8'))}"
+    return f"data:{mime_type};base64,{base64.b64encode(img_file.read_bytes()).decode('utf-8')}"
+
+
+def _copy_image(img_file: Path, target_dir: Path) -> Path:
+    """
+    Copy an image into the assets directory of a report, skipping it if an identical copy already exists.
+
+    :param img_file: Path to the image
+    :type img_file: Path
+    :param target_dir: Directory to copy the image to
+    :type target_dir: Path
+    :return: Path to the copy
+    :rtype: Path
+    """
+    target = target_dir / img_file.name
+    source_stat = img_file.stat()
+    if target.exists():
+        target_stat = target.stat()
+        # copy2 keeps the modification time, so an unchanged image has the same size and mtime
+        if target_stat.st_size == source_stat.st_size and target_stat.st_mtime == source_stat.st_mtime:
+            return target
+    shutil.copy2(img_file, target)
+    return target
+
+
+def _compact_sequences(sequence_probabilities: List) -> Dict[str, List]:
+    """
+    Encode sequences compactly for client-side rendering - every activity name is stored once
+    and sequences reference activities by their index.
+
+    :param sequence_probabilities: Case ID of the last occurrence, sequence and probability of every sequence
+    :type sequence_probabilities: List
+    :return: Activity names ("activities") and [case ID, probability, activity indices] of every sequence
+             ("sequences")
+    :rtype: Dict[str, List]
+    """
+    activities: Dict[str, int] = {}
+    sequences = [
+        [case_id, probability, [activities.setdefault(activity, len(activities)) for activity in sequence]]
+        for case_id, sequence, probability in sequence_probabilities
+    ]
+    return {"activities": list(activities), "sequences": sequences}
+
+
+# Columns of the summary table: metric mapped to its header, how it's formatted
+# and whether lower values rank higher
+SUMMARY_COLUMNS = {
+    "avg_graph_duration": ("Avg duration", "time", True),
+    "p90_duration": ("P90 duration", "time", True),
+    "p99_duration": ("P99 duration", "time", True),
+    "rework_rate": ("Rework rate", "percent", True),
+    "reworks": ("Reworks", "count", True),
+    "sequences": ("Distinct sequences", "count", True),
+    "events": ("Events", "count", True),
+    "cases": ("Cases", "count", False)
+}
+
+
+def _summarize(report_data: Dict[str, Any], sequences_data: Optional[Dict[str, Any]]) -> Dict[str, Optional[float]]:
+    """
+    Compute the raw values of the summary table columns (see SUMMARY_COLUMNS) of an infrastructure.
+
+    :param report_data: Metrics report of the infrastructure
+    :type report_data: Dict[str, Any]
+    :param sequences_data: Sequences report of the infrastructure, if available
+    :type sequences_data: Optional[Dict[str, Any]]
+    :return: Metric values, None if the reports don't contain the metric
+    :rtype: Dict[str, Optional[float]]
+    """
+    case_distribution = report_data.get("case_duration_distribution", {})
+    events = sum(report_data.get("activities_count", {}).values())
+    reworks = sum(report_data.get("rework_counts", {}).values())
+    return {
+        "avg_graph_duration": report_data.get("avg_graph_duration"),
+        "p90_duration": case_distribution.get("p90"),
+        "p99_duration": case_distribution.get("p99"),
+        "rework_rate": reworks / events if events else None,
+        "reworks": reworks,
+        "sequences": sequences_data["distinct_sequences"] if sequences_data else None,
+        "events": events,
+        # Every case has exactly one start activity
+        "cases": sum(sequences_data["start_activities"].values()) if sequences_data else None
+    }
+
+
 class _MetricsFormatter:
     HTML_ARROW = " &rarr; "
 
@@ -45,6 +156,22 @@ class _MetricsFormatter:
         """Format count with a thousand separators."""
         return f"{value:,}"
 
+    @staticmethod
+    def format_distribution(distribution: Dict[str, float]) -> Dict[str, str]:
+        """Format every statistic of a duration distribution as time."""
+        return {stat: _MetricsFormatter.format_time(value) for stat, value in distribution.items()}
+
+    @staticmethod
+    def format_summary_value(kind: str, value: Optional[float]) -> str:
+        """Format a value of the summary table - see SUMMARY_COLUMNS."""
+        if value is None:
+            return "-"
+        if kind == "time":
+            return _MetricsFormatter.format_time(value)
+        if kind == "percent":
+            return f"{value * 100:.1f}%"
+        return _MetricsFormatter.format_count(value)
+
     @staticmethod
     # Format sequences into a more readable structure - connecting steps with arrows
     def format_sequences(sequences: Dict[str, list]) -> Dict[str, Any]:
@@ -94,13 +221,13 @@ class _MetricsFormatter:
 
     @staticmethod
     # Format rework counts into a more readable structure - how many times each activity was reworked (percentage)
-    def format_rework_counts(counts: Dict[str, int]) -> Union[str, Dict[str, str]]:
+    def format_rework_counts(counts: Dict[str, int],
+                             activities_count: Optional[Dict[str, int]] = None) -> Union[str, Dict[str, str]]:
         """Format rework counts with percentages of total activities."""
         if not counts:
             return "No reworks"
 
-        # Get activities count from context
-        activities_count = _MetricsFormatter._context.get('activities_count', {})
+        activities_count = activities_count or {}
 
         result = {}
         for activity, rework_count in counts.items():
@@ -114,8 +241,15 @@ class _MetricsFormatter:
         return result
 
     @staticmethod
-    def format_metric(key: str, value: Any) -> Any:
-        """Format a metric based on its key and value type."""
+    def format_metric(key: str, value: Any, context: Optional[Dict[str, Any]] = None) -> Any:
+        """
+        Format a metric based on its key and value type.
+
+        The context is the whole report the metric comes from - metrics formatted relative to other metrics
+        (e.g. reworks as a percentage of activity counts) read them from it. It is passed on every call,
+        so reports can be formatted concurrently.
+        """
+        context = context or {}
         # First check if it's a time metric
         if key in _MetricsFormatter.TIME_METRICS and isinstance(value, (int, float)):
             return _MetricsFormatter.format_time(value)
@@ -129,7 +263,14 @@ class _MetricsFormatter:
                                               for case, duration in v.items()},
                 "activities_mean_service_time": lambda v: {activity: _MetricsFormatter.format_time(duration)
                                                            for activity, duration in v.items()},
-                "rework_counts": _MetricsFormatter.format_rework_counts
+                "rework_counts": lambda v: _MetricsFormatter.format_rework_counts(
+                    v, context.get('activities_count', {})
+                ),
+                "activities_duration_distribution": lambda v: {
+                    activity: _MetricsFormatter.format_distribution(distribution)
+                    for activity, distribution in v.items()
+                },
+                "case_duration_distribution": _MetricsFormatter.format_distribution
             }
             return formatters.get(key, lambda x: x)(value)
         elif isinstance(value, list) and key == "sequences_with_probabilities":
@@ -137,24 +278,33 @@ class _MetricsFormatter:
 
         return value
 
-    # Class variable to store the context
-    _context = {}
-
-    @classmethod
-    def set_context(cls, report_data: Dict):
-        """Set the context for formatting metrics."""
-        cls._context = report_data
-
 
 class _ArchitectureComparisonReport:
     DEFAULT_EXPERIMENTS_DIR = "experiments"
     DEFAULT_REPORTS_DIR = "comparison_reports"
+    # Directory in the reports directory with the cached payloads of infrastructures
+    CACHE_DIR = ".cache"
+    # Number of sequences rendered at once when sequences are paginated
+    SEQUENCES_PAGE_SIZE = 25
+    # Version of the cached payloads - bumped when their structure changes
+    CACHE_VERSION = 2
+    # Layouts of the report - every infrastructure side by side, or a ranked summary with a page per infrastructure
+    LAYOUTS = ("columns", "summary")
+    # Reports comparing more infrastructures (or with longer names) are named by a hash of the names
+    MAX_NAMED_INFRASTRUCTURES = 5
+    MAX_FILENAME_LENGTH = 200
 
     def __init__(
             self,
             infrastructures: Dict[str, Union[str, InfrastructureDirs]],
             base_dir: Optional[str] = None,
-            output_dir: Optional[str] = None
+            output_dir: Optional[str] = None,
+            embed_images: bool = True,
+            force: bool = False,
+            max_workers: Optional[int] = None,
+            paginate_sequences: bool = False,
+            layout: str = "columns",
+            rank_by: str = "avg_graph_duration"
     ):
         """
         Initialize the report generator.
@@ -165,8 +315,27 @@ class _ArchitectureComparisonReport:
                            - InfrastructureDirs object (custom directories)
             base_dir: Optional base directory for relative paths
             output_dir: Optional output directory for reports
+            embed_images: Embed images as data URIs, or copy them next to the report and load them lazily
+            force: Reload every infrastructure, ignoring the cached payloads
+            max_workers: Maximum number of infrastructures loaded concurrently
+            paginate_sequences: Embed sequences as JSON and render them page by page in the browser,
+                                instead of rendering every sequence into the HTML
+            layout: "columns" to show all infrastructures side by side, or "summary" for a ranked summary table
+                    linking to a detail page of every infrastructure
+            rank_by: Summary table column the infrastructures are ranked by (see SUMMARY_COLUMNS)
         """
+        if layout not in self.LAYOUTS:
+            raise ValueError(f"Unknown layout: {layout}. Available layouts: {', '.join(self.LAYOUTS)}")
+        if rank_by not in SUMMARY_COLUMNS:
+            raise ValueError(f"Unknown summary column: {rank_by}. Available columns: {', '.join(SUMMARY_COLUMNS)}")
+
         self.base_dir = base_dir
+        self.embed_images = embed_images
+        self.force = force
+        self.max_workers = max_workers
+        self.paginate_sequences = paginate_sequences
+        self.layout = layout
+        self.rank_by = rank_by
         self.infrastructures = infrastructures
         # Allow custom output directory or use default
         self.report_dir = output_dir if output_dir else self.DEFAULT_REPORTS_DIR
@@ -184,10 +353,10 @@ class _ArchitectureComparisonReport:
                 # If it's just a name (no parent directory) and no base_dir was specified,
                 # assume it's under the experiments directory
                 if not Path(infra_path).parent.name and not self.base_dir:
-                    base_path = str(Path(self.DEFAULT_EXPERIMENTS_DIR) / infra_path)
+                    base_path = self._resolve_experiment(infra_path, self.DEFAULT_EXPERIMENTS_DIR)
                 # If base_dir was specified, use it
                 elif self.base_dir:
-                    base_path = str(Path(base_dir) / infra_path)
+                    base_path = self._resolve_experiment(infra_path, base_dir)
                 # Otherwise, use the path as-is
                 else:
                     base_path = infra_path
@@ -195,96 +364,292 @@ class _ArchitectureComparisonReport:
 
         # Storage for data from reports (JSON files)
         self.infrastructures_data = {}
-        # Storage for images data (base64 encoded)
+        # Storage for images data (data URIs, or URLs relative to the report)
         self.images_data = {}
+        # Storage for raw values of the summary table
+        self.summaries = {}
+        # Cache keys of the loaded infrastructures - detail pages are only regenerated when they change
+        self.cache_keys = {}
         # Formatter for metrics
         self.formatter = _MetricsFormatter()
 
+    @staticmethod
+    def _resolve_experiment(name: str, base_dir: str) -> str:
+        """Resolve an experiment folder from the catalog of base_dir, falling back to base_dir/name."""
+        return _resolve_experiment_path(name, base_dir) or str(Path(base_dir) / name)
+
     def generate_report_filename(self) -> str:
         """Generate a filename for the report based on compared infrastructures."""
         # Get infrastructure names without path
         infra_names = [Path(infra).name for infra in self.infrastructures]
         # Join with 'vs' and add .html extension
-        return f"{'_vs_'.join(infra_names)}.html"
+        filename = f"{'_vs_'.join(infra_names)}.html"
+
+        # Too many names for a readable summary, or too long for a valid file name
+        too_many = self.layout == "summary" and len(infra_names) > self.MAX_NAMED_INFRASTRUCTURES
+        if too_many or len(filename.encode()) > self.MAX_FILENAME_LENGTH:
+            digest = hashlib.sha256("\n".join(infra_names).encode()).hexdigest()[:12]
+            filename = f"comparison_{digest}.html"
+        return filename
+
+    def images_assets_dir(self) -> Path:
+        """Directory next to the report where linked (not embedded) images and detail pages are saved."""
+        return Path(self.report_dir) / f"{Path(self.generate_report_filename()).stem}_files"
+
+    @staticmethod
+    def _infra_folder(infra_name: str) -> str:
+        """
+        Name of an infrastructure usable in file names.
+
+        Sanitizing alone could map different names (e.g. ``a/b`` and ``a_b``) to the same folder,
+        so a short hash of the original name is appended.
+        """
+        sanitized = re.sub(r"[^\w.-]", "_", infra_name)
+        digest = hashlib.sha256(infra_name.encode()).hexdigest()[:8]
+        return f"{sanitized}_{digest}"
+
+    def load_images(self, infra_name: str, images_dir: str) -> Dict[str, str]:
+        """
+        Load the visualizations of an infrastructure, either as data URIs or as URLs relative to the report.
+
+        Images are sorted by name, so the report doesn't depend on the file system order.
+        If a visualization exists in both formats, the SVG (sorted after the PNG) is used.
+        """
+        img_files = [img_file for img_file in sorted(Path(images_dir).iterdir()) if img_file.suffix in IMAGE_TYPES]
+        if self.embed_images:
+            return {img_file.stem: _image_data_uri(img_file) for img_file in img_files}
+
+        # Every infrastructure gets its own folder, so images with the same name don't collide
+        folder = self._infra_folder(infra_name)
+        target_dir = self.images_assets_dir() / folder
+        target_dir.mkdir(parents=True, exist_ok=True)
+
+        images = {}
+        copied = set()
+        for img_file in img_files:
+            target = _copy_image(img_file, target_dir)
+            copied.add(target.name)
+            images[img_file.stem] = quote(f"{self.images_assets_dir().name}/{folder}/{target.name}")
+
+        # Remove images of visualizations that no longer exist
+        for stale_file in target_dir.iterdir():
+            if stale_file.name not in copied:
+                stale_file.unlink()
+        return images
+
+    def _cache_file(self, infra_name: str, dirs: InfrastructureDirs) -> Path:
+        """Cache file of the formatted payload of an infrastructure."""
+        source = json.dumps([infra_name, dirs.reports_dir, dirs.images_dir])
+        return Path(self.report_dir) / self.CACHE_DIR / f"{hashlib.sha256(source.encode()).hexdigest()}.json"
+
+    def _cache_key(self, dirs: InfrastructureDirs) -> Dict[str, List[int]]:
+        """
+        Modification times and sizes of the reports and images of an infrastructure (and whether images are
+        embedded) - the formatted payload is only rebuilt when any of them changes.
+        """
+        files = [Path(dirs.reports_dir) / "metrics_report.json", Path(dirs.reports_dir) / "sequences_report.json"]
+        if dirs.images_dir and Path(dirs.images_dir).exists():
+            files += [img_file for img_file in sorted(Path(dirs.images_dir).iterdir()) if img_file.suffix in IMAGE_TYPES]
+
+        key = {"version": [self.CACHE_VERSION], "embed_images": [int(self.embed_images)]}
+        for file in files:
+            if file.exists():
+                stat = file.stat()
+                key[str(file)] = [stat.st_mtime_ns, stat.st_size]
+        return key
+
+    def load_infrastructure(self, infra_name: str, dirs: InfrastructureDirs) -> Dict[str, Any]:
+        """
+        Load and format the reports and images of a single infrastructure.
+
+        :return: Formatted reports ("data"), images ("images") and raw values of the summary table ("summary")
+                 of the infrastructure
+        :rtype: Dict[str, Any]
+        :raises FileNotFoundError: If the metrics report doesn't exist
+        """
+        # Storage for data from reports (JSON files)
+        infrastructure_data = {}
+        # Storage for images data (data URIs or relative URLs)
+        images_data = {}
+
+        # Load metrics report data
+        metrics_path = Path(dirs.reports_dir) / "metrics_report.json"
+        try:
+            with open(metrics_path) as f:
+                report_data = json.load(f)
+                # Format the data as needed
+                infrastructure_data['main_report'] = {
+                    key: self.formatter.format_metric(key, value, report_data)
+                    for key, value in report_data.items()
+                }
+        except FileNotFoundError:
+            raise FileNotFoundError(f"Metrics report not found at {metrics_path}")
+
+        # Load sequences report data if available
+        sequences_path = Path(dirs.reports_dir) / "sequences_report.json"
+        if sequences_path.exists():
+            with open(sequences_path) as f:
+                sequences_data = json.load(f)
+                # Format the data as needed
+                # Get and sort sequence probabilities
+                sequence_probabilities = sequences_data.get('sequence_probabilities', [])
+                # Sort by probability in descending order
+                sorted_sequences = sorted(sequence_probabilities, key=lambda x: x[2], reverse=True)
+
+                formatted_sequences = {
+                    'start_activities': sequences_data.get('start_activities', {}),
+                    'end_activities': sequences_data.get('end_activities', {}),
+                    # Reports without the count list every sequence
+                    'distinct_sequences': sequences_data.get('distinct_sequences', len(sequence_probabilities)),
+                    'sequence_probabilities': sorted_sequences
+                }
+                # Save formatted sequences data
+                infrastructure_data['sequences_report'] = formatted_sequences
+
+        # Load images if directory is provided
+        if dirs.images_dir and Path(dirs.images_dir).exists():
+            images_data = self.load_images(infra_name, dirs.images_dir)
+
+        summary = _summarize(report_data, infrastructure_data.get('sequences_report'))
+        return {"data": infrastructure_data, "images": images_data, "summary": summary}
+
+    def load_cached_infrastructure(self, infra_name: str, dirs: InfrastructureDirs) -> Dict[str, Any]:
+        """
+        Load an infrastructure, reusing its formatted payload from the previous run if its reports
+        and images didn't change.
+
+        Linked images are always refreshed, as they are cheap to reference and the copies next to the report
+        may have been removed.
+        """
+        cache_file = self._cache_file(infra_name, dirs)
+        key = self._cache_key(dirs)
+        self.cache_keys[infra_name] = key
+
+        if not self.force and cache_file.exists():
+            with open(cache_file) as f:
+                cached = json.load(f)
+            if cached.get("key") == key:
+                print(f"Cache hit: {infra_name} (reports and images unchanged, skipped)")
+                payload = cached["payload"]
+                if not self.embed_images and dirs.images_dir and Path(dirs.images_dir).exists():
+                    payload["images"] = self.load_images(infra_name, dirs.images_dir)
+                return payload
+
+        print(f"Cache miss: {infra_name}")
+        payload = self.load_infrastructure(infra_name, dirs)
+
+        # Write to a temporary file first, so a concurrent run never reads a partial cache file
+        # (unique per writer, as comparisons sharing an infrastructure may be generated concurrently)
+        cache_file.parent.mkdir(parents=True, exist_ok=True)
+        with tempfile.NamedTemporaryFile('w', dir=cache_file.parent, suffix=".tmp", delete=False) as f:
+            json.dump({"key": key, "payload": payload}, f)
+        Path(f.name).replace(cache_file)
+        return payload
 
     def load_data(self):
-        for infra_name, dirs in self.infra_dirs.items():
-            # Storage for data from reports (JSON files)
-            self.infrastructures_data[infra_name] = {}
-            # Storage for images data (base64 encoded)
-            self.images_data[infra_name] = {}
-
-            # Load metrics report data
-            metrics_path = Path(dirs.reports_dir) / "metrics_report.json"
-            try:
-                with open(metrics_path) as f:
-                    report_data = json.load(f)
-                    # Format the data as needed
-                    _MetricsFormatter.set_context(report_data)
-                    self.infrastructures_data[infra_name]['main_report'] = {
-                        key: self.formatter.format_metric(key, value)
-                        for key, value in report_data.items()
-                    }
-            except FileNotFoundError:
-                raise FileNotFoundError(f"Metrics report not found at {metrics_path}")
-
-            # Load sequences report data if available
-            sequences_path = Path(dirs.reports_dir) / "sequences_report.json"
-            if sequences_path.exists():
-                with open(sequences_path) as f:
-                    sequences_data = json.load(f)
-                    # Format the data as needed
-                    # Get and sort sequence probabilities
-                    sequence_probabilities = sequences_data.get('sequence_probabilities', [])
-                    # Sort by probability in descending order
-                    sorted_sequences = sorted(sequence_probabilities, key=lambda x: x[2], reverse=True)
-
-                    formatted_sequences = {
-                        'start_activities': sequences_data.get('start_activities', {}),
-                        'end_activities': sequences_data.get('end_activities', {}),
-                        'sequence_probabilities': sorted_sequences
-                    }
-                    # Save formatted sequences data
-                    self.infrastructures_data[infra_name]['sequences_report'] = formatted_sequences
-
-            # Load images if directory is provided
-            if dirs.images_dir and Path(dirs.images_dir).exists():
-                for img_file in Path(dirs.images_dir).glob("*.png"):
-                    with open(img_file, 'rb') as f:
-                        # Encode image as base64 and store in dictionary
-                        self.images_data[infra_name][img_file.stem] = base64.b64encode(f.read()).decode('utf-8')
+        """Load all infrastructures concurrently, keeping the order in which they were given."""
+        with ThreadPoolExecutor(max_workers=self.max_workers) as executor:
+            futures = {
+                infra_name: executor.submit(self.load_cached_infrastructure, infra_name, dirs)
+                for infra_name, dirs in self.infra_dirs.items()
+            }
+            for infra_name, future in futures.items():
+                payload = future.result()
+                self.infrastructures_data[infra_name] = payload["data"]
+                self.images_data[infra_name] = payload["images"]
+                self.summaries[infra_name] = payload["summary"]
+
+    def render_comparison(self, infrastructures_data: Dict[str, Dict], images_data: Dict[str, Dict],
+                          **context: Any) -> str:
+        """Render the side by side comparison of the given infrastructures."""
+        return _render_comparison(infrastructures_data, images_data, lazy_images=not self.embed_images,
+                                  paginate_sequences=self.paginate_sequences, **context)
+
+    def generate_detail_pages(self, report_filename: str) -> Dict[str, str]:
+        """
+        Save a page with the full comparison data of every infrastructure next to the summary report.
+
+        Pages are only rendered again when the reports or images of their infrastructure (or the report options)
+        changed since they were generated - the fingerprints are kept in ``pages.json`` next to the pages.
+
+        :param report_filename: File name of the summary report the pages link back to
+        :type report_filename: str
+        :return: Infrastructure names mapped to URLs of their pages, relative to the summary report
+        :rtype: Dict[str, str]
+        """
+        pages_dir = self.images_assets_dir()
+        pages_dir.mkdir(parents=True, exist_ok=True)
+        manifest_path = pages_dir / "pages.json"
+        manifest = json.loads(manifest_path.read_text()) if manifest_path.exists() else {}
+
+        links = {}
+        generated = 0
+        for infra_name, data in self.infrastructures_data.items():
+            page = pages_dir / f"{self._infra_folder(infra_name)}.html"
+            links[infra_name] = quote(f"{pages_dir.name}/{page.name}")
+
+            options = [self.cache_keys.get(infra_name), self.embed_images, self.paginate_sequences]
+            fingerprint = hashlib.sha256(json.dumps(options, sort_keys=True).encode()).hexdigest()
+            if not self.force and manifest.get(infra_name) == fingerprint and page.exists():
+                continue
+
+            # Linked images are relative to the summary report, one level up from the pages
+            images = {
+                name: src if src.startswith("data:") else f"../{src}"
+                for name, src in self.images_data[infra_name].items()
+            }
+            html_content = self.render_comparison({infra_name: data}, {infra_name: images},
+                                                  title=infra_name, back_link=quote(f"../{report_filename}"))
+            with open(page, 'w', encoding='utf-8') as f:
+                f.write(html_content)
+            manifest[infra_name] = fingerprint
+            generated += 1
+
+        manifest_path.write_text(json.dumps(manifest, indent=4))
+        print(f"Detail pages: {generated} generated, {len(links) - generated} unchanged")
+        return links
+
+    def render_summary(self, links: Dict[str, str]) -> str:
+        """Render the summary table of all infrastructures, ranked by the rank_by column."""
+        _, _, ascending = SUMMARY_COLUMNS[self.rank_by]
+
+        # Infrastructures without the ranked metric are listed last
+        def rank(infra_name: str):
+            value = self.summaries[infra_name][self.rank_by]
+            return value is None, (value if ascending else -value) if value is not None else 0
+
+        rows = [
+            {
+                "name": infra_name,
+                "link": links[infra_name],
+                "cells": [
+                    (self.summaries[infra_name][column],
+                     self.formatter.format_summary_value(kind, self.summaries[infra_name][column]))
+                    for column, (_, kind, _) in SUMMARY_COLUMNS.items()
+                ]
+            }
+            for infra_name in sorted(self.summaries, key=rank)
+        ]
+
+        env = self.get_template().environment
+        return env.get_template("summary_report.html").render(
+            columns=[(column, header, ascending) for column, (header, _, ascending) in SUMMARY_COLUMNS.items()],
+            rank_by=self.rank_by,
+            rows=rows
+        )
 
     def generate_report(self, open_browser: bool = True):
         # Generate the report path using the configured directory and automatic filename
         report_filename = self.generate_report_filename()
         report_path = Path(self.report_dir) / report_filename
 
-        # Prepare metrics comparison data
-        first_infra = next(iter(self.infrastructures_data))
-        # Create a dictionary with metrics as keys and lists of values for each infrastructure
-        metrics_comparison = {
-            metric: [self.infrastructures_data[infra]['main_report'].get(metric)
-                     for infra in self.infrastructures_data]
-            for metric in self.infrastructures_data[first_infra]['main_report']
-        }
-
-        # Create a dictionary with sequences data for each infrastructure
-        sequences_data = {
-            infra: data.get('sequences_report', {})
-            for infra, data in self.infrastructures_data.items()
-        }
-
-        template = self.get_template()
-        # Render the template with the data
-        html_content = template.render(
-            infrastructures_data=self.infrastructures_data,
-            images_data=self.images_data,
-            metrics_comparison=metrics_comparison,
-            sequences_data=sequences_data
-        )
+        if self.layout == "summary":
+            html_content = self.render_summary(self.generate_detail_pages(report_filename))
+        else:
+            html_content = self.render_comparison(self.infrastructures_data, self.images_data)
 
         report_path.parent.mkdir(parents=True, exist_ok=True)
-        with open(report_path, 'w') as f:
+        with open(report_path, 'w', encoding='utf-8') as f:
             f.write(html_content)
 
         print(f"Report generated at {report_path}")
@@ -305,18 +670,77 @@ class _ArchitectureComparisonReport:
             loader=jinja2.FileSystemLoader(template_path.parent),
             autoescape=True
         )
+        # Data embedded with the tojson filter is kept compact
+        env.policies["json.dumps_kwargs"] = {"separators": (",", ":")}
 
         return env.get_template("comparison_report.html")
 
 
+def _render_comparison(infrastructures_data: Dict[str, Dict], images_data: Dict[str, Dict],
+                       lazy_images: bool = False, paginate_sequences: bool = False, **context: Any) -> str:
+    """
+    Render the side by side comparison page of infrastructures.
+
+    :param infrastructures_data: Formatted reports of every infrastructure ("main_report" and "sequences_report")
+    :type infrastructures_data: Dict[str, Dict]
+    :param images_data: Images of every infrastructure (data URIs or URLs relative to the page)
+    :type images_data: Dict[str, Dict]
+    :param lazy_images: Load the images lazily
+    :type lazy_images: bool
+    :param paginate_sequences: Render sequences page by page in the browser
+    :type paginate_sequences: bool
+    :param context: Additional template variables (e.g. ``title``, ``back_link``, ``refresh``)
+    :return: HTML of the page
+    :rtype: str
+    """
+    # Prepare metrics comparison data - metrics of all infrastructures, in the order they first appear
+    metrics = dict.fromkeys(metric for data in infrastructures_data.values() for metric in data['main_report'])
+    # Create a dictionary with metrics as keys and lists of values for each infrastructure
+    metrics_comparison = {
+        metric: [infrastructures_data[infra]['main_report'].get(metric)
+                 for infra in infrastructures_data]
+        for metric in metrics
+    }
+
+    # Create a dictionary with sequences data for each infrastructure
+    sequences_data = {
+        infra: data.get('sequences_report', {})
+        for infra, data in infrastructures_data.items()
+    }
+
+    template = _ArchitectureComparisonReport.get_template()
+    # Render the template with the data
+    return template.render(
+        infrastructures_data=infrastructures_data,
+        images_data=images_data,
+        lazy_images=lazy_images,
+        metrics_comparison=metrics_comparison,
+        sequences_data=sequences_data,
+        paginate_sequences=paginate_sequences,
+        sequences_page_size=_ArchitectureComparisonReport.SEQUENCES_PAGE_SIZE,
+        compact_sequences=[
+            _compact_sequences(data.get('sequence_probabilities', [])) for data in sequences_data.values()
+        ] if paginate_sequences else [],
+        **context
+    )
+
+
 def compare(
         infrastructures: Union[List[str], Dict[str, Union[str, InfrastructureDirs]]],
         base_dir: Optional[str] = None,
-        output_dir: Optional[str] = None
+        output_dir: Optional[str] = None,
+        embed_images: bool = True,
+        force: bool = False,
+        paginate_sequences: bool = False,
+        layout: str = "columns",
+        rank_by: str = "avg_graph_duration"
 ) -> None:
     """
     Generate and open HTML comparison report comparing multi-agent infrastructures.
 
+    The infrastructures are loaded concurrently, and the formatted data of every infrastructure is cached,
+    so regenerating a comparison after one experiment changed only reloads that experiment.
+
     :param infrastructures: List of infrastructure names or dictionary mapping names to paths. Can be:
                           - List of infrastructure names for default structure
                           - Dict mapping names to directory paths or InfrastructureDirs objects
@@ -325,6 +749,28 @@ def compare(
     :type base_dir: Optional[str]
     :param output_dir: Directory where generated reports will be saved, defaults to "comparison_reports"
     :type output_dir: Optional[str]
+    :param embed_images: If True (default), images are embedded in the report, making it a single self-contained file.
+                         If False, images are copied to a ``<report name>_files`` folder next to the report and loaded
+                         lazily via relative URLs - keeps reports comparing many architectures small.
+    :type embed_images: bool
+    :param force: If True, every infrastructure is reloaded. Otherwise, the formatted reports and images
+                  of infrastructures whose files didn't change since the last comparison are reused from
+                  the ``.cache`` folder of the output directory.
+    :type force: bool
+    :param paginate_sequences: If True, sequences are embedded as compact JSON and rendered in the browser
+                               page by page, with a search box - keeps the page fast for architectures
+                               with many distinct sequences. By default, every sequence is rendered into the HTML.
+    :type paginate_sequences: bool
+    :param layout: "columns" (default) shows every metric of all infrastructures side by side. "summary" scales
+                   to many infrastructures - the report is a table of key metrics with one row per infrastructure,
+                   ranked by rank_by and linking to a detail page of every infrastructure. Detail pages are saved
+                   to the ``<report name>_files`` folder and only regenerated when their infrastructure changed.
+    :type layout: str
+    :param rank_by: Column of the summary table the infrastructures are ranked by - one of "avg_graph_duration"
+                    (default), "p90_duration", "p99_duration", "rework_rate", "reworks", "sequences", "events"
+                    or "cases".
+    :type rank_by: str
+    :raises ValueError: If the layout or the rank_by column is unknown
 
     **Examples:**
 
@@ -355,11 +801,25 @@ def compare(
     Save to specific output directory::
 
         compare(infrastructures, output_dir="my_reports")
+
+    Link images instead of embedding them::
+
+        compare(["test_1", "test_2", "test_3"], embed_images=False)
+
+    Render sequences page by page::
+
+        compare(["test_1", "test_2"], paginate_sequences=True)
+
+    Rank many architectures by their rework rate::
+
+        compare([f"test_{i}" for i in range(20)], layout="summary", rank_by="rework_rate")
     """
     # Convert list to dict if necessary
     if isinstance(infrastructures, list):
         infrastructures = {infra: infra for infra in infrastructures}
 
-    report_generator = _ArchitectureComparisonReport(infrastructures, base_dir, output_dir)
+    report_generator = _ArchitectureComparisonReport(infrastructures, base_dir, output_dir, embed_images, force,
+                                                     paginate_sequences=paginate_sequences, layout=layout,
+                                                     rank_by=rank_by)
     report_generator.load_data()
     report_generator.generate_report()
\ No newline at end of file
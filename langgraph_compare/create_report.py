@@ -1,9 +1,9 @@
 import json
-from .analyze import (get_act_counts, get_global_act_reworks, get_mean_act_times, get_avg_duration,
-                                          get_starts, get_ends, get_sequence_probs)
+import heapq
+from collections import Counter
 from .experiment import ExperimentPaths
 import pandas as pd
-from typing import Union
+from typing import Any, Dict, Iterable, Iterator, Optional, Tuple, Union
 import os
 
 def _convert_keys_to_serializable(data):
@@ -29,41 +29,143 @@ def _validate_directory(directory_path: str) -> None:
         raise FileNotFoundError(f"Directory does not exist: {directory_path}")
 
 
-def write_metrics_report(event_log: pd.DataFrame, output_dir: Union[ExperimentPaths, str]) -> None:
+def _total_seconds(difference: pd.Series) -> pd.Series:
     """
-    Generate and save a comprehensive analysis report of the entire event log in JSON format.
+    Convert timedeltas to seconds with the same arithmetic as pm4py, so the reports match
+    the values returned by the functions in :mod:`analyze`.
+    """
+    return (86400 * difference.dt.days + difference.dt.seconds
+            + 10**-6 * difference.dt.microseconds + 10**-9 * difference.dt.nanoseconds)
 
-    The generated JSON report includes:
-        - Count of activities
-        - Rework counts per activity
-        - Mean service times per activity
-        - Average graph duration
 
-    :param event_log: Event log data containing process execution information
-    :type event_log: pd.DataFrame
-    :param output_dir: ExperimentPaths instance or directory path where the report will be saved
-    :type output_dir: Union[ExperimentPaths, str]
+# Percentiles of the duration distributions in the metrics report
+DISTRIBUTION_PERCENTILES = (50, 90, 99)
 
-    **Examples:**
 
-    >>> # Using ExperimentPaths:
-    >>> exp = create_experiment("my_experiment")
-    >>> write_metrics_report(event_log, exp)
-    Metrics report successfully generated at: experiments/my_experiment/reports/metrics_report.json
+def _distribution(durations: pd.Series) -> Dict[str, float]:
+    """
+    Summarize durations in seconds - min, percentiles, max and (population) standard deviation.
 
-    >>> # Using direct path:
-    >>> write_metrics_report(event_log, "analysis")
-    Metrics report successfully generated at: analysis/metrics_report.json
+    :param durations: Durations in seconds
+    :type durations: pd.Series
+    :return: Distribution statistics
+    :rtype: Dict[str, float]
+    """
+    quantiles = durations.quantile([p / 100 for p in DISTRIBUTION_PERCENTILES]).tolist()
+    return {
+        "min": float(durations.min()),
+        **{f"p{p}": float(value) for p, value in zip(DISTRIBUTION_PERCENTILES, quantiles)},
+        "max": float(durations.max()),
+        "stddev": float(durations.std(ddof=0))
+    }
+
+
+def _grouped_distributions(durations: pd.Series, keys: pd.Series) -> Dict[str, Dict[str, float]]:
+    """
+    Summarize durations of every group with vectorized groupby aggregations - see :func:`_distribution`.
+
+    :param durations: Durations in seconds
+    :type durations: pd.Series
+    :param keys: Group of every duration
+    :type keys: pd.Series
+    :return: Distribution statistics of every group
+    :rtype: Dict[str, Dict[str, float]]
+    """
+    grouped = durations.groupby(keys)
+    quantiles = grouped.quantile([p / 100 for p in DISTRIBUTION_PERCENTILES]).unstack()
+    table = pd.DataFrame({
+        "min": grouped.min(),
+        **{f"p{p}": quantiles[p / 100] for p in DISTRIBUTION_PERCENTILES},
+        "max": grouped.max(),
+        "stddev": grouped.std(ddof=0)
+    })
+    return {str(key): {stat: float(value) for stat, value in row.items()} for key, row in table.iterrows()}
+
+
+def _analyze_event_log(event_log: pd.DataFrame) -> Dict[str, Any]:
     """
-    event_log = event_log.copy()
+    Compute the data of both the metrics and the sequences report with shared, vectorized passes over the event log.
 
-    structured_data = {
-        "activities_count": get_act_counts(event_log),
-        "rework_counts": get_global_act_reworks(event_log),
-        "activities_mean_service_time": get_mean_act_times(event_log),
-        "avg_graph_duration": get_avg_duration(event_log)
+    The event log is neither copied nor modified. The values are the same as returned by
+    get_act_counts, get_global_act_reworks, get_mean_act_times, get_avg_duration, get_starts, get_ends
+    and get_sequence_probs from :mod:`analyze`.
+
+    :param event_log: Event log data containing process execution information
+    :type event_log: pd.DataFrame
+    :return: Data of the metrics report ("metrics"), of the sequences report ("sequences")
+             and the per-case table ("cases"). The sequence probabilities are not materialized -
+             they are generated from the variants by :func:`_iter_sequence_probabilities`.
+    :rtype: Dict[str, Any]
+    """
+    cases = event_log['case:concept:name']
+    activities = event_log['concept:name']
+
+    # Activity sequence of every case, in the order of the event log - shared by both reports
+    sequences = activities.groupby(cases, sort=False).agg(tuple)
+
+    # Reworks - every occurrence of an activity in a case after the first one
+    occurrences = event_log.groupby([cases, activities], sort=False).size()
+    reworks = (occurrences[occurrences > 1] - 1).groupby(level=1, sort=False).sum()
+
+    # Case duration - time between the first and the last event of the case
+    timestamps = event_log['time:timestamp'].groupby(cases, sort=False)
+    case_starts = timestamps.first()
+    case_duration_series = _total_seconds(timestamps.last() - case_starts)
+    case_durations = sorted(case_duration_series.tolist())
+
+    event_durations = _total_seconds(event_log['end_timestamp'] - event_log['timestamp'])
+    service_times = event_durations.groupby(activities).mean()
+
+    metrics = {
+        "activities_count": {activity: int(count) for activity, count in activities.value_counts().items()},
+        "rework_counts": {activity: int(count) for activity, count in reworks.items()},
+        "activities_mean_service_time": {activity: float(time) for activity, time in service_times.items()},
+        "avg_graph_duration": sum(case_durations) / len(case_durations),
+        "activities_duration_distribution": _grouped_distributions(event_durations, activities),
+        "case_duration_distribution": _distribution(case_duration_series)
     }
 
+    # Compact table with one row per case
+    case_table = pd.DataFrame({
+        "case_id": case_starts.index,
+        "events": sequences.str.len().to_numpy(),
+        "reworks": occurrences.sub(1).groupby(level=0, sort=False).sum().reindex(case_starts.index).to_numpy(),
+        "start": case_starts.to_numpy(),
+        "duration": case_duration_series.to_numpy()
+    })
+
+    # Variants with the ID of their last occurrence - inserted from the last case backwards, so the variants
+    # are in descending order of that ID and the sequence probabilities can be streamed without sorting them
+    last_occurrence: Dict[tuple, int] = {}
+    for case_id, sequence in sorted(sequences.items(), key=lambda item: int(item[0]), reverse=True):
+        last_occurrence.setdefault(sequence, int(case_id))
+
+    sequences_data = {
+        "start_activities": {activity: int(count) for activity, count in
+                             sequences.str[0].value_counts().items()},
+        "end_activities": {activity: int(count) for activity, count in
+                           sequences.str[-1].value_counts().items()},
+        "variant_counts": Counter(sequences.tolist()),
+        "last_occurrence": last_occurrence
+    }
+
+    return {"metrics": metrics, "sequences": sequences_data, "cases": case_table}
+
+
+def _write_report(data: Dict[str, Any], output_dir: Union[ExperimentPaths, str], filename: str) -> str:
+    """
+    Save report data as JSON in the reports directory.
+
+    :param data: Report data
+    :type data: Dict[str, Any]
+    :param output_dir: ExperimentPaths instance or directory path where the report will be saved
+    :type output_dir: Union[ExperimentPaths, str]
+    :param filename: Name of the report file
+    :type filename: str
+    :return: Path to the saved report
+    :rtype: str
+    :raises FileNotFoundError: If the output directory does not exist
+    """
     # Determine output directory
     if isinstance(output_dir, ExperimentPaths):
         report_dir = output_dir.reports_dir
@@ -74,31 +176,211 @@ def write_metrics_report(event_log: pd.DataFrame, output_dir: Union[ExperimentPa
     _validate_directory(report_dir)
 
     # Create the full file path
-    output_file = os.path.join(report_dir, "metrics_report.json")
+    output_file = os.path.join(report_dir, filename)
 
     # Convert all keys to serializable types
-    structured_data = _convert_keys_to_serializable(structured_data)
+    data = _convert_keys_to_serializable(data)
 
     # Write the structured JSON to the output file
     with open(output_file, "w") as file:
-        json.dump(structured_data, file, indent=4)
+        json.dump(data, file, indent=4)
+
+    return output_file
+
+
+def _iter_sequence_probabilities(data: Dict[str, Any]) -> Iterator[Tuple[int, tuple, float]]:
+    """
+    Generate the probability of every sequence from the variants of the sequences report data,
+    ordered by the case ID of its last occurrence.
+
+    :param data: Data of the sequences report, as returned by :func:`_analyze_event_log`
+    :type data: Dict[str, Any]
+    :return: Case ID of the last occurrence, sequence and probability of every sequence
+    :rtype: Iterator[Tuple[int, tuple, float]]
+    """
+    variant_counts = data["variant_counts"]
+    cases = sum(variant_counts.values())
+    for sequence, case_id in reversed(data["last_occurrence"].items()):
+        yield case_id, sequence, variant_counts[sequence] / cases
+
+
+def _validate_sequence_cutoffs(top_k: Optional[int], min_probability: Optional[float]) -> None:
+    """
+    Validate the cutoffs of the sequences report.
+
+    :param top_k: Maximum number of sequences to keep, None for all
+    :type top_k: Optional[int]
+    :param min_probability: Minimum probability of a kept sequence, None for all
+    :type min_probability: Optional[float]
+    :raises ValueError: If top_k is lower than 1 or min_probability is outside of [0, 1]
+    """
+    if top_k is not None and top_k < 1:
+        raise ValueError(f"top_k must be at least 1, got: {top_k}")
+    if min_probability is not None and not 0 <= min_probability <= 1:
+        raise ValueError(f"min_probability must be between 0 and 1, got: {min_probability}")
+
+
+def _select_sequences(sequence_probabilities: Iterable[Tuple[int, tuple, float]], top_k: Optional[int] = None,
+                      min_probability: Optional[float] = None) -> Iterable[Tuple[int, tuple, float]]:
+    """
+    Apply the cutoffs of the sequences report - keep the sequences with at least the given probability
+    and of them only the top_k most probable ones (ties are broken by the lower case ID), ordered by case ID.
+
+    The sequences are consumed lazily - without top_k they are passed on one at a time, with top_k
+    only the k most probable ones seen so far are held.
+
+    :param sequence_probabilities: Case ID of the last occurrence, sequence and probability of every sequence,
+                                   ordered by case ID
+    :type sequence_probabilities: Iterable[Tuple[int, tuple, float]]
+    :param top_k: Maximum number of sequences to keep, all are kept if None
+    :type top_k: Optional[int]
+    :param min_probability: Minimum probability of a kept sequence, all are kept if None
+    :type min_probability: Optional[float]
+    :return: Kept sequences, ordered by case ID
+    :rtype: Iterable[Tuple[int, tuple, float]]
+    :raises ValueError: If top_k is lower than 1 or min_probability is outside of [0, 1]
+    """
+    _validate_sequence_cutoffs(top_k, min_probability)
+
+    selected = (item for item in sequence_probabilities
+                if min_probability is None or item[2] >= min_probability)
+    if top_k is not None:
+        # The heap holds the k best sequences, the rest are dropped as they are generated
+        selected = sorted(heapq.nlargest(top_k, selected, key=lambda item: (item[2], -item[0])),
+                          key=lambda item: item[0])
+    return selected
+
+
+def _write_sequences_report(data: Dict[str, Any], output_dir: Union[ExperimentPaths, str],
+                            top_k: Optional[int] = None, min_probability: Optional[float] = None) -> str:
+    """
+    Stream the sequences report to JSON in the reports directory.
+
+    Unlike :func:`_write_report`, the sequences are neither converted nor indented as a whole - every sequence
+    is generated from the variants, encoded and written on its own line, so apart from the variant counts
+    the memory used doesn't grow with the size of the report.
+    The file is regular JSON with the same structure.
+
+    :param data: Data of the sequences report
+    :type data: Dict[str, Any]
+    :param output_dir: ExperimentPaths instance or directory path where the report will be saved
+    :type output_dir: Union[ExperimentPaths, str]
+    :param top_k: Maximum number of sequences in the report - see :func:`_select_sequences`
+    :type top_k: Optional[int]
+    :param min_probability: Minimum probability of a sequence in the report - see :func:`_select_sequences`
+    :type min_probability: Optional[float]
+    :return: Path to the saved report
+    :rtype: str
+    :raises FileNotFoundError: If the output directory does not exist
+    """
+    sequences = _select_sequences(_iter_sequence_probabilities(data), top_k, min_probability)
+
+    report_dir = output_dir.reports_dir if isinstance(output_dir, ExperimentPaths) else output_dir
+    _validate_directory(report_dir)
+
+    output_file = os.path.join(report_dir, "sequences_report.json")
+    with open(output_file, "w") as file:
+        file.write("{\n")
+        for key in ("start_activities", "end_activities"):
+            activities = json.dumps(_convert_keys_to_serializable(data[key]), indent=4).replace("\n", "\n    ")
+            file.write(f'    "{key}": {activities},\n')
+        # Number of all sequences - the listed ones may be limited by the cutoffs
+        file.write(f'    "distinct_sequences": {len(data["last_occurrence"])},\n')
 
+        file.write('    "sequence_probabilities": [')
+        separator = "\n"
+        for case_id, sequence, probability in sequences:
+            file.write(f"{separator}        {json.dumps([case_id, sequence, probability])}")
+            separator = ",\n"
+        file.write("]\n}" if separator == "\n" else "\n    ]\n}")
+
+    return output_file
+
+
+def _write_case_table(case_table: pd.DataFrame, output_dir: Union[ExperimentPaths, str]) -> str:
+    """
+    Save the per-case table as CSV in the reports directory.
+
+    :param case_table: Table with one row per case
+    :type case_table: pd.DataFrame
+    :param output_dir: ExperimentPaths instance or directory path where the table will be saved
+    :type output_dir: Union[ExperimentPaths, str]
+    :return: Path to the saved table
+    :rtype: str
+    :raises FileNotFoundError: If the output directory does not exist
+    """
+    report_dir = output_dir.reports_dir if isinstance(output_dir, ExperimentPaths) else output_dir
+    _validate_directory(report_dir)
+
+    output_file = os.path.join(report_dir, "case_table.csv")
+    case_table.to_csv(output_file, index=False)
+    return output_file
+
+
+def write_metrics_report(event_log: pd.DataFrame, output_dir: Union[ExperimentPaths, str],
+                         case_table: bool = False) -> None:
+    """
+    Generate and save a comprehensive analysis report of the entire event log in JSON format.
+
+    The generated JSON report includes:
+        - Count of activities
+        - Rework counts per activity
+        - Mean service times per activity
+        - Average graph duration
+        - Duration distribution of every activity and of the cases (min, p50, p90, p99, max, stddev)
+
+    :param event_log: Event log data containing process execution information
+    :type event_log: pd.DataFrame
+    :param output_dir: ExperimentPaths instance or directory path where the report will be saved
+    :type output_dir: Union[ExperimentPaths, str]
+    :param case_table: If True, a compact table with the number of events, reworks, start and duration
+                       of every case is saved as ``case_table.csv`` next to the report
+    :type case_table: bool
+
+    **Examples:**
+
+    >>> # Using ExperimentPaths:
+    >>> exp = create_experiment("my_experiment")
+    >>> write_metrics_report(event_log, exp)
+    Metrics report successfully generated at: experiments/my_experiment/reports/metrics_report.json
+
+    >>> # Using direct path:
+    >>> write_metrics_report(event_log, "analysis")
+    Metrics report successfully generated at: analysis/metrics_report.json
+    """
+    analysis = _analyze_event_log(event_log)
+
+    output_file = _write_report(analysis["metrics"], output_dir, "metrics_report.json")
     print(f"Metrics report successfully generated at: {output_file}")
 
+    if case_table:
+        output_file = _write_case_table(analysis["cases"], output_dir)
+        print(f"Case table successfully generated at: {output_file}")
 
-def write_sequences_report(event_log: pd.DataFrame, output_dir: Union[ExperimentPaths, str]) -> None:
+
+def write_sequences_report(event_log: pd.DataFrame, output_dir: Union[ExperimentPaths, str],
+                           top_k: Optional[int] = None, min_probability: Optional[float] = None) -> None:
     """
     Generate and save a comprehensive sequences report in JSON format.
 
     The generated JSON report includes:
         - Start activities
         - End activities
+        - Number of distinct sequences
         - Last occurrence of the sequences with probabilities
 
+    The sequences are streamed to the file one per line. For logs with many distinct sequences,
+    the report can be limited to the most probable ones with top_k and min_probability.
+
     :param event_log: Event log data containing process execution information
     :type event_log: pd.DataFrame
     :param output_dir: ExperimentPaths instance or directory path where the report will be saved
     :type output_dir: Union[ExperimentPaths, str]
+    :param top_k: Maximum number of sequences in the report - the most probable ones are kept. All if None.
+    :type top_k: Optional[int]
+    :param min_probability: Minimum probability of a sequence in the report. All if None.
+    :type min_probability: Optional[float]
+    :raises ValueError: If top_k is lower than 1 or min_probability is outside of [0, 1]
 
     **Examples:**
 
@@ -110,38 +392,22 @@ def write_sequences_report(event_log: pd.DataFrame, output_dir: Union[Experiment
     >>> # Using direct path:
     >>> write_sequences_report(event_log, "analysis")
     Sequences report successfully generated at: analysis/sequences_report.json
-    """
-    event_log = event_log.copy()
-
-    structured_data = {
-        "start_activities": get_starts(event_log),
-        "end_activities": get_ends(event_log),
-        "sequence_probabilities": get_sequence_probs(event_log),
-    }
-
-    # Determine output directory
-    if isinstance(output_dir, ExperimentPaths):
-        report_dir = output_dir.reports_dir
-    else:
-        report_dir = output_dir
-
-    # Ensure the directory exists
-    _validate_directory(report_dir)
 
-    # Create the full file path
-    output_file = os.path.join(report_dir, "sequences_report.json")
-
-    # Convert all keys to serializable types
-    structured_data = _convert_keys_to_serializable(structured_data)
-
-    # Write the structured JSON to the output file
-    with open(output_file, "w") as file:
-        json.dump(structured_data, file, indent=4)
+    >>> # Only the 100 most probable sequences:
+    >>> write_sequences_report(event_log, "analysis", top_k=100)
+    Sequences report successfully generated at: analysis/sequences_report.json
+    """
+    # Fail before the analysis of the event log, not after it
+    _validate_sequence_cutoffs(top_k, min_probability)
 
+    output_file = _write_sequences_report(_analyze_event_log(event_log)["sequences"], output_dir,
+                                          top_k, min_probability)
     print(f"Sequences report successfully generated at: {output_file}")
 
 
-def generate_reports(event_log: pd.DataFrame, output_dir: Union[ExperimentPaths, str]) -> None:
+def generate_reports(event_log: pd.DataFrame, output_dir: Union[ExperimentPaths, str],
+                     case_table: bool = False, sequences_top_k: Optional[int] = None,
+                     sequences_min_probability: Optional[float] = None) -> None:
     """
     Generate and save all analysis reports in JSON format.
 
@@ -150,14 +416,24 @@ def generate_reports(event_log: pd.DataFrame, output_dir: Union[ExperimentPaths,
         - Rework counts per activity
         - Mean service times per activity
         - Average graph duration
+        - Duration distribution of every activity and of the cases (min, p50, p90, p99, max, stddev)
         - Start activities
         - End activities
+        - Number of distinct sequences
         - Last occurrence of the sequences with probabilities
 
     :param event_log: Event log data containing process execution information
     :type event_log: pd.DataFrame
     :param output_dir: ExperimentPaths instance or directory path where the reports will be saved
     :type output_dir: Union[ExperimentPaths, str]
+    :param case_table: If True, the per-case table is saved as well - see :func:`write_metrics_report`
+    :type case_table: bool
+    :param sequences_top_k: Maximum number of sequences in the sequences report - see :func:`write_sequences_report`
+    :type sequences_top_k: Optional[int]
+    :param sequences_min_probability: Minimum probability of a sequence in the sequences report -
+                                      see :func:`write_sequences_report`
+    :type sequences_min_probability: Optional[float]
+    :raises ValueError: If sequences_top_k is lower than 1 or sequences_min_probability is outside of [0, 1]
 
     **Examples:**
 
@@ -174,6 +450,20 @@ def generate_reports(event_log: pd.DataFrame, output_dir: Union[ExperimentPaths,
     Sequences report successfully generated at: analysis/sequences_report.json
     All reports successfully generated.
     """
-    write_metrics_report(event_log, output_dir)
-    write_sequences_report(event_log, output_dir)
+    _validate_sequence_cutoffs(sequences_top_k, sequences_min_probability)
+
+    # Both reports are written from a single analysis of the event log
+    analysis = _analyze_event_log(event_log)
+
+    output_file = _write_report(analysis["metrics"], output_dir, "metrics_report.json")
+    print(f"Metrics report successfully generated at: {output_file}")
+
+    if case_table:
+        output_file = _write_case_table(analysis["cases"], output_dir)
+        print(f"Case table successfully generated at: {output_file}")
+
+    output_file = _write_sequences_report(analysis["sequences"], output_dir,
+                                          sequences_top_k, sequences_min_probability)
+    print(f"Sequences report successfully generated at: {output_file}")
+
     print("All reports successfully generated.")
\ No newline at end of file
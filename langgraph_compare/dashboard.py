@@ -0,0 +1,454 @@
+import os
+import json
+import sqlite3
+import threading
+import webbrowser
+from pathlib import Path
+from collections import Counter
+from datetime import datetime
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Any, Dict, List, Optional, Set, Tuple, Union
+import pandas as pd
+from .experiment import ExperimentPaths, _connect, _shard_databases
+from .sql_to_jsons import _read_checkpoints
+from .jsons_to_csv import GraphConfig, _build_config_mappings, _process_single_json
+from .create_report import _distribution
+from .compact import _finished_thread_ids
+from .create_html import _MetricsFormatter, _render_comparison
+
+
+def _case_sort_key(case_id: Any) -> tuple:
+    """Order case IDs numerically when they are numbers (thread IDs are stored as text)."""
+    return (0, int(case_id), "") if str(case_id).isdigit() else (1, 0, str(case_id))
+
+
+def _case_stats(events: List[Dict[str, Any]]) -> Dict[str, Any]:
+    """
+    Summarize the events of a single case - its contribution to the metrics of the experiment.
+
+    :param events: Events of the case, ordered by timestamp (as returned by _process_single_json)
+    :type events: List[Dict[str, Any]]
+    :return: Activity sequence, activity counts, reworks, service times, start and end of the case
+    :rtype: Dict[str, Any]
+    """
+    activities = Counter(event['activity'] for event in events)
+    service_times: Dict[str, float] = {}
+    for event in events:
+        duration = (datetime.fromisoformat(event['end_timestamp']) -
+                    datetime.fromisoformat(event['timestamp'])).total_seconds()
+        service_times[event['activity']] = service_times.get(event['activity'], 0.0) + duration
+
+    timestamps = [datetime.fromisoformat(event['timestamp']) for event in events]
+    ends = [datetime.fromisoformat(event['end_timestamp']) for event in events]
+    return {
+        "sequence": tuple(event['activity'] for event in events),
+        "activities": activities,
+        # Every occurrence of an activity in a case after the first one
+        "reworks": Counter({activity: count - 1 for activity, count in activities.items() if count > 1}),
+        "service_times": service_times,
+        "start": min(timestamps),
+        "end": max(ends),
+        "duration": (max(timestamps) - min(timestamps)).total_seconds()
+    }
+
+
+class _LiveEventLog:
+    """
+    Event log of a single experiment, kept up to date by tailing its checkpoint databases.
+
+    Every poll reads only the checkpoints stored since the previous one. Events are rebuilt only for the threads
+    that received new checkpoints, and their previous contribution to the metrics is replaced by the new one.
+    Raw checkpoints are kept only for threads whose run hasn't finished (see
+    :func:`langgraph_compare.compact._finished_thread_ids`) - finished threads keep just their contribution,
+    so neither the memory nor the cost of a poll grows with the number of finished cases.
+
+    Checkpoints are identified by their thread and checkpoint ID rather than by rowid: a checkpoint stored again
+    (``INSERT OR REPLACE`` gives it a new rowid) replaces its previous copy, and a database rewritten by VACUUM
+    or :func:`langgraph_compare.compact.compact_database` is read again without counting any checkpoint twice.
+    """
+
+    def __init__(self, source: Union[ExperimentPaths, str], graph_config: GraphConfig):
+        self.source = source
+        self.graph_config = graph_config
+        self.config = _build_config_mappings(graph_config)
+
+        # Decoded checkpoints of the unfinished threads, keyed by checkpoint ID in the order they were read
+        self.checkpoints: Dict[Any, Dict[str, dict]] = {}
+        # Latest checkpoint ID of every finished thread
+        self.finished: Dict[Any, str] = {}
+        # Rowid, thread ID and checkpoint ID of the last checkpoint read from every database
+        self.last_rows: Dict[str, Tuple[int, Any, Any]] = {}
+
+        # Per-case contributions and their running totals
+        self.cases: Dict[Any, Dict[str, Any]] = {}
+        self.activities: Counter = Counter()
+        self.reworks: Counter = Counter()
+        self.service_times: Dict[str, float] = {}
+        self.lock = threading.Lock()
+
+    @property
+    def databases(self) -> List[str]:
+        """Main database and its shards - shards created while the experiment runs are picked up."""
+        if isinstance(self.source, ExperimentPaths):
+            return self.source.databases
+        return ([self.source] if os.path.exists(self.source) else []) + _shard_databases(self.source)
+
+    def _read_new_checkpoints(self, database: str, conn: sqlite3.Connection) -> Tuple[Set[Any], List[Any]]:
+        """
+        Read the checkpoints stored in a database since the previous poll.
+
+        :param database: Path to the database
+        :type database: str
+        :param conn: Read-only connection to the database
+        :type conn: sqlite3.Connection
+        :return: Threads whose checkpoints changed, and those of them whose run has finished
+        :rtype: Tuple[Set[Any], List[Any]]
+        """
+        after_rowid, *last_checkpoint = self.last_rows.get(database, (0, None, None))
+        if after_rowid and conn.execute("SELECT thread_id, checkpoint_id FROM checkpoints WHERE rowid = ?",
+                                        (after_rowid,)).fetchone() != tuple(last_checkpoint):
+            # The table was rewritten and its rowids changed - read it again, known checkpoints are skipped
+            after_rowid = 0
+
+        new_checkpoints: Dict[Any, list] = {}
+        last_rowid = _read_checkpoints(conn, new_checkpoints, after_rowid)
+        last_row = conn.execute("SELECT thread_id, checkpoint_id FROM checkpoints WHERE rowid = ?",
+                                (last_rowid,)).fetchone()
+        self.last_rows[database] = (last_rowid, *last_row) if last_row else (0, None, None)
+
+        changed = set()
+        for thread_id, checkpoints in new_checkpoints.items():
+            # Checkpoints that can't be decoded were already reported by _read_checkpoints
+            checkpoints = [checkpoint for checkpoint in checkpoints if checkpoint["checkpoint"] is not None]
+            latest_finished = self.finished.get(thread_id)
+            if latest_finished is not None:
+                if all(checkpoint["checkpoint"]["id"] <= latest_finished for checkpoint in checkpoints):
+                    continue
+                # The finished thread was continued - its events are rebuilt from all of its checkpoints
+                del self.finished[thread_id]
+                history: Dict[Any, list] = {}
+                _read_checkpoints(conn, history, only_thread=thread_id)
+                checkpoints = [checkpoint for checkpoint in history.get(thread_id, [])
+                               if checkpoint["checkpoint"] is not None]
+
+            stored = self.checkpoints.setdefault(thread_id, {})
+            for checkpoint in checkpoints:
+                checkpoint_id = checkpoint["checkpoint"]["id"]
+                if stored.get(checkpoint_id) != checkpoint:
+                    stored[checkpoint_id] = checkpoint
+                    changed.add(thread_id)
+
+        return changed, _finished_thread_ids(conn, list(changed))
+
+    def _replace_case(self, case_id: Any, stats: Optional[Dict[str, Any]]) -> None:
+        """Replace the contribution of a case to the running totals."""
+        previous = self.cases.pop(case_id, None)
+        if previous is not None:
+            self.activities -= previous["activities"]
+            self.reworks -= previous["reworks"]
+            for activity, duration in previous["service_times"].items():
+                self.service_times[activity] -= duration
+        if stats is not None:
+            self.cases[case_id] = stats
+            self.activities += stats["activities"]
+            self.reworks += stats["reworks"]
+            for activity, duration in stats["service_times"].items():
+                self.service_times[activity] = self.service_times.get(activity, 0.0) + duration
+
+    def poll(self) -> int:
+        """
+        Read new checkpoints and update the metrics of the threads they belong to.
+
+        :return: Number of updated threads
+        :rtype: int
+        """
+        changed: Set[Any] = set()
+        finished: Set[Any] = set()
+        for database in self.databases:
+            if isinstance(self.source, ExperimentPaths):
+                # Read-only connection of the polling thread - never blocks the checkpoint writer
+                conn, close = self.source.get_reader(database), False
+            else:
+                conn, close = _connect(database, read_only=True), True
+            try:
+                database_changed, database_finished = self._read_new_checkpoints(database, conn)
+                changed |= database_changed
+                finished.update(database_finished)
+            except sqlite3.OperationalError:
+                # The checkpoint tables don't exist until the first checkpoint is saved,
+                # and the database may be locked for a moment - read it on the next poll
+                continue
+            finally:
+                if close:
+                    conn.close()
+
+        for thread_id in changed:
+            checkpoints = self.checkpoints[thread_id]
+            try:
+                events = _process_single_json(list(checkpoints.values()), self.graph_config, self.config)
+            except Exception as e:
+                print(f"Error processing checkpoints of thread_ID {thread_id}: {e}")
+                continue
+
+            with self.lock:
+                self._replace_case(thread_id, _case_stats(events) if events else None)
+
+            # Only the contribution of a finished thread is kept - new checkpoints reload its history
+            if thread_id in finished:
+                self.finished[thread_id] = max(checkpoints)
+                del self.checkpoints[thread_id]
+
+        return len(changed)
+
+    def metrics(self) -> Dict[str, Any]:
+        """
+        Current metrics of the experiment - throughput of the run, and the metrics of the metrics report
+        (see :func:`langgraph_compare.create_report.write_metrics_report`) for the events stored so far.
+
+        :return: Metric names mapped to their values
+        :rtype: Dict[str, Any]
+        """
+        with self.lock:
+            cases = list(self.cases.values())
+            activities = Counter(self.activities)
+            reworks = Counter(self.reworks)
+            service_times = dict(self.service_times)
+
+        if not cases:
+            return {"cases": 0, "events": 0}
+
+        events = sum(activities.values())
+        first_start = min(case["start"] for case in cases)
+        last_end = max(case["end"] for case in cases)
+        elapsed_minutes = (last_end - first_start).total_seconds() / 60
+        durations = pd.Series([case["duration"] for case in cases])
+
+        return {
+            "cases": len(cases),
+            "events": events,
+            "cases_per_minute": round(len(cases) / elapsed_minutes, 2) if elapsed_minutes else None,
+            "events_per_minute": round(events / elapsed_minutes, 2) if elapsed_minutes else None,
+            "last_event": last_end.isoformat(),
+            "activities_count": dict(activities.most_common()),
+            "rework_counts": dict(reworks.most_common()),
+            "activities_mean_service_time": {
+                activity: service_times[activity] / count for activity, count in activities.most_common()
+            },
+            "avg_graph_duration": float(durations.mean()),
+            "case_duration_distribution": _distribution(durations)
+        }
+
+    def sequences(self) -> Dict[str, Any]:
+        """
+        Current data of the sequences report (see :func:`langgraph_compare.create_report.write_sequences_report`),
+        with sequences ordered by probability.
+
+        :return: Start activities, end activities and sequence probabilities
+        :rtype: Dict[str, Any]
+        """
+        with self.lock:
+            sequences = {case_id: case["sequence"] for case_id, case in self.cases.items()}
+
+        variant_counts = Counter(sequences.values())
+        last_occurrence = {sequence: case_id for case_id, sequence in
+                           sorted(sequences.items(), key=lambda item: _case_sort_key(item[0]))}
+        sequence_probabilities = sorted(
+            ([case_id, list(sequence), variant_counts[sequence] / len(sequences)]
+             for sequence, case_id in last_occurrence.items()),
+            key=lambda item: item[2], reverse=True
+        )
+        return {
+            "start_activities": dict(Counter(sequence[0] for sequence in sequences.values()).most_common()),
+            "end_activities": dict(Counter(sequence[-1] for sequence in sequences.values()).most_common()),
+            "distinct_sequences": len(sequence_probabilities),
+            "sequence_probabilities": sequence_probabilities
+        }
+
+
+class _DashboardRequestHandler(BaseHTTPRequestHandler):
+    """Serves the dashboard page (``/``) and the raw metrics (``/metrics.json``)."""
+    dashboard: "DashboardServer"
+
+    def do_GET(self):
+        if self.path.split("?")[0] in ("/", "/index.html"):
+            body, content_type = self.dashboard.render().encode("utf-8"), "text/html; charset=utf-8"
+        elif self.path.split("?")[0] == "/metrics.json":
+            body, content_type = json.dumps(self.dashboard.metrics(), indent=4).encode("utf-8"), "application/json"
+        else:
+            self.send_error(404)
+            return
+
+        self.send_response(200)
+        self.send_header("Content-Type", content_type)
+        self.send_header("Content-Length", str(len(body)))
+        self.send_header("Cache-Control", "no-store")
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, format, *args):
+        # The page refreshes itself every few seconds - don't log every request
+        pass
+
+
+class DashboardServer:
+    """
+    Local HTTP server with live metrics of running experiments, returned by :func:`serve_dashboard`.
+
+    :param experiments: Experiment names mapped to their ExperimentPaths or database paths
+    :type experiments: Dict[str, Union[ExperimentPaths, str]]
+    :param graph_config: The graph configuration of the experiments
+    :type graph_config: GraphConfig
+    :param host: Address the server listens on
+    :type host: str
+    :param port: Port the server listens on, 0 picks a free port
+    :type port: int
+    :param poll_interval: Seconds between reads of the checkpoint databases
+    :type poll_interval: float
+    :param refresh: Seconds between reloads of the page in the browser
+    :type refresh: int
+    """
+
+    def __init__(self, experiments: Dict[str, Union[ExperimentPaths, str]], graph_config: GraphConfig,
+                 host: str = "127.0.0.1", port: int = 8050, poll_interval: float = 2.0, refresh: int = 5):
+        self.logs = {name: _LiveEventLog(source, graph_config) for name, source in experiments.items()}
+        self.poll_interval = poll_interval
+        self.refresh = refresh
+
+        handler = type("DashboardRequestHandler", (_DashboardRequestHandler,), {"dashboard": self})
+        self.httpd = ThreadingHTTPServer((host, port), handler)
+        self._stopped = threading.Event()
+        self._threads: List[threading.Thread] = []
+
+    @property
+    def url(self) -> str:
+        """URL of the dashboard page."""
+        host, port = self.httpd.server_address[:2]
+        return f"http://{host}:{port}/"
+
+    def poll(self) -> None:
+        """Read new checkpoints of every experiment."""
+        for log in self.logs.values():
+            log.poll()
+
+    def metrics(self) -> Dict[str, Dict[str, Any]]:
+        """Current metrics of every experiment."""
+        return {name: log.metrics() for name, log in self.logs.items()}
+
+    def render(self) -> str:
+        """Render the comparison page with the current metrics of every experiment."""
+        infrastructures_data = {}
+        for name, log in self.logs.items():
+            report_data = log.metrics()
+            infrastructures_data[name] = {
+                "main_report": {
+                    key: _MetricsFormatter.format_metric(key, value, report_data)
+                    for key, value in report_data.items()
+                },
+                "sequences_report": log.sequences()
+            }
+        return _render_comparison(infrastructures_data, {name: {} for name in self.logs},
+                                  title="Live Dashboard", refresh=self.refresh)
+
+    def _poll_forever(self) -> None:
+        while not self._stopped.is_set():
+            self.poll()
+            self._stopped.wait(self.poll_interval)
+
+    def start(self) -> None:
+        """Start polling the databases and serving the dashboard in background threads."""
+        self._threads = [
+            threading.Thread(target=self._poll_forever, daemon=True),
+            threading.Thread(target=self.httpd.serve_forever, daemon=True)
+        ]
+        for thread in self._threads:
+            thread.start()
+
+    def stop(self) -> None:
+        """Stop the server and the polling."""
+        self._stopped.set()
+        self.httpd.shutdown()
+        self.httpd.server_close()
+        for thread in self._threads:
+            thread.join()
+
+
+def serve_dashboard(
+        experiments: Union[ExperimentPaths, str, List[Union[ExperimentPaths, str]],
+                           Dict[str, Union[ExperimentPaths, str]]],
+        graph_config: GraphConfig,
+        host: str = "127.0.0.1",
+        port: int = 8050,
+        poll_interval: float = 2.0,
+        refresh: int = 5,
+        block: bool = True,
+        open_browser: bool = False
+) -> Optional[DashboardServer]:
+    """
+    Serve a live, auto-refreshing comparison page of running experiments.
+
+    The checkpoint databases of the experiments (including shards) are tailed with read-only connections,
+    so the dashboard can run alongside :func:`run_multiple_iterations` without calling
+    :func:`prepare_data` or :func:`generate_artifacts`. Only the checkpoints stored since the previous poll are read,
+    and only the cases they belong to are updated. The page shows throughput (cases and events per minute),
+    latency (average and percentile case durations), activity counts, reworks, service times and sequences.
+    The raw metrics are served at ``/metrics.json``.
+
+    :param experiments: An experiment (ExperimentPaths or database path), a list of them, or a dictionary mapping
+                        names to them.
+    :type experiments: Union[ExperimentPaths, str, List[Union[ExperimentPaths, str]], Dict[str, Union[ExperimentPaths, str]]]
+    :param graph_config: The graph configuration of the experiments
+    :type graph_config: GraphConfig
+    :param host: Address the server listens on, defaults to "127.0.0.1"
+    :type host: str
+    :param port: Port the server listens on, defaults to 8050. Use 0 to pick a free port.
+    :type port: int
+    :param poll_interval: Seconds between reads of the checkpoint databases, defaults to 2
+    :type poll_interval: float
+    :param refresh: Seconds between reloads of the page in the browser, defaults to 5
+    :type refresh: int
+    :param block: If True, serve until interrupted (Ctrl+C). If False, the server runs in background threads
+                  and is returned - call its ``stop`` method when done.
+    :type block: bool
+    :param open_browser: Open the dashboard in the default browser
+    :type open_browser: bool
+    :return: The running server if block is False, otherwise None
+    :rtype: Optional[DashboardServer]
+
+    **Examples:**
+
+    >>> # Watch an experiment from a separate process:
+    >>> exp = create_experiment("my_experiment")
+    >>> serve_dashboard(exp, graph_config)
+    Dashboard running at http://127.0.0.1:8050/
+
+    >>> # Run the dashboard in the background of the script running the experiment:
+    >>> dashboard = serve_dashboard(exp, graph_config, block=False)
+    Dashboard running at http://127.0.0.1:8050/
+    >>> run_multiple_iterations(graph, 1, 100, user_input_template)
+    >>> dashboard.stop()
+    """
+    if not isinstance(experiments, (list, dict)):
+        experiments = [experiments]
+    if isinstance(experiments, list):
+        experiments = {
+            source.name if isinstance(source, ExperimentPaths) else Path(source).stem: source
+            for source in experiments
+        }
+
+    dashboard = DashboardServer(experiments, graph_config, host, port, poll_interval, refresh)
+    dashboard.start()
+    print(f"Dashboard running at {dashboard.url}")
+
+    if open_browser:
+        webbrowser.open(dashboard.url)
+
+    if not block:
+        return dashboard
+
+    try:
+        dashboard._stopped.wait()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        dashboard.stop()
+    return None
@@ -1,8 +1,162 @@
 import os
+import re
 import sqlite3
-from dataclasses import dataclass
-from typing import Optional
+import threading
+from contextlib import asynccontextmanager
+from dataclasses import dataclass, field
+from typing import Any, AsyncIterator, Dict, List, Optional, Tuple, Union
 from langgraph.checkpoint.sqlite import SqliteSaver
+from langgraph.checkpoint.sqlite.aio import AsyncSqliteSaver
+from langgraph.graph.state import CompiledStateGraph
+from urllib.request import pathname2url
+
+# PRAGMA settings applied to every connection to the experiment database, by profile name.
+# "tuned" trades durability of the last transactions on power loss (not on application crash) for write throughput:
+# WAL lets readers work alongside the checkpoint writer, synchronous=NORMAL stops fsync on every commit,
+# and a larger page cache / memory mapped I/O speed up reads.
+CONNECTION_PROFILES: Dict[str, Dict[str, Any]] = {
+    "default": {},
+    "tuned": {
+        "journal_mode": "WAL",
+        "synchronous": "NORMAL",
+        # Negative value is in KiB - 64 MiB
+        "cache_size": -65536,
+        # 256 MiB
+        "mmap_size": 268435456,
+        # Milliseconds
+        "busy_timeout": 5000
+    }
+}
+
+
+# PRAGMAs a connection profile may set, mapped to the keywords they accept besides integer values.
+# Profiles are put into SQL as they are, so nothing outside this list is accepted.
+_ALLOWED_PRAGMAS: Dict[str, Tuple[str, ...]] = {
+    "journal_mode": ("DELETE", "TRUNCATE", "PERSIST", "MEMORY", "WAL", "OFF"),
+    "synchronous": ("OFF", "NORMAL", "FULL", "EXTRA"),
+    "locking_mode": ("NORMAL", "EXCLUSIVE"),
+    "temp_store": ("DEFAULT", "FILE", "MEMORY"),
+    "foreign_keys": ("ON", "OFF"),
+    "cache_size": (),
+    "mmap_size": (),
+    "busy_timeout": (),
+    "wal_autocheckpoint": (),
+    "journal_size_limit": ()
+}
+
+
+def _validate_pragma(name: str, value: Any) -> Tuple[str, str]:
+    """
+    Validate a single PRAGMA setting of a connection profile.
+
+    :param name: Name of the PRAGMA.
+    :type name: str
+    :param value: Integer value or one of the keywords the PRAGMA accepts.
+    :type value: Any
+    :return: Normalized name and value, safe to put into a PRAGMA statement.
+    :rtype: Tuple[str, str]
+    :raises ValueError: If the PRAGMA isn't supported or the value isn't valid for it.
+    """
+    normalized_name = str(name).lower()
+    if normalized_name not in _ALLOWED_PRAGMAS:
+        raise ValueError(f"Unsupported PRAGMA '{name}', expected one of {list(_ALLOWED_PRAGMAS)}")
+
+    # bool is a subclass of int, but True/False aren't meaningful PRAGMA values
+    if isinstance(value, int) and not isinstance(value, bool):
+        return normalized_name, str(int(value))
+    keywords = _ALLOWED_PRAGMAS[normalized_name]
+    if isinstance(value, str) and value.upper() in keywords:
+        return normalized_name, value.upper()
+    expected = f"an integer or one of {list(keywords)}" if keywords else "an integer"
+    raise ValueError(f"Invalid value {value!r} for PRAGMA '{name}', expected {expected}")
+
+
+def _resolve_pragmas(connection_profile: Union[str, Dict[str, Any]]) -> Dict[str, Any]:
+    """
+    Resolve a connection profile to the PRAGMA settings it stands for.
+
+    :param connection_profile: Name of a profile from CONNECTION_PROFILES or a mapping of PRAGMA names to values.
+    :type connection_profile: Union[str, Dict[str, Any]]
+    :return: PRAGMA names mapped to their values, validated and normalized.
+    :rtype: Dict[str, Any]
+    :raises ValueError: If the profile name is unknown, or a PRAGMA or its value isn't supported.
+    """
+    if not isinstance(connection_profile, dict):
+        if connection_profile not in CONNECTION_PROFILES:
+            raise ValueError(f"Unknown connection profile '{connection_profile}', "
+                             f"expected one of {list(CONNECTION_PROFILES)} or a dict of PRAGMA settings")
+        connection_profile = CONNECTION_PROFILES[connection_profile]
+    return dict(_validate_pragma(name, value) for name, value in connection_profile.items())
+
+
+# PRAGMAs that change the database file itself - they can't (and don't need to) be set on read-only connections
+_WRITER_PRAGMAS = {"journal_mode", "synchronous"}
+
+
+def _pragma_statements(connection_profile: Union[str, Dict[str, Any]], read_only: bool = False) -> List[str]:
+    """
+    Build the PRAGMA statements for a connection profile.
+
+    :param connection_profile: Name of a profile from CONNECTION_PROFILES or a mapping of PRAGMA names to values.
+    :type connection_profile: Union[str, Dict[str, Any]]
+    :param read_only: Skip PRAGMAs that only apply to writers.
+    :type read_only: bool
+    :return: PRAGMA statements to execute on a new connection.
+    :rtype: List[str]
+    """
+    return [f"PRAGMA {name}={value}" for name, value in _resolve_pragmas(connection_profile).items()
+            if not (read_only and name in _WRITER_PRAGMAS)]
+
+
+def _connect(database: str, connection_profile: Union[str, Dict[str, Any]] = "default",
+             read_only: bool = False) -> sqlite3.Connection:
+    """
+    Open a connection to a SQLite database and apply the PRAGMA settings of the connection profile.
+
+    :param database: Path to the SQLite database.
+    :type database: str
+    :param connection_profile: Name of a profile from CONNECTION_PROFILES or a mapping of PRAGMA names to values.
+    :type connection_profile: Union[str, Dict[str, Any]]
+    :param read_only: Open the database with ``mode=ro`` - the connection can never take a write lock.
+    :type read_only: bool
+    :return: SQLite connection object
+    :rtype: sqlite3.Connection
+    """
+    if read_only:
+        uri = f"file:{pathname2url(os.path.abspath(database))}?mode=ro"
+        conn = sqlite3.connect(uri, uri=True, check_same_thread=False)
+    else:
+        conn = sqlite3.connect(database, check_same_thread=False)
+    for statement in _pragma_statements(connection_profile, read_only):
+        conn.execute(statement)
+    return conn
+
+
+def _shard_databases(database: str) -> List[str]:
+    """
+    Find shard databases written next to a database by sharded sweeps.
+
+    Shards of ``db/name.sqlite`` are named ``db/name.<shard>.sqlite``.
+
+    :param database: Path to the main SQLite database.
+    :type database: str
+    :return: Paths of the existing shard databases, ordered by shard number.
+    :rtype: List[str]
+    """
+    directory, filename = os.path.split(database)
+    stem, extension = os.path.splitext(filename)
+    pattern = re.compile(rf"^{re.escape(stem)}\.(\d+){re.escape(extension)}$")
+
+    if not os.path.isdir(directory or "."):
+        return []
+
+    shards = []
+    for candidate in os.listdir(directory or "."):
+        match = pattern.match(candidate)
+        if match:
+            shards.append((int(match.group(1)), os.path.join(directory, candidate)))
+    return [path for _, path in sorted(shards)]
+
 
 @dataclass
 class ExperimentPaths:
@@ -13,11 +167,38 @@ class ExperimentPaths:
     :type name: str
     :param base_dir: Base directory where all experiments are stored, defaults to "experiments".
     :type base_dir: str
+    :param connection_profile: SQLite settings applied to every connection to the experiment databases -
+                               "default" (SQLite defaults), "tuned" (WAL, synchronous=NORMAL, larger cache, mmap,
+                               busy timeout) or a dict mapping PRAGMA names to values - integers or the keywords
+                               of the PRAGMA, from the supported journal_mode, synchronous, locking_mode, temp_store,
+                               foreign_keys, cache_size, mmap_size, busy_timeout, wal_autocheckpoint
+                               and journal_size_limit. Defaults to "default".
+    :type connection_profile: Union[str, Dict[str, Any]]
     """
     name: str
     base_dir: str = "experiments"
+    connection_profile: Union[str, Dict[str, Any]] = "default"
     _connection: Optional[sqlite3.Connection] = None
     _memory: Optional[SqliteSaver] = None
+    # Read-only connections keyed by (thread ident, database path)
+    _readers: Dict[Tuple[int, str], sqlite3.Connection] = field(default_factory=dict, repr=False, compare=False)
+    _readers_lock: threading.Lock = field(default_factory=threading.Lock, repr=False, compare=False)
+
+    @property
+    def root(self) -> str:
+        """
+        Returns path to the experiment folder.
+
+        :return: Full path to the experiment folder.
+        :rtype: str
+
+        **Example:**
+
+        >>> paths = ExperimentPaths("test")
+        >>> paths.root
+        'experiments/test'
+        """
+        return os.path.join(self.base_dir, self.name)
 
     @property
     def database(self) -> str:
@@ -35,10 +216,44 @@ class ExperimentPaths:
         """
         return os.path.join(self.base_dir, self.name, "db", f"{self.name}.sqlite")
 
+    def get_shard_database(self, shard: int) -> str:
+        """
+        Returns path to the SQLite database of a single shard, used by sharded sweeps.
+
+        :param shard: Number of the shard.
+        :type shard: int
+        :return: Full path to the shard database file.
+        :rtype: str
+
+        **Example:**
+
+        >>> paths = ExperimentPaths("test")
+        >>> paths.get_shard_database(2)
+        'experiments/test/db/test.2.sqlite'
+        """
+        return os.path.join(self.base_dir, self.name, "db", f"{self.name}.{shard}.sqlite")
+
+    @property
+    def databases(self) -> List[str]:
+        """
+        Returns paths to all existing databases of the experiment - the main database followed by any shards.
+
+        :return: Paths to the existing SQLite database files.
+        :rtype: List[str]
+
+        **Example:**
+
+        >>> paths = ExperimentPaths("test")
+        >>> paths.databases
+        ['experiments/test/db/test.sqlite', 'experiments/test/db/test.0.sqlite', 'experiments/test/db/test.1.sqlite']
+        """
+        main = [self.database] if os.path.exists(self.database) else []
+        return main + _shard_databases(self.database)
+
     @property
     def connection(self) -> sqlite3.Connection:
         """
-        Returns or creates SQLite connection with appropriate settings.
+        Returns or creates SQLite connection with settings of the connection profile.
 
         :return: SQLite connection object
         :rtype: sqlite3.Connection
@@ -50,9 +265,54 @@ class ExperimentPaths:
         >>> conn2 = paths.connection  # Returns existing connection
         """
         if self._connection is None:
-            self._connection = sqlite3.connect(self.database, check_same_thread=False)
+            self._connection = _connect(self.database, self.connection_profile)
         return self._connection
 
+    def get_reader(self, database: Optional[str] = None) -> sqlite3.Connection:
+        """
+        Returns or creates a read-only connection to the database for the calling thread.
+
+        Readers are opened with ``mode=ro``, so exports and analysis of a live experiment never take
+        the write lock the checkpoint writer needs. Every thread gets its own connection,
+        which is reused on subsequent calls from that thread.
+
+        :param database: Path to the database to read, defaults to the main database. Use it to read shards.
+        :type database: Optional[str]
+        :return: Read-only SQLite connection object
+        :rtype: sqlite3.Connection
+
+        **Example:**
+
+        >>> paths = ExperimentPaths("test")
+        >>> reader = paths.get_reader()  # Creates new read-only connection for this thread
+        >>> reader2 = paths.get_reader()  # Returns the same connection
+        >>> shard_reader = paths.get_reader(paths.get_shard_database(0))
+        """
+        database = database if database is not None else self.database
+        key = (threading.get_ident(), database)
+        with self._readers_lock:
+            reader = self._readers.get(key)
+            if reader is None:
+                reader = _connect(database, self.connection_profile, read_only=True)
+                self._readers[key] = reader
+        return reader
+
+    def close_readers(self) -> None:
+        """
+        Closes all read-only connections opened with :meth:`get_reader`, from every thread.
+
+        **Example:**
+
+        >>> paths = ExperimentPaths("test")
+        >>> reader = paths.get_reader()
+        >>> paths.close_readers()
+        """
+        with self._readers_lock:
+            readers = list(self._readers.values())
+            self._readers.clear()
+        for reader in readers:
+            reader.close()
+
     @property
     def memory(self) -> SqliteSaver:
         """
@@ -71,6 +331,56 @@ class ExperimentPaths:
             self._memory = SqliteSaver(self.connection)
         return self._memory
 
+    @asynccontextmanager
+    async def async_memory(self) -> AsyncIterator[AsyncSqliteSaver]:
+        """
+        Opens an AsyncSqliteSaver for the database, for graphs driven with ``astream``.
+
+        The underlying aiosqlite connection is bound to the running event loop, so the saver
+        has to be created (and the graph compiled with it) inside the coroutine that runs the graph.
+        The connection is closed when the context exits.
+
+        :return: AsyncSqliteSaver instance
+        :rtype: AsyncIterator[AsyncSqliteSaver]
+
+        **Example:**
+
+        >>> paths = ExperimentPaths("test")
+        >>> async with paths.async_memory() as memory:
+        ...     graph = graph_builder.compile(checkpointer=memory)
+        ...     await arun_multiple_iterations(graph, 1, 100, {"messages": [("user", "Tell me a joke")]})
+        """
+        # Installed with langgraph-checkpoint-sqlite, only needed by async sweeps
+        import aiosqlite
+
+        async with aiosqlite.connect(self.database) as conn:
+            for statement in _pragma_statements(self.connection_profile):
+                await conn.execute(statement)
+            yield AsyncSqliteSaver(conn)
+
+    def compact(self, archive: bool = False, graph: Optional[CompiledStateGraph] = None) -> Dict[str, int]:
+        """
+        Strips state snapshots from checkpoints of the exported, finished threads and VACUUMs the experiment databases.
+        Call it after a successful export - see :func:`langgraph_compare.compact.compact_database`.
+
+        :param archive: If True, the original rows are kept in a gzip compressed archive next to every database.
+        :type archive: bool
+        :param graph: Compiled graph the threads were run with - used to check that no nodes are left to run.
+        :type graph: Optional[CompiledStateGraph]
+        :return: Number of compacted checkpoints, removed pending writes and database sizes before and after
+        :rtype: Dict[str, int]
+
+        **Example:**
+
+        >>> paths = ExperimentPaths("test")
+        >>> prepare_data(paths, graph_config)
+        >>> paths.compact(archive=True)
+        Compacted experiments/test/db/test.sqlite: 149 checkpoints, 284 writes, 5,320,704 -> 348,160 bytes
+        """
+        # Imported here, since the compact module depends on this one
+        from .compact import compact_database
+        return compact_database(self, archive=archive, graph=graph)
+
     @property
     def json_dir(self) -> str:
         """
@@ -216,7 +526,8 @@ def _create_folder_structure(folder_name: str, base_dir: str = "experiments") ->
         print(f"Error creating folder structure: {error}")
 
 
-def create_experiment(name: str, base_dir: str = "experiments") -> ExperimentPaths:
+def create_experiment(name: str, base_dir: str = "experiments",
+                      connection_profile: Union[str, Dict[str, Any]] = "default") -> ExperimentPaths:
     """
     Main function to set up experiment and return paths. This is the main entry point
     for creating a new experiment structure.
@@ -225,6 +536,9 @@ def create_experiment(name: str, base_dir: str = "experiments") -> ExperimentPat
     :type name: str
     :param base_dir: Base directory where the experiment folder will be created, defaults to "experiments".
     :type base_dir: str
+    :param connection_profile: SQLite settings for the experiment databases - "default", "tuned"
+                               or a dict mapping PRAGMA names to values. See :class:`ExperimentPaths`.
+    :type connection_profile: Union[str, Dict[str, Any]]
     :return: ExperimentPaths object containing all relevant paths.
     :rtype: ExperimentPaths
 
@@ -240,9 +554,16 @@ def create_experiment(name: str, base_dir: str = "experiments") -> ExperimentPat
     Image directory: custom_experiments/my_experiment/img
     Reports directory: custom_experiments/my_experiment/reports
     """
+    # Validate the profile before anything is created on disk
+    _resolve_pragmas(connection_profile)
+
     print("\nCreating new experiment...")
     _create_folder_structure(name, base_dir)
-    paths = ExperimentPaths(name, base_dir)
+    paths = ExperimentPaths(name, base_dir, connection_profile)
+
+    # Imported here, as the catalog module depends on ExperimentPaths
+    from .catalog import _update_catalog, _now
+    _update_catalog(paths, created=_now())
 
     print(f"\nExperiment '{paths.name}' created successfully!")
     print(f"Database path: {paths.database}")
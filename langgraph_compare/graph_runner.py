@@ -1,6 +1,469 @@
-from typing import Dict, Any
+from typing import Dict, Any, Callable, Iterable, List, Optional, Union
+from collections import defaultdict
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass
+from langgraph.checkpoint.sqlite import SqliteSaver
 from langgraph.graph.state import CompiledStateGraph
+from .experiment import ExperimentPaths, _connect, _shard_databases
+import numpy as np
+import asyncio
 import copy
+import json
+import os
+import sqlite3
+import time
+
+# Supported output levels for the graph runners
+VERBOSITY_LEVELS = ("silent", "progress", "steps")
+
+
+@dataclass
+class StepEvent:
+    """
+    Single step of a graph run, passed to the `on_step` callback of the graph runners.
+
+    :param iteration: Number of the iteration (starting from 1).
+    :type iteration: int
+    :param thread_id: Thread ID the graph was run with.
+    :type thread_id: str
+    :param step: Number of the step within the run (starting from 0).
+    :type step: int
+    :param values: State values emitted by the graph for this step.
+    :type values: Dict[str, Any]
+    """
+    iteration: int
+    thread_id: str
+    step: int
+    values: Dict[str, Any]
+
+
+def _validate_verbosity(verbosity: str) -> None:
+    """
+    Validate that the verbosity level is supported.
+
+    :param verbosity: Verbosity level to check
+    :type verbosity: str
+    :raises ValueError: If the verbosity level is not supported
+    """
+    if verbosity not in VERBOSITY_LEVELS:
+        raise ValueError(f"verbosity must be one of {VERBOSITY_LEVELS}, got '{verbosity}'")
+
+
+def _build_config(thread_id: str, recursion_limit: int) -> Dict[str, Any]:
+    """
+    Build the run config for a single graph run.
+
+    :param thread_id: Thread ID of the run
+    :type thread_id: str
+    :param recursion_limit: Maximum recursion depth allowed for the run
+    :type recursion_limit: int
+    :return: Config passed to the graph
+    :rtype: Dict[str, Any]
+    """
+    return {
+        "configurable": {"thread_id": thread_id},
+        "recursion_limit": recursion_limit
+    }
+
+
+def _resolve_output_dir(output_dir: Union[ExperimentPaths, str]) -> str:
+    """
+    Resolve the directory the runner artifacts are written to and validate that it exists.
+
+    :param output_dir: ExperimentPaths instance (uses its reports directory) or directory path
+    :type output_dir: Union[ExperimentPaths, str]
+    :return: Path to the directory
+    :rtype: str
+    :raises FileNotFoundError: If the directory does not exist
+    """
+    directory = output_dir.reports_dir if isinstance(output_dir, ExperimentPaths) else str(output_dir)
+    if not os.path.exists(directory):
+        raise FileNotFoundError(f"Directory does not exist: {directory}")
+    return directory
+
+
+def _write_json_atomically(data: Dict[str, Any], output_file: str) -> None:
+    """
+    Write JSON to a temporary file first and move it in place,
+    so anyone reading the file mid-sweep never sees a partial file.
+    """
+    tmp_file = f"{output_file}.tmp"
+    with open(tmp_file, "w") as file:
+        json.dump(data, file, indent=4)
+    os.replace(tmp_file, output_file)
+
+
+def _thread_status(snapshot: Any) -> str:
+    """
+    Classify a thread based on its latest checkpoint.
+
+    :param snapshot: State snapshot returned by `graph.get_state`
+    :type snapshot: StateSnapshot
+    :return: "new" if the thread has no checkpoints, "completed" if the run reached its end,
+             "interrupted" if there are still nodes scheduled to run
+    :rtype: str
+    """
+    if snapshot.created_at is None:
+        return "new"
+    return "interrupted" if snapshot.next else "completed"
+
+
+def _retry_delay(retry_backoff: float, attempt: int) -> float:
+    """Exponential backoff delay (in seconds) before the given retry attempt (starting from 1)."""
+    return retry_backoff * 2 ** (attempt - 1)
+
+
+def _summarize_durations(durations: List[float]) -> Dict[str, float]:
+    """
+    Summarize a list of durations (in seconds) with count, mean and tail percentiles.
+
+    :param durations: Durations to summarize
+    :type durations: List[float]
+    :return: Summary statistics
+    :rtype: Dict[str, float]
+    """
+    if not durations:
+        return {"count": 0}
+    values = np.asarray(durations)
+    p50, p95, p99 = np.percentile(values, [50, 95, 99])
+    return {
+        "count": int(values.size),
+        "mean": float(values.mean()),
+        "p50": float(p50),
+        "p95": float(p95),
+        "p99": float(p99),
+        "max": float(values.max())
+    }
+
+
+class _IterationTimer:
+    """
+    Wall-clock timer for a single graph run fed with `values` and `updates` stream events.
+
+    A node's duration is the time between the previous event of the run and the node's update,
+    so for nodes running in parallel within one step the first reported node absorbs the step time.
+    """
+
+    def __init__(self, thread_id: str):
+        self.thread_id = thread_id
+        self.started = time.perf_counter()
+        self.last_event = self.started
+        self.last_values = self.started
+        self.step_durations: List[float] = []
+        self.node_durations: List[tuple] = []
+
+    def on_event(self, mode: str, chunk: Any) -> None:
+        now = time.perf_counter()
+        if mode == "values":
+            self.step_durations.append(now - self.last_values)
+            self.last_values = now
+        elif mode == "updates" and isinstance(chunk, dict):
+            for node in chunk:
+                self.node_durations.append((node, now - self.last_event))
+        self.last_event = now
+
+    def total(self) -> float:
+        return self.last_event - self.started
+
+
+class _RunMetrics:
+    """
+    Collects timings of all graph runs of a sweep and keeps a JSON summary of them on disk.
+
+    Summarizing is linear in the number of recorded runs, so the file is rewritten only every
+    `WRITE_EVERY_RUNS` finished runs or `WRITE_INTERVAL` seconds (whichever comes first),
+    and once more at the end of the sweep.
+    """
+    FILENAME = "run_metrics.json"
+    WRITE_EVERY_RUNS = 50
+    WRITE_INTERVAL = 10.0
+
+    def __init__(self, output_dir: Union[ExperimentPaths, str], filename: Optional[str] = None):
+        self.output_file = os.path.join(_resolve_output_dir(output_dir), filename or self.FILENAME)
+        self.started = time.perf_counter()
+        self.last_write = self.started
+        self.unwritten = 0
+        self.iterations: Dict[str, float] = {}
+        self.steps: List[float] = []
+        self.nodes: Dict[str, List[float]] = defaultdict(list)
+
+    def finish(self, timer: _IterationTimer) -> None:
+        """Record a finished run and rewrite the metrics file if it's due."""
+        self.iterations[timer.thread_id] = timer.total()
+        self.steps.extend(timer.step_durations)
+        for node, duration in timer.node_durations:
+            self.nodes[node].append(duration)
+        self.unwritten += 1
+        if (self.unwritten >= self.WRITE_EVERY_RUNS or
+                time.perf_counter() - self.last_write >= self.WRITE_INTERVAL):
+            self.write()
+
+    def summary(self) -> Dict[str, Any]:
+        elapsed = time.perf_counter() - self.started
+        return {
+            "iterations": len(self.iterations),
+            "elapsed_time": elapsed,
+            "iterations_per_second": len(self.iterations) / elapsed if elapsed > 0 else 0.0,
+            "iteration_durations": _summarize_durations(list(self.iterations.values())),
+            "step_durations": _summarize_durations(self.steps),
+            "node_durations": {node: _summarize_durations(durations) for node, durations in self.nodes.items()},
+            "thread_durations": self.iterations
+        }
+
+    def write(self) -> None:
+        _write_json_atomically(self.summary(), self.output_file)
+        self.unwritten = 0
+        self.last_write = time.perf_counter()
+
+
+class _SweepManifest:
+    """
+    Keeps track of completed, skipped and failed runs of a sweep, optionally mirrored to a JSON file on disk.
+
+    Failures are written immediately. Completed runs are batched like in :class:`_RunMetrics` - the file is
+    rewritten every `WRITE_EVERY_RUNS` completed runs or `WRITE_INTERVAL` seconds, and once more at the end
+    of the sweep. Resuming doesn't depend on the file, completed threads are read from the checkpointer.
+    """
+    FILENAME = "sweep_manifest.json"
+    WRITE_EVERY_RUNS = _RunMetrics.WRITE_EVERY_RUNS
+    WRITE_INTERVAL = _RunMetrics.WRITE_INTERVAL
+
+    def __init__(self, output_dir: Optional[Union[ExperimentPaths, str]], filename: Optional[str] = None):
+        self.output_file = (os.path.join(_resolve_output_dir(output_dir), filename or self.FILENAME)
+                            if output_dir is not None else None)
+        self.last_write = time.perf_counter()
+        self.unwritten = 0
+        self.completed: List[str] = []
+        self.skipped: List[str] = []
+        self.failed: Dict[str, Dict[str, Any]] = {}
+
+    def complete(self, thread_id: str) -> None:
+        """Record a completed run and rewrite the manifest file if it's due."""
+        self.completed.append(thread_id)
+        self.unwritten += 1
+        if (self.unwritten >= self.WRITE_EVERY_RUNS or
+                time.perf_counter() - self.last_write >= self.WRITE_INTERVAL):
+            self.write()
+
+    def skip(self, thread_id: str) -> None:
+        self.skipped.append(thread_id)
+
+    def fail(self, thread_id: str, iteration: int, attempts: int, error: BaseException) -> None:
+        self.failed[thread_id] = {
+            "iteration": iteration,
+            "attempts": attempts,
+            "error": f"{type(error).__name__}: {error}"
+        }
+        self.write()
+
+    def merge(self, manifest_file: str) -> None:
+        """Add the runs recorded in another manifest file, e.g. the one of a shard."""
+        with open(manifest_file) as file:
+            data = json.load(file)
+        self.completed.extend(data["completed"])
+        self.skipped.extend(data["skipped"])
+        self.failed.update(data["failed"])
+
+    def write(self) -> None:
+        self.unwritten = 0
+        self.last_write = time.perf_counter()
+        if self.output_file is None:
+            return
+        _write_json_atomically({
+            "completed": self.completed,
+            "skipped": self.skipped,
+            "failed": self.failed
+        }, self.output_file)
+
+
+def _print_iteration_header(iteration: int, thread_id: str) -> None:
+    """Print the banner that opens every iteration."""
+    print("#" * 30)
+    print(f"Iteration: {iteration}, Thread_ID {thread_id}")
+    print("#" * 30)
+
+
+def _handle_step(
+        event: Dict[str, Any],
+        step_event: StepEvent,
+        verbosity: str,
+        on_step: Optional[Callable[[StepEvent], None]],
+        step_header: str
+) -> None:
+    """
+    Print and/or forward a single step of a graph run.
+
+    :param event: Raw event streamed by the graph
+    :type event: Dict[str, Any]
+    :param step_event: Structured representation of the step
+    :type step_event: StepEvent
+    :param verbosity: Output level - only "steps" prints the step values
+    :type verbosity: str
+    :param on_step: Optional callback receiving the structured step
+    :type on_step: Optional[Callable[[StepEvent], None]]
+    :param step_header: Header printed before every value of the step
+    :type step_header: str
+    """
+    if on_step is not None:
+        on_step(step_event)
+
+    # Stringifying large states is expensive - only do it when it's going to be printed
+    if verbosity == "steps":
+        for key, value in event.items():
+            if "__end__" not in value:
+                print(step_header)
+                print(value)
+                print("---")
+
+
+def _stream_iteration(
+        graph: CompiledStateGraph,
+        user_input: Optional[Dict[str, Any]],
+        config: Dict[str, Any],
+        iteration: int,
+        thread_id: str,
+        verbosity: str,
+        on_step: Optional[Callable[[StepEvent], None]],
+        metrics: Optional[_RunMetrics]
+) -> None:
+    """
+    Stream a single graph run, handling its steps and recording its timings.
+    `user_input` of None continues the thread from its latest checkpoint.
+    """
+    if metrics is None:
+        events = graph.stream(user_input, config, stream_mode="values")
+        for step_num, event in enumerate(events):
+            _handle_step(event, StepEvent(iteration, thread_id, step_num, event),
+                         verbosity, on_step, f"Step {step_num}:")
+    else:
+        # Node updates are streamed alongside the values to time individual nodes
+        timer = _IterationTimer(thread_id)
+        step_num = 0
+        for mode, event in graph.stream(user_input, config, stream_mode=["values", "updates"]):
+            timer.on_event(mode, event)
+            if mode == "values":
+                _handle_step(event, StepEvent(iteration, thread_id, step_num, event),
+                             verbosity, on_step, f"Step {step_num}:")
+                step_num += 1
+        metrics.finish(timer)
+
+
+async def _astream_iteration(
+        graph: CompiledStateGraph,
+        user_input: Optional[Dict[str, Any]],
+        config: Dict[str, Any],
+        iteration: int,
+        thread_id: str,
+        verbosity: str,
+        on_step: Optional[Callable[[StepEvent], None]],
+        metrics: Optional[_RunMetrics]
+) -> None:
+    """
+    Asynchronous counterpart of :func:`_stream_iteration`.
+    """
+    # Iterations run concurrently, so the thread ID is part of the step header
+    step_num = 0
+    if metrics is None:
+        async for event in graph.astream(user_input, config, stream_mode="values"):
+            _handle_step(event, StepEvent(iteration, thread_id, step_num, event),
+                         verbosity, on_step, f"Thread_ID {thread_id}, Step {step_num}:")
+            step_num += 1
+    else:
+        # Node updates are streamed alongside the values to time individual nodes
+        timer = _IterationTimer(thread_id)
+        async for mode, event in graph.astream(user_input, config, stream_mode=["values", "updates"]):
+            timer.on_event(mode, event)
+            if mode == "values":
+                _handle_step(event, StepEvent(iteration, thread_id, step_num, event),
+                             verbosity, on_step, f"Thread_ID {thread_id}, Step {step_num}:")
+                step_num += 1
+        metrics.finish(timer)
+
+
+def _validate_retries(max_retries: int, retry_backoff: float) -> None:
+    """
+    Validate the retry settings of the graph runners.
+
+    :raises ValueError: If `max_retries` or `retry_backoff` is negative
+    """
+    if max_retries < 0:
+        raise ValueError("max_retries must not be negative")
+    if retry_backoff < 0:
+        raise ValueError("retry_backoff must not be negative")
+
+
+def _run_iterations(
+        graph: CompiledStateGraph,
+        starting_thread_id: int,
+        thread_ids: Iterable[int],
+        user_input_template: Dict[str, Any],
+        recursion_limit: int,
+        verbosity: str,
+        on_step: Optional[Callable[[StepEvent], None]],
+        metrics: Optional[_RunMetrics],
+        manifest: _SweepManifest,
+        resume: bool,
+        max_retries: int,
+        retry_backoff: float
+) -> None:
+    """
+    Run the graph once for every thread ID, see :func:`run_multiple_iterations`.
+    The iteration number of a thread is its position in the sweep starting at `starting_thread_id`.
+    """
+    has_checkpointer = getattr(graph, "checkpointer", None) is not None
+
+    try:
+        for thread_id in thread_ids:
+            iteration = thread_id - starting_thread_id + 1
+            # Generate config for current thread ID
+            current_thread_id = str(thread_id)
+            config = _build_config(current_thread_id, recursion_limit)
+
+            # Create a deep copy of the template for each iteration
+            # This ensures complete isolation of state between runs
+            user_input = copy.deepcopy(user_input_template)
+
+            if resume:
+                status = _thread_status(graph.get_state(config))
+                if status == "completed":
+                    manifest.skip(current_thread_id)
+                    if verbosity != "silent":
+                        print(f"Skipping Thread_ID {current_thread_id} - already completed")
+                    continue
+                if status == "interrupted":
+                    # Continue from the latest checkpoint instead of starting the thread over
+                    user_input = None
+
+            if verbosity != "silent":
+                _print_iteration_header(iteration, current_thread_id)
+
+            attempt = 0
+            while True:
+                try:
+                    _stream_iteration(graph, user_input, config, iteration, current_thread_id,
+                                      verbosity, on_step, metrics)
+                    manifest.complete(current_thread_id)
+                    break
+                except Exception as error:
+                    attempt += 1
+                    if attempt > max_retries:
+                        manifest.fail(current_thread_id, iteration, attempt, error)
+                        if not resume:
+                            raise
+                        if verbosity != "silent":
+                            print(f"Thread_ID {current_thread_id} failed after {attempt} attempt(s): {error}")
+                        break
+                    delay = _retry_delay(retry_backoff, attempt)
+                    if verbosity != "silent":
+                        print(f"Thread_ID {current_thread_id} failed ({error}), retrying in {delay:.1f} s")
+                    time.sleep(delay)
+                    # Continue the partially executed thread instead of adding a second run to it
+                    if has_checkpointer and _thread_status(graph.get_state(config)) == "interrupted":
+                        user_input = None
+    finally:
+        manifest.write()
+        if metrics is not None:
+            metrics.write()
 
 
 def run_multiple_iterations(
@@ -8,7 +471,13 @@ def run_multiple_iterations(
         starting_thread_id: int,
         num_repetitions: int,
         user_input_template: Dict[str, Any],
-        recursion_limit: int = 100
+        recursion_limit: int = 100,
+        verbosity: str = "steps",
+        on_step: Optional[Callable[[StepEvent], None]] = None,
+        output_dir: Optional[Union[ExperimentPaths, str]] = None,
+        resume: bool = False,
+        max_retries: int = 0,
+        retry_backoff: float = 1.0
 ) -> None:
     """
     Run the provided graph `num_repetitions` times, incrementing the thread_id each time.
@@ -24,6 +493,28 @@ def run_multiple_iterations(
     :type user_input_template: Dict[str, Any]
     :param recursion_limit: Maximum recursion depth allowed for each graph run.
     :type recursion_limit: int
+    :param verbosity: Output level - "silent" prints nothing, "progress" prints only the iteration headers,
+                      "steps" (default) additionally prints every step value.
+    :type verbosity: str
+    :param on_step: Optional callback called with a :class:`StepEvent` for every step of every run.
+    :type on_step: Optional[Callable[[StepEvent], None]]
+    :param output_dir: ExperimentPaths instance or directory path - when provided, wall-clock time of every run,
+                       step and node is recorded and summarized (mean, p50/p95/p99, max) in `run_metrics.json`,
+                       which is rewritten every 50 finished runs or 10 seconds and at the end of the sweep.
+                       Outcome of every run is kept in `sweep_manifest.json` - failures are written immediately,
+                       completed runs on the same schedule as the metrics.
+    :type output_dir: Optional[Union[ExperimentPaths, str]]
+    :param resume: If True, thread IDs that already completed in the checkpointer are skipped, interrupted threads
+                   are continued from their latest checkpoint, and runs that still fail after all retries are
+                   recorded in the manifest instead of aborting the sweep. Requires a graph with a checkpointer.
+    :type resume: bool
+    :param max_retries: Number of times a failed run is retried. Retries continue the thread from its latest
+                        checkpoint if the graph has a checkpointer.
+    :type max_retries: int
+    :param retry_backoff: Delay in seconds before the first retry, doubled with every following retry.
+    :type retry_backoff: float
+    :raises ValueError: If the verbosity level or the retry settings are not supported.
+    :raises FileNotFoundError: If `output_dir` does not exist.
 
     **Example**:
 
@@ -48,28 +539,410 @@ def run_multiple_iterations(
         # additional_kwargs={'refusal': None}, response_metadata={'token_usage': {'completion_tokens': 17,
         # 'prompt_tokens': 11, 'total_tokens': 28}})]}
         # ---
+
+        # Collect steps as structured objects, without printing them
+        steps = []
+        run_multiple_iterations(graph, 1, 2, {"messages": [("user", "Tell me a joke")]},
+                                verbosity="silent", on_step=steps.append)
+
+        # Record per node latency in experiments/<name>/reports/run_metrics.json
+        run_multiple_iterations(graph, 1, 100, {"messages": [("user", "Tell me a joke")]},
+                                verbosity="progress", output_dir=exp)
+
+        # Rerunning an interrupted sweep only runs what is missing, retrying failures up to 3 times
+        run_multiple_iterations(graph, 1, 1000, {"messages": [("user", "Tell me a joke")]},
+                                verbosity="progress", output_dir=exp, resume=True, max_retries=3)
     """
-    for i in range(num_repetitions):
-        # Generate config for current thread ID
-        current_thread_id = str(starting_thread_id + i)
-        config = {
-            "configurable": {"thread_id": current_thread_id},
-            "recursion_limit": recursion_limit
-        }
+    _validate_verbosity(verbosity)
+    _validate_retries(max_retries, retry_backoff)
+    metrics = _RunMetrics(output_dir) if output_dir is not None else None
+    manifest = _SweepManifest(output_dir)
+    _run_iterations(graph, starting_thread_id, range(starting_thread_id, starting_thread_id + num_repetitions),
+                    user_input_template, recursion_limit, verbosity, on_step, metrics, manifest,
+                    resume, max_retries, retry_backoff)
+
 
-        # Create a deep copy of the template for each iteration
-        # This ensures complete isolation of state between runs
-        user_input = copy.deepcopy(user_input_template)
+async def arun_multiple_iterations(
+        graph: CompiledStateGraph,
+        starting_thread_id: int,
+        num_repetitions: int,
+        user_input_template: Dict[str, Any],
+        recursion_limit: int = 100,
+        max_concurrency: int = 10,
+        verbosity: str = "steps",
+        on_step: Optional[Callable[[StepEvent], None]] = None,
+        output_dir: Optional[Union[ExperimentPaths, str]] = None,
+        resume: bool = False,
+        max_retries: int = 0,
+        retry_backoff: float = 1.0
+) -> None:
+    """
+    Asynchronous counterpart of :func:`run_multiple_iterations`. Runs the provided graph `num_repetitions` times
+    using `graph.astream`, incrementing the thread_id each time. Up to `max_concurrency` runs are in flight at once,
+    which lets a single process drive many I/O-bound runs without threads.
 
-        print("#" * 30)
-        print(f"Iteration: {i + 1}, Thread_ID {current_thread_id}")
-        print("#" * 30)
+    The graph should be compiled with an async checkpointer, e.g. :meth:`ExperimentPaths.async_memory`.
 
-        # Stream the graph with step tracking
-        events = graph.stream(user_input, config, stream_mode="values")
-        for step_num, event in enumerate(events):
-            for key, value in event.items():
-                if "__end__" not in value:
-                    print(f"Step {step_num}:")
-                    print(value)
-                    print("---")
+    :param graph: The compiled StateGraph to run.
+    :type graph: CompiledStateGraph
+    :param starting_thread_id: The starting thread_id for the graph.
+    :type starting_thread_id: int
+    :param num_repetitions: Number of times to run the graph.
+    :type num_repetitions: int
+    :param user_input_template: The template for user input, which may vary by iteration.
+    :type user_input_template: Dict[str, Any]
+    :param recursion_limit: Maximum recursion depth allowed for each graph run.
+    :type recursion_limit: int
+    :param max_concurrency: Maximum number of graph runs executing at the same time.
+    :type max_concurrency: int
+    :param verbosity: Output level - "silent" prints nothing, "progress" prints only the iteration headers,
+                      "steps" (default) additionally prints every step value.
+    :type verbosity: str
+    :param on_step: Optional callback called with a :class:`StepEvent` for every step of every run.
+    :type on_step: Optional[Callable[[StepEvent], None]]
+    :param output_dir: ExperimentPaths instance or directory path - when provided, wall-clock time of every run,
+                       step and node is recorded and summarized (mean, p50/p95/p99, max) in `run_metrics.json`,
+                       which is rewritten every 50 finished runs or 10 seconds and at the end of the sweep.
+                       Outcome of every run is kept in `sweep_manifest.json` - failures are written immediately,
+                       completed runs on the same schedule as the metrics.
+    :type output_dir: Optional[Union[ExperimentPaths, str]]
+    :param resume: If True, thread IDs that already completed in the checkpointer are skipped, interrupted threads
+                   are continued from their latest checkpoint, and runs that still fail after all retries are
+                   recorded in the manifest instead of aborting the sweep. Requires a graph with a checkpointer.
+    :type resume: bool
+    :param max_retries: Number of times a failed run is retried. Retries continue the thread from its latest
+                        checkpoint if the graph has a checkpointer.
+    :type max_retries: int
+    :param retry_backoff: Delay in seconds before the first retry, doubled with every following retry.
+    :type retry_backoff: float
+    :raises ValueError: If `max_concurrency` is lower than 1, or the verbosity level or the retry settings
+                        are not supported.
+    :raises FileNotFoundError: If `output_dir` does not exist.
+
+    **Example**:
+
+    .. code-block:: python
+
+        async def main():
+            async with exp.async_memory() as memory:
+                graph = graph_builder.compile(checkpointer=memory)
+
+                # Run the graph for 100 iterations, at most 20 of them at the same time
+                await arun_multiple_iterations(graph, 1, 100, {"messages": [("user", "Tell me a joke")]},
+                                               max_concurrency=20)
+
+        asyncio.run(main())
+    """
+    if max_concurrency < 1:
+        raise ValueError("max_concurrency must be at least 1")
+    _validate_verbosity(verbosity)
+    _validate_retries(max_retries, retry_backoff)
+    metrics = _RunMetrics(output_dir) if output_dir is not None else None
+    manifest = _SweepManifest(output_dir)
+    has_checkpointer = getattr(graph, "checkpointer", None) is not None
+
+    semaphore = asyncio.Semaphore(max_concurrency)
+
+    async def run_iteration(i: int) -> None:
+        async with semaphore:
+            # Generate config for current thread ID
+            current_thread_id = str(starting_thread_id + i)
+            config = _build_config(current_thread_id, recursion_limit)
+
+            # Create a deep copy of the template for each iteration
+            # This ensures complete isolation of state between runs
+            user_input = copy.deepcopy(user_input_template)
+
+            if resume:
+                status = _thread_status(await graph.aget_state(config))
+                if status == "completed":
+                    manifest.skip(current_thread_id)
+                    if verbosity != "silent":
+                        print(f"Skipping Thread_ID {current_thread_id} - already completed")
+                    return
+                if status == "interrupted":
+                    # Continue from the latest checkpoint instead of starting the thread over
+                    user_input = None
+
+            if verbosity != "silent":
+                _print_iteration_header(i + 1, current_thread_id)
+
+            attempt = 0
+            while True:
+                try:
+                    await _astream_iteration(graph, user_input, config, i + 1, current_thread_id,
+                                             verbosity, on_step, metrics)
+                    manifest.complete(current_thread_id)
+                    return
+                except Exception as error:
+                    attempt += 1
+                    if attempt > max_retries:
+                        manifest.fail(current_thread_id, i + 1, attempt, error)
+                        if not resume:
+                            raise
+                        if verbosity != "silent":
+                            print(f"Thread_ID {current_thread_id} failed after {attempt} attempt(s): {error}")
+                        return
+                    delay = _retry_delay(retry_backoff, attempt)
+                    if verbosity != "silent":
+                        print(f"Thread_ID {current_thread_id} failed ({error}), retrying in {delay:.1f} s")
+                    await asyncio.sleep(delay)
+                    # Continue the partially executed thread instead of adding a second run to it
+                    if has_checkpointer and _thread_status(await graph.aget_state(config)) == "interrupted":
+                        user_input = None
+
+    tasks = [asyncio.ensure_future(run_iteration(i)) for i in range(num_repetitions)]
+    try:
+        await asyncio.gather(*tasks)
+    except BaseException:
+        # A failed run aborts the sweep - stop the other runs before the manifest and metrics are finalized,
+        # so no checkpoints are written after the runner returned
+        for task in tasks:
+            task.cancel()
+        await asyncio.gather(*tasks, return_exceptions=True)
+        raise
+    finally:
+        manifest.write()
+        if metrics is not None:
+            metrics.write()
+
+
+# Number of shards of an experiment, fixed by its first sharded sweep - kept next to the shard databases
+SHARD_LAYOUT_FILENAME = "shards.json"
+
+
+def _shard_filename(filename: str, shard: int) -> str:
+    """Name of the per shard copy of a runner file - ``run_metrics.json`` of shard 2 is ``run_metrics.2.json``."""
+    stem, extension = os.path.splitext(filename)
+    return f"{stem}.{shard}{extension}"
+
+
+def _read_num_shards(experiment: ExperimentPaths) -> Optional[int]:
+    """Number of shards of the experiment, or None if it wasn't run with :func:`run_sharded_iterations` yet."""
+    layout_file = os.path.join(os.path.dirname(experiment.database), SHARD_LAYOUT_FILENAME)
+    if not os.path.exists(layout_file):
+        return None
+    with open(layout_file) as file:
+        return json.load(file)["num_shards"]
+
+
+def _locate_threads(experiment: ExperimentPaths, num_shards: int) -> Dict[str, int]:
+    """
+    Find the shard every thread already stored in the shard databases of the experiment belongs to.
+
+    :param experiment: Experiment whose shard databases are read
+    :type experiment: ExperimentPaths
+    :param num_shards: Number of shards of the experiment
+    :type num_shards: int
+    :return: Thread IDs mapped to the number of their shard
+    :rtype: Dict[str, int]
+    :raises ValueError: If a shard database doesn't belong to the layout or a thread is stored in more than one shard
+    """
+    shard_numbers = {experiment.get_shard_database(shard): shard for shard in range(num_shards)}
+    locations: Dict[str, int] = {}
+
+    for database in _shard_databases(experiment.database):
+        if database not in shard_numbers:
+            raise ValueError(f"Shard database {database} doesn't belong to the {num_shards} shards of "
+                             f"experiment '{experiment.name}'")
+        conn = _connect(database, read_only=True)
+        try:
+            thread_ids = [row[0] for row in conn.execute("SELECT DISTINCT thread_id FROM checkpoints")]
+        except sqlite3.OperationalError:
+            # The checkpoint tables don't exist until the first checkpoint is saved
+            thread_ids = []
+        finally:
+            conn.close()
+
+        for thread_id in thread_ids:
+            if thread_id in locations:
+                raise ValueError(f"Thread_ID {thread_id} is stored in more than one shard of "
+                                 f"experiment '{experiment.name}'")
+            locations[thread_id] = shard_numbers[database]
+    return locations
+
+
+def _assign_threads(thread_ids: List[int], num_shards: int, locations: Dict[str, int]) -> List[List[int]]:
+    """
+    Split thread IDs across shards. Threads already stored in a shard stay in it, so they are skipped or continued
+    against their own checkpoints; the new ones are split into contiguous ranges, one per shard.
+
+    :return: Thread IDs of every shard
+    :rtype: List[List[int]]
+    """
+    shards: List[List[int]] = [[] for _ in range(num_shards)]
+    new_thread_ids = []
+    for thread_id in thread_ids:
+        if str(thread_id) in locations:
+            shards[locations[str(thread_id)]].append(thread_id)
+        else:
+            new_thread_ids.append(thread_id)
+
+    base, remainder = divmod(len(new_thread_ids), num_shards)
+    start = 0
+    for shard in range(num_shards):
+        shard_size = base + (1 if shard < remainder else 0)
+        shards[shard].extend(new_thread_ids[start:start + shard_size])
+        start += shard_size
+    return [sorted(shard_thread_ids) for shard_thread_ids in shards]
+
+
+def _run_shard(
+        graph_factory: Callable[[SqliteSaver], CompiledStateGraph],
+        shard_database: str,
+        connection_profile: Union[str, Dict[str, Any]],
+        reports_dir: str,
+        shard: int,
+        starting_thread_id: int,
+        thread_ids: List[int],
+        user_input_template: Dict[str, Any],
+        recursion_limit: int,
+        verbosity: str,
+        resume: bool,
+        max_retries: int,
+        retry_backoff: float
+) -> None:
+    """
+    Worker of :func:`run_sharded_iterations` - runs its thread IDs against its own shard database,
+    recording their outcome and timings in the shard's own ``sweep_manifest.<shard>.json``
+    and ``run_metrics.<shard>.json``.
+    """
+    conn = _connect(shard_database, connection_profile)
+    try:
+        graph = graph_factory(SqliteSaver(conn))
+        metrics = _RunMetrics(reports_dir, _shard_filename(_RunMetrics.FILENAME, shard))
+        manifest = _SweepManifest(reports_dir, _shard_filename(_SweepManifest.FILENAME, shard))
+        _run_iterations(graph, starting_thread_id, thread_ids, user_input_template, recursion_limit, verbosity,
+                        None, metrics, manifest, resume, max_retries, retry_backoff)
+    finally:
+        conn.close()
+
+
+def run_sharded_iterations(
+        graph_factory: Callable[[SqliteSaver], CompiledStateGraph],
+        experiment: ExperimentPaths,
+        starting_thread_id: int,
+        num_repetitions: int,
+        user_input_template: Dict[str, Any],
+        num_workers: Optional[int] = None,
+        recursion_limit: int = 100,
+        verbosity: str = "progress",
+        resume: bool = False,
+        max_retries: int = 0,
+        retry_backoff: float = 1.0
+) -> None:
+    """
+    Run the graph `num_repetitions` times split across `num_workers` processes. Every worker runs a disjoint,
+    contiguous range of thread IDs and writes its checkpoints to its own shard database
+    (``db/<name>.<shard>.sqlite``, opened with the experiment's connection profile),
+    so workers never contend for SQLite writes.
+    :func:`export_sqlite_to_jsons` and :func:`prepare_data` read all shards of the experiment.
+
+    The number of shards is fixed by the first sharded sweep of the experiment (stored in ``db/shards.json``).
+    Threads already stored in a shard are always run against that shard, so a resumed sweep skips or continues
+    them no matter how the thread ID range changed. Every shard records its runs in ``sweep_manifest.<shard>.json``
+    and ``run_metrics.<shard>.json`` in the reports directory; the manifests are merged
+    into ``sweep_manifest.json`` at the end of the sweep.
+
+    Compiled graphs can't be sent to other processes, so every worker builds its own graph with `graph_factory`,
+    which receives the shard's checkpointer. The factory has to be picklable - a function defined at module level.
+
+    :param graph_factory: Function returning the compiled graph for the given checkpointer.
+    :type graph_factory: Callable[[SqliteSaver], CompiledStateGraph]
+    :param experiment: Experiment the shard databases are created in.
+    :type experiment: ExperimentPaths
+    :param starting_thread_id: The starting thread_id for the graph.
+    :type starting_thread_id: int
+    :param num_repetitions: Number of times to run the graph in total.
+    :type num_repetitions: int
+    :param user_input_template: The template for user input, which may vary by iteration.
+    :type user_input_template: Dict[str, Any]
+    :param num_workers: Number of worker processes (and shards), defaults to the number of shards of the experiment
+                        if it was already sharded, otherwise to the number of CPUs.
+    :type num_workers: Optional[int]
+    :param recursion_limit: Maximum recursion depth allowed for each graph run.
+    :type recursion_limit: int
+    :param verbosity: Output level of the workers, see :func:`run_multiple_iterations`.
+    :type verbosity: str
+    :param resume: Skip completed threads and record failures instead of aborting, see
+                   :func:`run_multiple_iterations`.
+    :type resume: bool
+    :param max_retries: Number of times a failed run is retried.
+    :type max_retries: int
+    :param retry_backoff: Delay in seconds before the first retry, doubled with every following retry.
+    :type retry_backoff: float
+    :raises ValueError: If `num_workers` is lower than 1 or differs from the number of shards of the experiment,
+                        a thread is stored in more than one shard, or the verbosity level or the retry settings
+                        are not supported.
+
+    **Example**:
+
+    .. code-block:: python
+
+        # Defined at module level, so it can be sent to the worker processes
+        def build_graph(checkpointer):
+            return graph_builder.compile(checkpointer=checkpointer)
+
+        if __name__ == "__main__":
+            exp = create_experiment("linear")
+
+            # 1000 runs split across 4 processes - thread IDs 1-250 go to db/linear.0.sqlite etc.
+            run_sharded_iterations(build_graph, exp, 1, 1000, {"messages": [("user", "Tell me a joke")]},
+                                   num_workers=4)
+
+            # Rerunning the sweep only runs what is missing, with the same 4 shards
+            run_sharded_iterations(build_graph, exp, 1, 1000, {"messages": [("user", "Tell me a joke")]},
+                                   resume=True)
+
+            prepare_data(exp, graph_config)
+    """
+    if num_workers is not None and num_workers < 1:
+        raise ValueError("num_workers must be at least 1")
+    _validate_verbosity(verbosity)
+    _validate_retries(max_retries, retry_backoff)
+
+    num_shards = _read_num_shards(experiment)
+    if num_shards is None:
+        num_shards = num_workers if num_workers is not None else (os.cpu_count() or 1)
+        num_shards = max(1, min(num_shards, num_repetitions))
+        _write_json_atomically({"num_shards": num_shards},
+                               os.path.join(os.path.dirname(experiment.database), SHARD_LAYOUT_FILENAME))
+    elif num_workers is not None and num_workers != num_shards:
+        # Threads would move to other shard databases - rerun there, and exported twice
+        raise ValueError(f"Experiment '{experiment.name}' is sharded across {num_shards} databases, "
+                         f"run it with num_workers={num_shards}")
+
+    thread_ids = list(range(starting_thread_id, starting_thread_id + num_repetitions))
+    shard_thread_ids = _assign_threads(thread_ids, num_shards, _locate_threads(experiment, num_shards))
+    shards = [shard for shard in range(num_shards) if shard_thread_ids[shard]]
+
+    # Manifests of a previous sweep must not be merged into this one
+    shard_manifests = {shard: os.path.join(experiment.reports_dir, _shard_filename(_SweepManifest.FILENAME, shard))
+                       for shard in shards}
+    for manifest_file in shard_manifests.values():
+        if os.path.exists(manifest_file):
+            os.remove(manifest_file)
+
+    with ProcessPoolExecutor(max_workers=max(1, len(shards))) as executor:
+        futures = [
+            executor.submit(
+                _run_shard, graph_factory, experiment.get_shard_database(shard), experiment.connection_profile,
+                experiment.reports_dir, shard, starting_thread_id, shard_thread_ids[shard],
+                user_input_template, recursion_limit, verbosity, resume, max_retries, retry_backoff
+            )
+            for shard in shards
+        ]
+
+    # Manifests of the shards that failed are merged as well, before their error is raised
+    manifest = _SweepManifest(experiment)
+    for manifest_file in shard_manifests.values():
+        if os.path.exists(manifest_file):
+            manifest.merge(manifest_file)
+    manifest.write()
+
+    for future in futures:
+        future.result()
+
+    if verbosity != "silent":
+        print(f"Sharded sweep finished across {len(shards)} shards: {len(manifest.completed)} runs completed, "
+              f"{len(manifest.skipped)} skipped, {len(manifest.failed)} failed")
@@ -3,7 +3,7 @@ import sqlite3
 import json
 import msgpack
 from typing import Dict, Any, Union, Optional
-from .experiment import ExperimentPaths
+from .experiment import ExperimentPaths, _connect, _shard_databases
 
 def _convert(obj):
     """
@@ -40,55 +40,36 @@ def _convert(obj):
         return obj
 
 
-def export_sqlite_to_jsons(source: Union[ExperimentPaths, str], output_folder: Optional[str] = None) -> None:
+def _read_checkpoints(conn: sqlite3.Connection, data_by_thread: Dict[int, list], after_rowid: int = 0,
+                      only_thread: Optional[Any] = None) -> int:
     """
-    Fetch data from the SQLite database and export it as JSON files.
-    Can use either an ExperimentPaths instance or explicit database and output paths.
-
-    :param source: Either an ExperimentPaths instance or a path to the SQLite database
-    :type source: Union[ExperimentPaths, str]
-    :param output_folder: Path to the output folder for JSON files (required if source is a str)
-    :type output_folder: Optional[str]
-
-    **Examples:**
-
-    >>> # Using ExperimentPaths:
-    >>> exp = create_experiment("my_experiment")
-    >>> export_sqlite_to_jsons(exp)
-    JSON file created: experiments/my_experiment/json/thread_1.json
-    JSON file created: experiments/my_experiment/json/thread_2.json
-    JSON file created: experiments/my_experiment/json/thread_3.json
-
-    >>> # Using direct paths:
-    >>> export_sqlite_to_jsons("path/to/db.sqlite", "path/to/output")
-    JSON file created: path/to/output/thread_1.json
-    JSON file created: path/to/output/thread_2.json
-    JSON file created: path/to/output/thread_3.json
+    Read and decode all checkpoints from a single SQLite database, grouping them by thread_ID.
+
+    :param conn: Connection to the SQLite database.
+    :type conn: sqlite3.Connection
+    :param data_by_thread: Dictionary the decoded checkpoints are appended to, keyed by thread_ID.
+    :type data_by_thread: Dict[int, list]
+    :param after_rowid: Only read checkpoints stored after the row with this rowid - used to tail a live database.
+    :type after_rowid: int
+    :param only_thread: Only read the checkpoints of this thread_ID, all threads are read if None.
+    :type only_thread: Optional[Any]
+    :return: Rowid of the last checkpoint read, or after_rowid if there are no new checkpoints.
+    :rtype: int
     """
-
-    # Determine paths based on input type
-    if isinstance(source, ExperimentPaths):
-        db_path = source.database
-        json_dir = source.json_dir
-    else:
-        if output_folder is None:
-            raise ValueError("output_folder must be provided when using a database path directly")
-        db_path = source
-        json_dir = output_folder
-
-    # Połączenie do bazy danych
-    conn = sqlite3.connect(db_path, check_same_thread=False)
     cursor = conn.cursor()
+    last_rowid = after_rowid
 
     try:
-        # Pobieramy dane z tabeli "checkpoints"
-        cursor.execute("SELECT * FROM checkpoints")
+        # Pobieramy dane z tabeli "checkpoints" (w kolejności zapisu)
+        if only_thread is None:
+            cursor.execute("SELECT rowid, * FROM checkpoints WHERE rowid > ? ORDER BY rowid", (after_rowid,))
+        else:
+            cursor.execute("SELECT rowid, * FROM checkpoints WHERE rowid > ? AND thread_id = ? ORDER BY rowid",
+                           (after_rowid, only_thread))
         rows = cursor.fetchall()
 
-        # Słownik do przechowywania danych pogrupowanych według thread_ID
-        data_by_thread: Dict[int, list] = {}
-
-        for row in rows:
+        for rowid, *row in rows:
+            last_rowid = rowid
             thread_id = row[0]
 
             try:
@@ -121,16 +102,84 @@ def export_sqlite_to_jsons(source: Union[ExperimentPaths, str], output_folder: O
                 data_by_thread[thread_id] = []
             data_by_thread[thread_id].append(json_object)
 
-        # Zapisz dane dla każdego thread_ID w osobnym pliku JSON
-        for thread_id, jsons in data_by_thread.items():
-            output_path = os.path.join(json_dir, f"thread_{thread_id}.json")
-            try:
-                with open(output_path, 'w') as json_file:
-                    # Zapisz dane jako JSON
-                    json.dump(jsons, json_file, indent=4)
-                print(f"JSON file created: {output_path}")
-            except Exception as e:
-                print(f"Error writing JSON file for thread_ID {thread_id}: {e}")
-
     finally:
-        conn.close()
\ No newline at end of file
+        cursor.close()
+
+    return last_rowid
+
+
+def export_sqlite_to_jsons(source: Union[ExperimentPaths, str], output_folder: Optional[str] = None) -> None:
+    """
+    Fetch data from the SQLite database and export it as JSON files.
+    Can use either an ExperimentPaths instance or explicit database and output paths.
+    Shard databases written by :func:`run_sharded_iterations` (``name.<shard>.sqlite`` next to the database)
+    are read as well.
+
+    :param source: Either an ExperimentPaths instance or a path to the SQLite database
+    :type source: Union[ExperimentPaths, str]
+    :param output_folder: Path to the output folder for JSON files (required if source is a str)
+    :type output_folder: Optional[str]
+    :raises ValueError: If a thread_ID is stored in more than one of the databases
+
+    **Examples:**
+
+    >>> # Using ExperimentPaths:
+    >>> exp = create_experiment("my_experiment")
+    >>> export_sqlite_to_jsons(exp)
+    JSON file created: experiments/my_experiment/json/thread_1.json
+    JSON file created: experiments/my_experiment/json/thread_2.json
+    JSON file created: experiments/my_experiment/json/thread_3.json
+
+    >>> # Using direct paths:
+    >>> export_sqlite_to_jsons("path/to/db.sqlite", "path/to/output")
+    JSON file created: path/to/output/thread_1.json
+    JSON file created: path/to/output/thread_2.json
+    JSON file created: path/to/output/thread_3.json
+    """
+
+    # Determine paths based on input type
+    # Bazy danych do odczytu - główna baza oraz shardy zapisane przez run_sharded_iterations
+    if isinstance(source, ExperimentPaths):
+        db_paths = source.databases or [source.database]
+        json_dir = source.json_dir
+    else:
+        if output_folder is None:
+            raise ValueError("output_folder must be provided when using a database path directly")
+        shards = _shard_databases(source)
+        db_paths = ([source] if os.path.exists(source) or not shards else []) + shards
+        json_dir = output_folder
+
+    # Słownik do przechowywania danych pogrupowanych według thread_ID
+    data_by_thread: Dict[int, list] = {}
+    # Baza danych, z której pochodzi każdy thread_ID
+    thread_databases: Dict[int, str] = {}
+
+    for path in db_paths:
+        database_data: Dict[int, list] = {}
+        # Jednorazowe połączenie tylko do odczytu - nie blokuje zapisu checkpointów i jest zamykane po eksporcie
+        # (połączenia z puli eksperymentu zostałyby otwarte do końca procesu)
+        profile = source.connection_profile if isinstance(source, ExperimentPaths) else "default"
+        conn = _connect(path, profile, read_only=True)
+        try:
+            _read_checkpoints(conn, database_data)
+        finally:
+            conn.close()
+
+        # Checkpointy jednego wątku z dwóch baz dałyby jeden, błędny przebieg
+        for thread_id, jsons in database_data.items():
+            if thread_id in thread_databases:
+                raise ValueError(f"Thread_ID {thread_id} is stored in both {thread_databases[thread_id]} "
+                                 f"and {path} - the databases can't be merged into one event log")
+            thread_databases[thread_id] = path
+            data_by_thread[thread_id] = jsons
+
+    # Zapisz dane dla każdego thread_ID w osobnym pliku JSON
+    for thread_id, jsons in data_by_thread.items():
+        output_path = os.path.join(json_dir, f"thread_{thread_id}.json")
+        try:
+            with open(output_path, 'w') as json_file:
+                # Zapisz dane jako JSON
+                json.dump(jsons, json_file, indent=4)
+            print(f"JSON file created: {output_path}")
+        except Exception as e:
+            print(f"Error writing JSON file for thread_ID {thread_id}: {e}")
\ No newline at end of file
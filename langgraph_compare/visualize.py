@@ -1,9 +1,18 @@
 import os
+import json
+import base64
+import shutil
+import hashlib
+import urllib.request
+import graphviz
 import pandas as pd
 import pm4py
-from typing import Union
+from concurrent.futures import ThreadPoolExecutor
+from functools import partial
+from typing import Any, Callable, Dict, Optional, Tuple, Union
 from langgraph.graph.state import CompiledStateGraph
-from .analyze import get_mean_act_times
+from pm4py.objects.trie.obj import Trie
+from .analyze import get_mean_act_times, get_dfg_percentiles
 from .experiment import ExperimentPaths
 
 
@@ -19,15 +28,136 @@ def _validate_directory(directory_path: str) -> None:
         raise FileNotFoundError(f"Directory does not exist: {directory_path}")
 
 
-def generate_mermaid(graph: CompiledStateGraph, output_dir: Union[ExperimentPaths, str]) -> None:
+MERMAID_RENDERERS = ("api", "local")
+IMAGE_FORMATS = ("png", "svg")
+
+
+def _validate_image_format(image_format: str) -> None:
+    """
+    Validate that the image format is supported.
+
+    :param image_format: Image format
+    :type image_format: str
+    :raises ValueError: If the image format is not supported
+    """
+    if image_format not in IMAGE_FORMATS:
+        raise ValueError(f"Unknown image format: {image_format}. Expected one of: {', '.join(IMAGE_FORMATS)}")
+
+
+def _validate_percentile(percentile: Optional[int]) -> None:
+    """
+    Validate the percentile of the performance DFG.
+
+    :param percentile: Percentile of the durations, None for the mean
+    :type percentile: Optional[int]
+    :raises ValueError: If the percentile is not between 0 and 100
+    """
+    if percentile is not None and not 0 <= percentile <= 100:
+        raise ValueError(f"percentile must be between 0 and 100, got {percentile}")
+
+
+def _validate_prefix_tree_limits(min_frequency: int, max_depth: Optional[int], top_k: Optional[int]) -> None:
+    """
+    Validate the limits of the prefix tree.
+
+    :param min_frequency: Minimum number of cases sharing a drawn prefix
+    :type min_frequency: int
+    :param max_depth: Maximum depth of the tree, None for unlimited
+    :type max_depth: Optional[int]
+    :param top_k: Number of most frequent variants to draw, None for all
+    :type top_k: Optional[int]
+    :raises ValueError: If any limit is smaller than 1
+    """
+    for name, value in (("min_frequency", min_frequency), ("max_depth", max_depth), ("top_k", top_k)):
+        if value is not None and value < 1:
+            raise ValueError(f"{name} must be at least 1, got {value}")
+
+
+def _graph_structure_hash(graph: CompiledStateGraph) -> str:
+    """
+    Hash of the graph structure - nodes, edges and edge conditions - based on its mermaid definition.
+
+    :param graph: Compiled state graph
+    :type graph: CompiledStateGraph
+    :return: SHA-256 hex digest
+    :rtype: str
+    """
+    return hashlib.sha256(str(graph.get_graph().draw_mermaid()).encode()).hexdigest()
+
+
+def _mermaid_dot(graph: CompiledStateGraph) -> graphviz.Digraph:
+    """
+    Translate the graph structure to Graphviz DOT, mirroring the mermaid drawing: start and end nodes
+    as rounded boxes, conditional edges dashed and labeled with their condition.
+
+    :param graph: Compiled state graph
+    :type graph: CompiledStateGraph
+    :return: DOT representation of the graph
+    :rtype: graphviz.Digraph
+    """
+    drawable = graph.get_graph()
+    dot = graphviz.Digraph("mermaid", graph_attr={"rankdir": "TB", "bgcolor": "white"},
+                           node_attr={"shape": "box", "style": "rounded,filled", "fillcolor": "#f2f0ff",
+                                      "fontname": "Helvetica"})
+
+    for node_id, node in drawable.nodes.items():
+        if node_id == "__start__":
+            dot.node(node_id, node.name, style="rounded", fillcolor="white")
+        elif node_id == "__end__":
+            dot.node(node_id, node.name, fillcolor="#bfb6fc")
+        else:
+            dot.node(node_id, node.name)
+
+    for edge in drawable.edges:
+        attributes = {"style": "dashed"} if edge.conditional else {}
+        if edge.data is not None:
+            attributes["label"] = str(edge.data)
+        dot.edge(edge.source, edge.target, **attributes)
+
+    return dot
+
+
+def _draw_mermaid_svg(graph: CompiledStateGraph) -> bytes:
+    """
+    Render the mermaid diagram as SVG using the mermaid.ink API (LangGraph only supports raster formats).
+
+    :param graph: Compiled state graph
+    :type graph: CompiledStateGraph
+    :return: SVG document
+    :rtype: bytes
+    """
+    encoded = base64.urlsafe_b64encode(graph.get_graph().draw_mermaid().encode("utf-8")).decode("ascii")
+    with urllib.request.urlopen(f"https://mermaid.ink/svg/{encoded}", timeout=10) as response:
+        return response.read()
+
+
+def generate_mermaid(graph: CompiledStateGraph, output_dir: Union[ExperimentPaths, str], renderer: str = "api",
+                     cache_dir: Optional[str] = None, force: bool = False, image_format: str = "png") -> None:
     """
     Generate and save a mermaid graph visualization.
 
+    The "api" renderer draws the mermaid diagram using the remote mermaid.ink API. The "local" renderer translates
+    the graph structure to Graphviz DOT and renders it with the local Graphviz installation, so no network access
+    is needed.
+
+    Renders are keyed by a hash of the graph structure (and the renderer). If the graph didn't change since
+    the image was saved, it isn't rendered again. If ``cache_dir`` is provided, renders are also stored there
+    and shared by every experiment using the same graph.
+
     :param graph: Compiled state graph
     :type graph: CompiledStateGraph
     :param output_dir: ExperimentPaths instance or directory path where visualization will be saved
     :type output_dir: Union[ExperimentPaths, str]
+    :param renderer: Either "api" or "local", defaults to "api"
+    :type renderer: str
+    :param cache_dir: Directory with renders shared across experiments, defaults to None
+    :type cache_dir: Optional[str]
+    :param force: If True, the graph is rendered even if it didn't change
+    :type force: bool
+    :param image_format: Either "png" or "svg", defaults to "png"
+    :type image_format: str
     :raises FileNotFoundError: If the output directory does not exist
+    :raises ValueError: If the renderer or the image format is unknown
 
     **Examples:**
 
@@ -39,7 +169,17 @@ def generate_mermaid(graph: CompiledStateGraph, output_dir: Union[ExperimentPath
     >>> # Using direct path:
     >>> generate_mermaid(graph, "output/visualizations")  # Directory must exist
     Mermaid saved as: output/visualizations/mermaid.png
+
+    >>> # Rendering offline, sharing renders between experiments:
+    >>> generate_mermaid(graph, exp, renderer="local", cache_dir="experiments/.mermaid_cache")
+    Mermaid saved as: experiments/my_experiment/img/mermaid.png
+    >>> generate_mermaid(graph, exp, renderer="local", cache_dir="experiments/.mermaid_cache")
+    Mermaid unchanged, reusing: experiments/my_experiment/img/mermaid.png
     """
+    if renderer not in MERMAID_RENDERERS:
+        raise ValueError(f"Unknown renderer: {renderer}. Expected one of: {', '.join(MERMAID_RENDERERS)}")
+    _validate_image_format(image_format)
+
     if isinstance(output_dir, ExperimentPaths):
         img_dir = output_dir.img_dir
     else:
@@ -48,23 +188,117 @@ def generate_mermaid(graph: CompiledStateGraph, output_dir: Union[ExperimentPath
     _validate_directory(img_dir)
 
     # Create the full file path
-    output_path = os.path.join(img_dir, 'mermaid.png')
+    output_path = os.path.join(img_dir, f'mermaid.{image_format}')
+    # Hash of the graph rendered to output_path, stored next to it
+    hash_path = os.path.join(img_dir, f'.mermaid.{image_format}.sha256')
+
+    structure_hash = hashlib.sha256(
+        f"{renderer}:{image_format}:{_graph_structure_hash(graph)}".encode()
+    ).hexdigest()
+
+    if not force and os.path.exists(output_path) and os.path.exists(hash_path):
+        with open(hash_path) as file:
+            if file.read() == structure_hash:
+                print("Mermaid unchanged, reusing:", output_path)
+                return
+
+    cached_path = os.path.join(cache_dir, f"{structure_hash}.{image_format}") if cache_dir else None
+    if cached_path and not force and os.path.exists(cached_path):
+        shutil.copyfile(cached_path, output_path)
+    else:
+        if renderer == "local":
+            image = _mermaid_dot(graph).pipe(format=image_format)
+        elif image_format == "svg":
+            image = _draw_mermaid_svg(graph)
+        else:
+            image = graph.get_graph().draw_mermaid_png()
+
+        with open(output_path, 'wb') as file:
+            file.write(image)
+
+        if cached_path:
+            os.makedirs(cache_dir, exist_ok=True)
+            shutil.copyfile(output_path, cached_path)
 
-    with open(output_path, 'wb') as file:
-        file.write(graph.get_graph().draw_mermaid_png())
+    with open(hash_path, 'w') as file:
+        file.write(structure_hash)
 
     print("Mermaid saved as:", output_path)
 
 
-def generate_prefix_tree(event_log: pd.DataFrame, output_dir: Union[ExperimentPaths, str]) -> None:
+def _build_prefix_tree(variants: Dict[Tuple[str, ...], int], min_frequency: int = 1,
+                       max_depth: Optional[int] = None, top_k: Optional[int] = None) -> Trie:
+    """
+    Build a pruned prefix tree from the variant table in a single pass over the variants.
+
+    :param variants: Variants mapped to the number of cases following them
+    :type variants: Dict[Tuple[str, ...], int]
+    :param min_frequency: Minimum number of cases sharing a prefix for it to be kept
+    :type min_frequency: int
+    :param max_depth: Maximum depth of the tree, unlimited if None
+    :type max_depth: Optional[int]
+    :param top_k: Number of most frequent variants to include, all if None
+    :type top_k: Optional[int]
+    :return: Root of the prefix tree
+    :rtype: Trie
+    """
+    # Most frequent variants first, ties broken by the variant itself to keep the tree deterministic
+    ranked = sorted(variants.items(), key=lambda item: (-item[1], item[0]))
+    if top_k is not None:
+        ranked = ranked[:top_k]
+
+    # Number of cases passing through every prefix, and number of cases ending at it
+    prefix_counts: Dict[Tuple[str, ...], int] = {}
+    end_counts: Dict[Tuple[str, ...], int] = {}
+    for variant, count in ranked:
+        depth = len(variant) if max_depth is None else min(len(variant), max_depth)
+        for length in range(1, depth + 1):
+            prefix = variant[:length]
+            prefix_counts[prefix] = prefix_counts.get(prefix, 0) + count
+        if depth == len(variant):
+            end_counts[variant] = end_counts.get(variant, 0) + count
+
+    root = Trie()
+    nodes = {(): root}
+    # Shorter prefixes first, so every parent exists before its children.
+    # A prefix is never more frequent than its parent, so pruned prefixes never have kept children.
+    for prefix in sorted(prefix_counts, key=len):
+        if prefix_counts[prefix] < min_frequency:
+            continue
+        parent = nodes[prefix[:-1]]
+        node = Trie(label=prefix[-1], parent=parent, depth=len(prefix),
+                    final=end_counts.get(prefix, 0) >= min_frequency)
+        parent.children.append(node)
+        nodes[prefix] = node
+
+    return root
+
+
+def generate_prefix_tree(event_log: pd.DataFrame, output_dir: Union[ExperimentPaths, str], min_frequency: int = 1,
+                         max_depth: Optional[int] = None, top_k: Optional[int] = None,
+                         image_format: str = "png") -> None:
     """
     Generate and save a prefix tree visualization.
 
+    For large logs with many distinct variants, the tree can be limited to keep the rendering time bounded:
+    prefixes shared by fewer than ``min_frequency`` cases are pruned, the tree is cut at ``max_depth``
+    and only the ``top_k`` most frequent variants are included. The frequencies are computed in a single pass
+    over the variant table of the log.
+
     :param event_log: Event log data
     :type event_log: pd.DataFrame
     :param output_dir: ExperimentPaths instance or directory path where visualization will be saved
     :type output_dir: Union[ExperimentPaths, str]
+    :param min_frequency: Minimum number of cases sharing a prefix for it to be drawn, defaults to 1 (no pruning)
+    :type min_frequency: int
+    :param max_depth: Maximum depth of the tree, defaults to None (unlimited)
+    :type max_depth: Optional[int]
+    :param top_k: Number of most frequent variants to draw, defaults to None (all variants)
+    :type top_k: Optional[int]
+    :param image_format: Either "png" or "svg", defaults to "png"
+    :type image_format: str
     :raises FileNotFoundError: If the output directory does not exist
+    :raises ValueError: If min_frequency, max_depth or top_k is smaller than 1, or the image format is unknown
 
     **Examples:**
 
@@ -76,34 +310,59 @@ def generate_prefix_tree(event_log: pd.DataFrame, output_dir: Union[ExperimentPa
     >>> # Using direct path:
     >>> generate_prefix_tree(event_log, "output/visualizations")  # Directory must exist
     Prefix Tree saved as: output/visualizations/prefix_tree.png
+
+    >>> # Limiting the tree of a large log:
+    >>> generate_prefix_tree(event_log, exp, min_frequency=10, max_depth=15, top_k=50)
+    Prefix Tree saved as: experiments/my_experiment/img/prefix_tree.png
     """
+    _validate_prefix_tree_limits(min_frequency, max_depth, top_k)
+    _validate_image_format(image_format)
+
     if isinstance(output_dir, ExperimentPaths):
         img_dir = output_dir.img_dir
     else:
         img_dir = output_dir
 
     _validate_directory(img_dir)
-    output_path = os.path.join(img_dir, 'prefix_tree.png')
+    output_path = os.path.join(img_dir, f'prefix_tree.{image_format}')
 
     # Generate prefix tree
-    prefix_tree = pm4py.discover_prefix_tree(
-        event_log, activity_key='concept:name', case_id_key='case:concept:name', timestamp_key='time:timestamp'
-    )
+    if min_frequency == 1 and max_depth is None and top_k is None:
+        prefix_tree = pm4py.discover_prefix_tree(
+            event_log, activity_key='concept:name', case_id_key='case:concept:name', timestamp_key='time:timestamp'
+        )
+    else:
+        variants = pm4py.get_variants(
+            event_log, activity_key='concept:name', case_id_key='case:concept:name', timestamp_key='time:timestamp'
+        )
+        prefix_tree = _build_prefix_tree(variants, min_frequency, max_depth, top_k)
 
-    # Save prefix tree visualization
+    # Save prefix tree visualization - the format follows the file extension
     pm4py.save_vis_prefix_tree(prefix_tree, output_path)
     print("Prefix Tree saved as:", output_path)
 
 
-def generate_performance_dfg(event_log: pd.DataFrame, output_dir: Union[ExperimentPaths, str]) -> None:
+def generate_performance_dfg(event_log: pd.DataFrame, output_dir: Union[ExperimentPaths, str],
+                             image_format: str = "png", percentile: Optional[int] = None) -> None:
     """
     Generate and save a visualization of directly-follows graph annotated with performance.
 
+    By default, activities are annotated with their mean service time. If ``percentile`` is provided,
+    frequencies and p50/p95/p99 (and the requested percentile) durations of every edge and activity
+    are computed in one pass (see :func:`get_dfg_percentiles`). The graph is annotated with the requested
+    percentile and all statistics are exported to ``dfg_percentiles.json`` in the reports directory
+    (or next to the image if a directory path is provided).
+
     :param event_log: Event log data
     :type event_log: pd.DataFrame
     :param output_dir: ExperimentPaths instance or directory path where visualization will be saved
     :type output_dir: Union[ExperimentPaths, str]
+    :param image_format: Either "png" or "svg", defaults to "png"
+    :type image_format: str
+    :param percentile: Percentile of the durations to annotate the graph with (e.g. 95), defaults to None (mean)
+    :type percentile: Optional[int]
     :raises FileNotFoundError: If the output directory does not exist
+    :raises ValueError: If the image format is unknown or the percentile is not between 0 and 100
 
     **Examples:**
 
@@ -115,33 +374,143 @@ def generate_performance_dfg(event_log: pd.DataFrame, output_dir: Union[Experime
     >>> # Using direct path:
     >>> generate_performance_dfg(event_log, "output/visualizations")  # Directory must exist
     Performance DFG saved as: output/visualizations/dfg_performance.png
+
+    >>> # Annotated with p95 durations:
+    >>> generate_performance_dfg(event_log, exp, percentile=95)
+    DFG percentiles saved as: experiments/my_experiment/reports/dfg_percentiles.json
+    Performance DFG saved as: experiments/my_experiment/img/dfg_performance.png
     """
+    _validate_image_format(image_format)
+    _validate_percentile(percentile)
+
     if isinstance(output_dir, ExperimentPaths):
         img_dir = output_dir.img_dir
+        report_dir = output_dir.reports_dir
     else:
-        img_dir = output_dir
+        img_dir = report_dir = output_dir
 
     _validate_directory(img_dir)
-    output_path = os.path.join(img_dir, 'dfg_performance.png')
+    output_path = os.path.join(img_dir, f'dfg_performance.{image_format}')
 
-    dfg, start_activities, end_activities = pm4py.discover_dfg(event_log)
-    pm4py.save_vis_performance_dfg(dfg, start_activities, end_activities, output_path,
-                                   serv_time=get_mean_act_times(event_log))
+    if percentile is None:
+        dfg, start_activities, end_activities = pm4py.discover_dfg(event_log)
+        serv_time = get_mean_act_times(event_log)
+    else:
+        _validate_directory(report_dir)
+        statistics = get_dfg_percentiles(event_log, tuple(sorted({50, 95, 99, percentile})))
+
+        # Edge labels show the requested percentile of the time between the activities
+        key = f"p{percentile}"
+        dfg = {edge: stats[key] for edge, stats in statistics["edges"].items()}
+        serv_time = {activity: stats[key] for activity, stats in statistics["activities"].items()}
+        start_activities, end_activities = statistics["start_activities"], statistics["end_activities"]
+
+        percentiles_path = os.path.join(report_dir, 'dfg_percentiles.json')
+        with open(percentiles_path, 'w') as file:
+            json.dump({
+                "edges": [{"source": source, "target": target, **stats}
+                          for (source, target), stats in statistics["edges"].items()],
+                "activities": statistics["activities"],
+                "start_activities": start_activities,
+                "end_activities": end_activities
+            }, file, indent=4)
+        print("DFG percentiles saved as:", percentiles_path)
+
+    pm4py.save_vis_performance_dfg(dfg, start_activities, end_activities, output_path, serv_time=serv_time)
     print("Performance DFG saved as:", output_path)
 
 
+# Every visualization generated by generate_visualizations, in generation order.
+# Each entry takes the event log, the graph, the output directory and the options of generate_visualizations.
+_VISUALIZATIONS: Dict[str, Callable[[pd.DataFrame, CompiledStateGraph, Union[ExperimentPaths, str], Dict[str, Any]],
+                                    None]] = {
+    "mermaid": lambda event_log, graph, output_dir, options: generate_mermaid(
+        graph, output_dir, renderer=options["mermaid_renderer"], cache_dir=options["mermaid_cache_dir"],
+        image_format=options["image_format"]),
+    "prefix_tree": lambda event_log, graph, output_dir, options: generate_prefix_tree(
+        event_log, output_dir, min_frequency=options["prefix_tree_min_frequency"],
+        max_depth=options["prefix_tree_max_depth"], top_k=options["prefix_tree_top_k"],
+        image_format=options["image_format"]),
+    "dfg_performance": lambda event_log, graph, output_dir, options: generate_performance_dfg(
+        event_log, output_dir, image_format=options["image_format"], percentile=options["dfg_percentile"])
+}
+
+
+def _run_visualizations(stages: Dict[str, Callable[[], None]], parallel: bool = False,
+                        max_workers: Optional[int] = None) -> None:
+    """
+    Run visualization stages one after another, or concurrently in a thread pool.
+
+    :param stages: Stage names mapped to the functions generating them, in generation order
+    :type stages: Dict[str, Callable[[], None]]
+    :param parallel: If True, the stages run concurrently
+    :type parallel: bool
+    :param max_workers: Maximum number of concurrent stages, defaults to one per stage
+    :type max_workers: Optional[int]
+    :raises RuntimeError: In parallel mode, if any stage failed - the message lists every failed one
+    """
+    if not parallel:
+        for stage in stages.values():
+            stage()
+        return
+
+    with ThreadPoolExecutor(max_workers=max_workers or len(stages)) as executor:
+        futures = {name: executor.submit(stage) for name, stage in stages.items()}
+
+    # Collected in generation order, so the report doesn't depend on which stage finished first
+    errors = {name: future.exception() for name, future in futures.items() if future.exception() is not None}
+    if errors:
+        details = "\n".join(f"  {name}: {type(error).__name__}: {error}" for name, error in errors.items())
+        raise RuntimeError(f"Failed to generate {len(errors)} of {len(futures)} visualizations:\n{details}") \
+            from next(iter(errors.values()))
+
+
 def generate_visualizations(event_log: pd.DataFrame, graph: CompiledStateGraph,
-                            output_dir: Union[ExperimentPaths, str]) -> None:
+                            output_dir: Union[ExperimentPaths, str], parallel: bool = False,
+                            max_workers: Optional[int] = None, mermaid_renderer: str = "api",
+                            mermaid_cache_dir: Optional[str] = None, image_format: str = "png",
+                            dfg_percentile: Optional[int] = None, prefix_tree_min_frequency: int = 1,
+                            prefix_tree_max_depth: Optional[int] = None,
+                            prefix_tree_top_k: Optional[int] = None) -> None:
     """
     Generate and save all process visualizations.
 
+    In parallel mode the visualizations are generated concurrently in a thread pool. Only the rendering and I/O
+    overlap - the Graphviz subprocesses, the mermaid rendering API and file writes. The pm4py discovery
+    of the prefix tree and the DFG is CPU-bound Python code holding the GIL, so it still runs one at a time.
+    Every visualization writes its own file, so the outputs are the same as in sequential mode. A failing
+    visualization doesn't stop the others; all failures are reported together once every visualization finished.
+
     :param event_log: Event log data
     :type event_log: pd.DataFrame
     :param graph: Compiled state graph
     :type graph: CompiledStateGraph
     :param output_dir: ExperimentPaths instance or directory path where visualizations will be saved
     :type output_dir: Union[ExperimentPaths, str]
+    :param parallel: If True, the visualizations are rendered concurrently
+    :type parallel: bool
+    :param max_workers: Maximum number of concurrent renders in parallel mode, defaults to one per visualization
+    :type max_workers: Optional[int]
+    :param mermaid_renderer: Renderer of the mermaid graph, "api" or "local" - see :func:`generate_mermaid`
+    :type mermaid_renderer: str
+    :param mermaid_cache_dir: Directory with mermaid renders shared across experiments - see :func:`generate_mermaid`
+    :type mermaid_cache_dir: Optional[str]
+    :param image_format: Format of every visualization, "png" or "svg" - SVG keeps large graphs small and sharp
+    :type image_format: str
+    :param dfg_percentile: Percentile of the durations to annotate the performance DFG with (e.g. 95),
+                           defaults to None (mean) - see :func:`generate_performance_dfg`
+    :type dfg_percentile: Optional[int]
+    :param prefix_tree_min_frequency: Minimum number of cases sharing a prefix of the prefix tree,
+                                      defaults to 1 (no pruning) - see :func:`generate_prefix_tree`
+    :type prefix_tree_min_frequency: int
+    :param prefix_tree_max_depth: Maximum depth of the prefix tree, defaults to None (unlimited)
+    :type prefix_tree_max_depth: Optional[int]
+    :param prefix_tree_top_k: Number of most frequent variants in the prefix tree, defaults to None (all variants)
+    :type prefix_tree_top_k: Optional[int]
     :raises FileNotFoundError: If the output directory does not exist
+    :raises ValueError: If the image format is unknown, the percentile is not between 0 and 100
+                        or a prefix tree limit is smaller than 1
+    :raises RuntimeError: In parallel mode, if any visualization failed - the message lists every failed one
 
     **Examples:**
 
@@ -161,11 +530,30 @@ def generate_visualizations(event_log: pd.DataFrame, graph: CompiledStateGraph,
     Prefix Tree saved as: output/visualizations/prefix_tree.png
     Performance DFG saved as: output/visualizations/dfg_performance.png
     All visualizations generated successfully!
+
+    >>> # Rendering concurrently:
+    >>> generate_visualizations(event_log, graph, exp, parallel=True)
+    Generating all visualizations...
+    Performance DFG saved as: experiments/my_experiment/img/dfg_performance.png
+    Prefix Tree saved as: experiments/my_experiment/img/prefix_tree.png
+    Mermaid saved as: experiments/my_experiment/img/mermaid.png
+    All visualizations generated successfully!
     """
+    _validate_directory(output_dir.img_dir if isinstance(output_dir, ExperimentPaths) else output_dir)
+
+    _validate_image_format(image_format)
+    _validate_percentile(dfg_percentile)
+    _validate_prefix_tree_limits(prefix_tree_min_frequency, prefix_tree_max_depth, prefix_tree_top_k)
+    options = {"mermaid_renderer": mermaid_renderer, "mermaid_cache_dir": mermaid_cache_dir,
+               "image_format": image_format, "dfg_percentile": dfg_percentile,
+               "prefix_tree_min_frequency": prefix_tree_min_frequency, "prefix_tree_max_depth": prefix_tree_max_depth,
+               "prefix_tree_top_k": prefix_tree_top_k}
+
     print("Generating all visualizations...")
 
-    generate_mermaid(graph, output_dir)
-    generate_prefix_tree(event_log, output_dir)
-    generate_performance_dfg(event_log, output_dir)
+    _run_visualizations({
+        name: partial(visualize, event_log, graph, output_dir, options)
+        for name, visualize in _VISUALIZATIONS.items()
+    }, parallel, max_workers)
 
-    print("All visualizations generated successfully!")
\ No newline at end of file
+    print("All visualizations generated successfully!")
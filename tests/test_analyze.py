@@ -11,7 +11,9 @@ from langgraph_compare.analyze import (
     get_durations, print_durations,
     get_avg_duration, print_avg_duration,
     get_self_dist_witnesses, print_self_dist_witnesses,
+    get_dfg_percentiles, print_dfg_percentiles,
     print_analysis)
+import pm4py
 
 def test_get_starts(sample_event_log):
     """
@@ -502,4 +504,43 @@ def test_print_analysis(sample_event_log, capsys):
     ]
 
     for section in required_sections:
-        assert section in captured.out, f"print_analysis output missing required section: '{section}'"
\ No newline at end of file
+        assert section in captured.out, f"print_analysis output missing required section: '{section}'"
+
+def test_get_dfg_percentiles(sample_event_log):
+    """
+    Test the `get_dfg_percentiles` function to verify frequencies match pm4py's DFG and percentiles are ordered.
+
+    :param sample_event_log: Sample event log data for testing
+    :type sample_event_log: pandas.DataFrame
+    :raises AssertionError: If frequencies differ from pm4py or percentiles are not ordered
+    """
+    result = get_dfg_percentiles(sample_event_log)
+    dfg, start_activities, end_activities = pm4py.discover_dfg(sample_event_log)
+
+    assert {edge: stats['count'] for edge, stats in result['edges'].items()} == dict(dfg)
+    assert result['start_activities'] == dict(start_activities)
+    assert result['end_activities'] == dict(end_activities)
+
+    for stats in list(result['edges'].values()) + list(result['activities'].values()):
+        assert stats['p50'] <= stats['p95'] <= stats['p99']
+
+    # The median duration of a single execution is its duration
+    chart_generator = sample_event_log[sample_event_log['concept:name'] == 'ChartGenerator'].iloc[0]
+    expected = (chart_generator['end_timestamp'] - chart_generator['timestamp']).total_seconds()
+    assert result['activities']['ChartGenerator'] == {'count': 1, 'p50': expected, 'p95': expected, 'p99': expected}
+
+def test_print_dfg_percentiles(sample_event_log, capsys):
+    """
+    Test the `print_dfg_percentiles` function to verify it prints activity and edge percentiles.
+
+    :param sample_event_log: Sample event log data for testing
+    :type sample_event_log: pandas.DataFrame
+    :param capsys: Pytest fixture to capture stdout and stderr
+    :type capsys: pytest.CaptureFixture
+    """
+    print_dfg_percentiles(sample_event_log, percentiles=(90,))
+    captured = capsys.readouterr()
+    assert "Duration percentiles of every activity:" in captured.out
+    assert "Duration percentiles of every edge:" in captured.out
+    assert "Edge '__start__' -> 'test_supervisor'" in captured.out
+    assert "p90" in captured.out and "p95" not in captured.out
@@ -2,6 +2,7 @@ from pathlib import Path
 import filecmp
 import json
 import glob
+import threading
 from unittest.mock import Mock, MagicMock
 from typing import List, TypedDict, Annotated
 from langgraph.graph.state import CompiledStateGraph
@@ -126,4 +127,147 @@ def test_generate_artifacts_with_paths(
     # Verify visualizations were generated
     assert (output_dir / "mermaid.png").exists(), "Mermaid diagram not created"
     assert (output_dir / "prefix_tree.png").exists(), "Prefix tree not created"
-    assert (output_dir / "dfg_performance.png").exists(), "Performance DFG not created"
\ No newline at end of file
+    assert (output_dir / "dfg_performance.png").exists(), "Performance DFG not created"
+
+def test_generate_artifacts_skips_unchanged_stages(setup_cleanup: Path, sample_event_log, monkeypatch):
+    """Test that generate_artifacts reuses artifacts whose inputs didn't change, unless forced"""
+    output_dir = setup_cleanup / "analysis_output"
+    output_dir.mkdir(parents=True, exist_ok=True)
+
+    mock_graph = Mock(spec=CompiledStateGraph)
+    mock_internal_graph = MagicMock()
+    mock_internal_graph.draw_mermaid.return_value = "graph TD;\n\t__start__ --> agent;"
+    mock_internal_graph.draw_mermaid_png.return_value = b'mock_png_data'
+    mock_graph.get_graph.return_value = mock_internal_graph
+
+    # Record the visualization calls instead of rendering them with Graphviz
+    calls = []
+
+    def fake_visualization(filename):
+        def render(event_log, output, **options):
+            calls.append(filename)
+            (Path(output) / filename).write_bytes(b'mock_png_data')
+        return render
+
+    monkeypatch.setattr("langgraph_compare.artifacts.generate_prefix_tree", fake_visualization("prefix_tree.png"))
+    monkeypatch.setattr("langgraph_compare.artifacts.generate_performance_dfg",
+                        fake_visualization("dfg_performance.png"))
+
+    generate_artifacts(sample_event_log, mock_graph, str(output_dir))
+    assert calls == ["prefix_tree.png", "dfg_performance.png"]
+    assert mock_internal_graph.draw_mermaid_png.call_count == 1
+
+    # Same inputs - every stage is a hit
+    generate_artifacts(sample_event_log.copy(), mock_graph, str(output_dir))
+    assert calls == ["prefix_tree.png", "dfg_performance.png"]
+    assert mock_internal_graph.draw_mermaid_png.call_count == 1
+
+    # Changed event log - only the event log based stages run again
+    generate_artifacts(sample_event_log.iloc[:-1], mock_graph, str(output_dir))
+    assert calls == ["prefix_tree.png", "dfg_performance.png"] * 2
+    assert mock_internal_graph.draw_mermaid_png.call_count == 1
+
+    # Missing output or force - the stage runs again
+    (output_dir / "mermaid.png").unlink()
+    generate_artifacts(sample_event_log.iloc[:-1], mock_graph, str(output_dir))
+    assert mock_internal_graph.draw_mermaid_png.call_count == 2
+    generate_artifacts(sample_event_log.iloc[:-1], mock_graph, str(output_dir), force=True)
+    assert calls == ["prefix_tree.png", "dfg_performance.png"] * 3
+    assert mock_internal_graph.draw_mermaid_png.call_count == 3
+
+
+def test_generate_artifacts_parallel(setup_cleanup: Path, sample_event_log, monkeypatch):
+    """Test that the parallel mode generates every visualization concurrently and records all of them in the cache"""
+    output_dir = setup_cleanup / "analysis_output"
+    output_dir.mkdir(parents=True, exist_ok=True)
+
+    mock_graph = Mock(spec=CompiledStateGraph)
+    mock_internal_graph = MagicMock()
+    mock_internal_graph.draw_mermaid.return_value = "graph TD;\n\t__start__ --> agent;"
+    mock_internal_graph.draw_mermaid_png.return_value = b'mock_png_data'
+    mock_graph.get_graph.return_value = mock_internal_graph
+
+    # Both visualizations have to be in flight at the same time to pass the barrier
+    barrier = threading.Barrier(2, timeout=5)
+
+    def fake_visualization(filename):
+        def render(event_log, output, **options):
+            barrier.wait()
+            (Path(output) / filename).write_bytes(b'mock_png_data')
+        return render
+
+    monkeypatch.setattr("langgraph_compare.artifacts.generate_prefix_tree", fake_visualization("prefix_tree.png"))
+    monkeypatch.setattr("langgraph_compare.artifacts.generate_performance_dfg",
+                        fake_visualization("dfg_performance.png"))
+
+    generate_artifacts(sample_event_log, mock_graph, str(output_dir), parallel=True)
+
+    with open(output_dir / "artifact_cache.json") as f:
+        assert set(json.load(f)) == {"metrics_report", "sequences_report", "mermaid", "prefix_tree",
+                                     "dfg_performance"}
+
+
+def test_generate_artifacts_dfg_percentile(setup_cleanup: Path, sample_event_log, monkeypatch):
+    """Test that the DFG percentile is passed through and that changing it regenerates the performance DFG"""
+    output_dir = setup_cleanup / "analysis_output"
+    output_dir.mkdir(parents=True, exist_ok=True)
+
+    mock_graph = Mock(spec=CompiledStateGraph)
+    mock_internal_graph = MagicMock()
+    mock_internal_graph.draw_mermaid.return_value = "graph TD;\n\t__start__ --> agent;"
+    mock_internal_graph.draw_mermaid_png.return_value = b'mock_png_data'
+    mock_graph.get_graph.return_value = mock_internal_graph
+
+    percentiles = []
+
+    def fake_dfg(event_log, output, image_format="png", percentile=None):
+        percentiles.append(percentile)
+        (Path(output) / f"dfg_performance.{image_format}").write_bytes(b'mock_png_data')
+        if percentile is not None:
+            (Path(output) / "dfg_percentiles.json").write_text("{}")
+
+    monkeypatch.setattr("langgraph_compare.artifacts.generate_prefix_tree",
+                        lambda event_log, output, **options: (Path(output) / "prefix_tree.png").write_bytes(b''))
+    monkeypatch.setattr("langgraph_compare.artifacts.generate_performance_dfg", fake_dfg)
+
+    generate_artifacts(sample_event_log, mock_graph, str(output_dir))
+    generate_artifacts(sample_event_log, mock_graph, str(output_dir), dfg_percentile=95)
+    generate_artifacts(sample_event_log, mock_graph, str(output_dir), dfg_percentile=95)
+    assert percentiles == [None, 95]
+
+    # The percentile statistics are an output of the stage - a missing file regenerates it
+    (output_dir / "dfg_percentiles.json").unlink()
+    generate_artifacts(sample_event_log, mock_graph, str(output_dir), dfg_percentile=95)
+    generate_artifacts(sample_event_log, mock_graph, str(output_dir), dfg_percentile=50)
+    assert percentiles == [None, 95, 95, 50]
+
+
+def test_generate_artifacts_prefix_tree_limits(setup_cleanup: Path, sample_event_log, monkeypatch):
+    """Test that the prefix tree limits are passed through and that changing them regenerates the prefix tree"""
+    output_dir = setup_cleanup / "analysis_output"
+    output_dir.mkdir(parents=True, exist_ok=True)
+
+    mock_graph = Mock(spec=CompiledStateGraph)
+    mock_internal_graph = MagicMock()
+    mock_internal_graph.draw_mermaid.return_value = "graph TD;\n\t__start__ --> agent;"
+    mock_internal_graph.draw_mermaid_png.return_value = b'mock_png_data'
+    mock_graph.get_graph.return_value = mock_internal_graph
+
+    limits = []
+
+    def fake_prefix_tree(event_log, output, min_frequency=1, max_depth=None, top_k=None, image_format="png"):
+        limits.append((min_frequency, max_depth, top_k))
+        (Path(output) / f"prefix_tree.{image_format}").write_bytes(b'mock_png_data')
+
+    monkeypatch.setattr("langgraph_compare.artifacts.generate_prefix_tree", fake_prefix_tree)
+    monkeypatch.setattr("langgraph_compare.artifacts.generate_performance_dfg",
+                        lambda event_log, output, **options: (Path(output) / "dfg_performance.png").write_bytes(b''))
+
+    generate_artifacts(sample_event_log, mock_graph, str(output_dir))
+    generate_artifacts(sample_event_log, mock_graph, str(output_dir), prefix_tree_min_frequency=2,
+                       prefix_tree_max_depth=5, prefix_tree_top_k=10)
+    generate_artifacts(sample_event_log, mock_graph, str(output_dir), prefix_tree_min_frequency=2,
+                       prefix_tree_max_depth=5, prefix_tree_top_k=10)
+    generate_artifacts(sample_event_log, mock_graph, str(output_dir), prefix_tree_min_frequency=2,
+                       prefix_tree_max_depth=5, prefix_tree_top_k=3)
+    assert limits == [(1, None, None), (2, 5, 10), (2, 5, 3)]
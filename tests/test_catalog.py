@@ -0,0 +1,104 @@
+import os
+import shutil
+from pathlib import Path
+from concurrent.futures import ProcessPoolExecutor
+
+from langgraph_compare import create_experiment, prepare_data, get_experiments
+from langgraph_compare.catalog import _update_catalog
+from langgraph_compare.create_html import _ArchitectureComparisonReport
+from langgraph_compare.experiment import ExperimentPaths
+
+
+def test_catalog_tracks_experiment_pipeline(setup_cleanup: Path, project_root: Path, sample_db_path, graph_config):
+    """
+    Test that creating an experiment and preparing its data is reflected in the catalog.
+    """
+    exp = create_experiment("cataloged")
+    create_experiment("empty")
+
+    experiments = get_experiments()
+    assert set(experiments) == {"cataloged", "empty"}
+    assert experiments["cataloged"]["case_count"] == 0
+    assert experiments["cataloged"]["stale"] is False
+
+    shutil.copy(project_root / sample_db_path, exp.database)
+    prepare_data(exp, graph_config)
+
+    entry = get_experiments()["cataloged"]
+    assert entry["path"] == exp.root
+    assert entry["case_count"] == 3
+    assert entry["databases"] == 1
+    assert entry["db_size"] > 0
+    assert "created" in entry and "data_updated" in entry
+    # Data was prepared, but no artifacts were generated yet
+    assert entry["stale"] is True
+
+
+def test_compare_resolves_experiments_from_catalog(setup_cleanup: Path):
+    """
+    Test that compare resolves experiment names from the catalog of the base directory.
+    """
+    exp = create_experiment("moved", base_dir="custom")
+
+    report = _ArchitectureComparisonReport({"moved": "moved"}, base_dir="custom")
+    assert report.infra_dirs["moved"].reports_dir == str(Path(exp.reports_dir))
+
+
+def _update_entries(base_dir: str, names: list) -> None:
+    """Update the catalog entries of the given experiments - run in a separate process."""
+    for name in names:
+        _update_catalog(ExperimentPaths(name, base_dir))
+
+
+def test_catalog_concurrent_processes(setup_cleanup: Path):
+    """
+    Test that processes updating the catalog at the same time don't overwrite each other's entries.
+    """
+    names = [[f"exp_{worker}_{i}" for i in range(10)] for worker in range(4)]
+    with ProcessPoolExecutor(max_workers=4) as executor:
+        for future in [executor.submit(_update_entries, "experiments", worker_names) for worker_names in names]:
+            future.result()
+
+    assert set(get_experiments()) == {name for worker_names in names for name in worker_names}
+    assert not [name for name in os.listdir("experiments") if name.endswith(".tmp")]
+
+
+def test_corrupt_catalog_is_rebuilt(setup_cleanup: Path, capsys):
+    """
+    Test that a truncated catalog doesn't prevent creating an experiment.
+    """
+    create_experiment("first")
+    with open("experiments/catalog.json", "w") as f:
+        f.write('{"first": {"name": "fi')
+
+    create_experiment("second")
+
+    assert "Warning: catalog" in capsys.readouterr().out
+    assert set(get_experiments()) == {"first", "second"}
+    assert get_experiments()["first"]["path"] == os.path.join("experiments", "first")
+
+
+def test_windows_catalog_lock_backs_off(setup_cleanup: Path, monkeypatch):
+    """
+    Test that the Windows lock retries a non-blocking lock with growing delays instead of spinning.
+    """
+    from types import SimpleNamespace
+    from langgraph_compare import catalog
+
+    calls = []
+    delays = []
+
+    def locking(fileno, mode, length):
+        calls.append(mode)
+        if mode == "nblock" and calls.count("nblock") < 4:
+            raise OSError("locked by another process")
+
+    monkeypatch.setattr(catalog, "fcntl", None)
+    monkeypatch.setattr(catalog, "msvcrt", SimpleNamespace(LK_NBLCK="nblock", LK_UNLCK="unlock", locking=locking),
+                        raising=False)
+    monkeypatch.setattr(catalog.time, "sleep", delays.append)
+
+    with catalog._locked_catalog(str(setup_cleanup / "experiments")):
+        assert calls == ["nblock"] * 4
+    assert calls[-1] == "unlock"
+    assert delays == [0.01, 0.02, 0.04]
@@ -0,0 +1,139 @@
+import os
+import gzip
+import shutil
+import sqlite3
+import msgpack
+import filecmp
+import pytest
+from pathlib import Path
+from typing import TypedDict
+from langgraph.graph import StateGraph, START, END
+from langgraph.checkpoint.sqlite import SqliteSaver
+
+from langgraph_compare import compact_database, export_sqlite_to_jsons, export_jsons_to_csv
+
+
+def test_compact_database_preserves_event_log(setup_cleanup: Path, project_root: Path, sample_db_path, graph_config):
+    """
+    Test that compaction shrinks the database, archives the original rows,
+    and that the event log rebuilt from the compacted database is unchanged.
+    """
+    db_path = setup_cleanup / "files.sqlite"
+    shutil.copy(project_root / sample_db_path, db_path)
+
+    # Export before compaction
+    json_before = setup_cleanup / "json_before"
+    csv_before = setup_cleanup / "csv_before"
+    json_before.mkdir()
+    csv_before.mkdir()
+    export_sqlite_to_jsons(str(db_path), str(json_before))
+    export_jsons_to_csv(str(json_before), graph_config, str(csv_before))
+
+    result = compact_database(str(db_path), str(json_before), archive=True)
+
+    assert result["checkpoints"] == 149
+    assert result["writes"] == 284
+    assert result["bytes_after"] < result["bytes_before"]
+
+    with sqlite3.connect(db_path) as conn:
+        assert conn.execute("SELECT COUNT(*) FROM writes").fetchone()[0] == 0
+        checkpoint = msgpack.loads(conn.execute("SELECT checkpoint FROM checkpoints LIMIT 1").fetchone()[0])
+    assert checkpoint["channel_values"] == {}
+    assert "ts" in checkpoint
+
+    # All original rows are in the archive
+    with gzip.open(setup_cleanup / "files.archive.msgpack.gz", "rb") as archive_file:
+        tables = [table for table, _ in msgpack.Unpacker(archive_file, raw=False)]
+    assert tables.count("checkpoints") == 149
+    assert tables.count("writes") == 284
+
+    # Export after compaction produces the same event log
+    json_after = setup_cleanup / "json_after"
+    csv_after = setup_cleanup / "csv_after"
+    json_after.mkdir()
+    csv_after.mkdir()
+    export_sqlite_to_jsons(str(db_path), str(json_after))
+    export_jsons_to_csv(str(json_after), graph_config, str(csv_after))
+
+    assert filecmp.cmp(csv_before / "csv_output.csv", csv_after / "csv_output.csv", shallow=False)
+
+    # Compacting again is a no-op
+    assert compact_database(str(db_path), str(json_before))["checkpoints"] == 0
+
+
+def test_compact_database_only_exported_threads(setup_cleanup: Path, project_root: Path, sample_db_path):
+    """
+    Test that only threads exported to JSON are compacted.
+    """
+    db_path = setup_cleanup / "files.sqlite"
+    shutil.copy(project_root / sample_db_path, db_path)
+    json_dir = setup_cleanup / "json"
+    json_dir.mkdir()
+    export_sqlite_to_jsons(str(db_path), str(json_dir))
+    os.remove(json_dir / "thread_2.json")
+
+    compact_database(str(db_path), str(json_dir))
+
+    with sqlite3.connect(db_path) as conn:
+        remaining_writes = {row[0] for row in conn.execute("SELECT DISTINCT thread_id FROM writes")}
+    assert remaining_writes == {"2"}
+
+
+class State(TypedDict):
+    value: str
+
+
+def test_compact_database_skips_unfinished_threads(setup_cleanup: Path):
+    """
+    Test that exported threads whose run failed or was interrupted keep their state and can still be continued.
+    """
+    def node(state: State) -> State:
+        return {"value": state["value"] + "!"}
+
+    failing_threads = {"2"}
+
+    def flaky(state: State, config) -> State:
+        if config["configurable"]["thread_id"] in failing_threads:
+            raise RuntimeError("failed")
+        return {"value": state["value"] + "!"}
+
+    builder = StateGraph(State)
+    builder.add_node("first", node)
+    builder.add_node("second", flaky)
+    builder.add_edge(START, "first")
+    builder.add_edge("first", "second")
+    builder.add_edge("second", END)
+
+    db_path = setup_cleanup / "unfinished.sqlite"
+    conn = sqlite3.connect(db_path, check_same_thread=False)
+    try:
+        memory = SqliteSaver(conn)
+        graph = builder.compile(checkpointer=memory)
+        graph.invoke({"value": "run"}, {"configurable": {"thread_id": "1"}})
+        # Thread 2 fails in its second node, thread 3 is interrupted before it
+        with pytest.raises(RuntimeError):
+            graph.invoke({"value": "run"}, {"configurable": {"thread_id": "2"}})
+        builder.compile(checkpointer=memory, interrupt_before=["second"]).invoke(
+            {"value": "run"}, {"configurable": {"thread_id": "3"}})
+
+        json_dir = setup_cleanup / "json"
+        json_dir.mkdir()
+        export_sqlite_to_jsons(str(db_path), str(json_dir))
+        assert len(os.listdir(json_dir)) == 3
+
+        # Without the graph, the failed thread is kept based on its pending writes
+        compact_database(str(db_path), str(json_dir), thread_ids=["1", "2"])
+        assert graph.get_state({"configurable": {"thread_id": "1"}}).values == {}
+        assert graph.get_state({"configurable": {"thread_id": "2"}}).values == {"value": "run!"}
+        with conn:
+            assert conn.execute("SELECT COUNT(*) FROM writes WHERE thread_id = '2'").fetchone()[0] > 0
+
+        # With the graph, the interrupted thread is kept based on its next nodes
+        compact_database(str(db_path), str(json_dir), graph=graph)
+        failing_threads.clear()
+        for thread_id in ["2", "3"]:
+            config = {"configurable": {"thread_id": thread_id}}
+            assert graph.get_state(config).next == ("second",)
+            assert graph.invoke(None, config) == {"value": "run!!"}
+    finally:
+        conn.close()
@@ -26,4 +26,236 @@ def test_generated_report_matches_reference(test_infrastructure, reference_html,
         content = re.sub(r'file://[^"\']+', '', content)
         return content.strip()
 
-    assert normalize_html(generated_content) == normalize_html(reference_html)
\ No newline at end of file
+    assert normalize_html(generated_content) == normalize_html(reference_html)
+
+def test_report_embeds_svg_images(test_infrastructure, setup_cleanup):
+    """Test that SVG visualizations are embedded and preferred over PNGs of the same name."""
+    from urllib.parse import quote
+    from langgraph_compare.create_html import _ArchitectureComparisonReport
+
+    svg = '<svg xmlns="http://www.w3.org/2000/svg" width="10" height="10"><rect width="10" height="10"/></svg>'
+    (test_infrastructure / "img" / "mermaid.svg").write_text(svg)
+
+    report = _ArchitectureComparisonReport({"test1": str(test_infrastructure)},
+                                           output_dir=str(setup_cleanup / "output"))
+    report.load_data()
+    images = report.images_data["test1"]
+
+    assert list(images) == ["dfg_performance", "mermaid", "prefix_tree"]
+    assert images["mermaid"] == f"data:image/svg+xml;charset=utf-8,{quote(svg)}"
+    assert images["prefix_tree"].startswith("data:image/png;base64,")
+
+
+def test_report_links_images_lazily(test_infrastructure, setup_cleanup):
+    """Test that images are copied next to the report and lazily loaded when not embedded."""
+    output_dir = setup_cleanup / "output"
+    compare({"test1": str(test_infrastructure)}, output_dir=str(output_dir), embed_images=False)
+
+    html = (output_dir / "test1.html").read_text()
+    assert "data:image/png;base64" not in html
+
+    from langgraph_compare.create_html import _ArchitectureComparisonReport
+    folder = _ArchitectureComparisonReport._infra_folder("test1")
+    assets_dir = output_dir / "test1_files" / folder
+    for img_file in (test_infrastructure / "img").glob("*.png"):
+        assert (assets_dir / img_file.name).read_bytes() == img_file.read_bytes()
+        assert f'src="test1_files/{folder}/{img_file.name}"' in html
+    assert html.count('loading="lazy"') == len(list(assets_dir.iterdir()))
+
+    # Images of removed visualizations are removed from the assets folder
+    (test_infrastructure / "img" / "mermaid.png").unlink()
+    compare({"test1": str(test_infrastructure)}, output_dir=str(output_dir), embed_images=False)
+    assert not (assets_dir / "mermaid.png").exists()
+
+
+def test_compare_reuses_unchanged_infrastructures(test_infrastructure, setup_cleanup, capsys):
+    """Test that only infrastructures whose reports or images changed are reloaded."""
+    import os
+    import shutil
+
+    second = setup_cleanup / "experiments/test2"
+    shutil.copytree(test_infrastructure, second)
+    infrastructures = {"test1": str(test_infrastructure), "test2": str(second)}
+    output_dir = setup_cleanup / "output"
+
+    compare(infrastructures, output_dir=str(output_dir))
+    first_report = (output_dir / "test1_vs_test2.html").read_text()
+    out = capsys.readouterr().out
+    assert "Cache miss: test1" in out and "Cache miss: test2" in out
+
+    # Only the changed infrastructure is reloaded, and the report stays the same
+    metrics = second / "reports" / "metrics_report.json"
+    stat = metrics.stat()
+    os.utime(metrics, ns=(stat.st_atime_ns, stat.st_mtime_ns + 10**9))
+    compare(infrastructures, output_dir=str(output_dir))
+    out = capsys.readouterr().out
+    assert "Cache hit: test1" in out and "Cache miss: test2" in out
+    assert (output_dir / "test1_vs_test2.html").read_text() == first_report
+
+    compare(infrastructures, output_dir=str(output_dir), force=True)
+    out = capsys.readouterr().out
+    assert "Cache miss: test1" in out and "Cache miss: test2" in out
+
+
+def test_report_paginates_sequences(test_infrastructure, reference_sequences, setup_cleanup):
+    """Test that paginated sequences are embedded as compact JSON instead of rendered rows."""
+    import json
+    import re
+
+    output_dir = setup_cleanup / "output"
+    compare({"test1": str(test_infrastructure)}, output_dir=str(output_dir), paginate_sequences=True)
+    html = (output_dir / "test1.html").read_text()
+
+    assert "Case ID of last occurrence" not in html.split("<script", 1)[0]
+    embedded = re.search(r'<script type="application/json" id="sequences-data"[^>]*>(.*?)</script>', html, re.S)
+    (data,) = json.loads(embedded.group(1))
+
+    # Activities are stored once and referenced by index, sequences are sorted by probability
+    assert len(data["activities"]) == len(set(data["activities"]))
+    decoded = sorted(
+        [case_id, [data["activities"][step] for step in steps], probability]
+        for case_id, probability, steps in data["sequences"]
+    )
+    assert decoded == sorted(reference_sequences["sequence_probabilities"])
+
+
+def test_report_styles_are_inlined(test_infrastructure, setup_cleanup, project_root):
+    """Test that the report loads nothing from the network and every class used has an inlined style."""
+    import re
+
+    output_dir = setup_cleanup / "output"
+    compare({"test1": str(test_infrastructure)}, output_dir=str(output_dir), paginate_sequences=True)
+    html = (output_dir / "test1.html").read_text(encoding="utf-8")
+    assert not re.search(r'<(script|link)[^>]+(src|href)="https?://', html)
+
+    # Classes set by the templates and by the scripts
+    classes = set()
+    for template in (project_root / "langgraph_compare/templates").rglob("*.html"):
+        content = template.read_text(encoding="utf-8")
+        for value in re.findall(r'class="([^"{]*)"', content) + re.findall(r"className = '([^']*)'", content) \
+                + re.findall(r"classList\.add\('([^']*)'\)", content):
+            classes.update(value.split())
+
+    styles = "".join(re.findall(r"<style>(.*?)</style>", html, re.S))
+    defined = {selector.replace("\\", "") for selector in re.findall(r"\.((?:[\w-]|\\:)+)", styles)}
+    assert classes - defined == set()
+
+
+def test_comparisons_generated_concurrently(test_infrastructure, setup_cleanup):
+    """Test that comparisons formatted in parallel threads don't share the formatting context."""
+    import json
+    import shutil
+    from concurrent.futures import ThreadPoolExecutor
+    from langgraph_compare.create_html import _ArchitectureComparisonReport, _MetricsFormatter
+
+    # Second infrastructure with doubled activity counts - different rework percentages
+    second = setup_cleanup / "experiments/test2"
+    shutil.copytree(test_infrastructure, second)
+    metrics_path = second / "reports" / "metrics_report.json"
+    metrics = json.loads(metrics_path.read_text())
+    metrics["activities_count"] = {activity: count * 2 for activity, count in metrics["activities_count"].items()}
+    metrics_path.write_text(json.dumps(metrics))
+
+    def load(path, output):
+        report = _ArchitectureComparisonReport({"infra": str(path)}, output_dir=str(setup_cleanup / output))
+        report.load_data()
+        return report.infrastructures_data["infra"]["main_report"]["rework_counts"]
+
+    expected = [load(test_infrastructure, "serial1"), load(second, "serial2")]
+    assert expected[0] != expected[1]
+
+    with ThreadPoolExecutor(max_workers=8) as executor:
+        futures = [executor.submit(load, path, f"parallel{i}")
+                   for i in range(16) for path in (test_infrastructure, second)]
+        assert [future.result() for future in futures] == expected * 16
+
+    # Without a context, reworks are formatted without percentages
+    assert _MetricsFormatter.format_metric("rework_counts", {"a": 2}) == {"a": "2"}
+
+
+def test_summary_layout(test_infrastructure, setup_cleanup, capsys):
+    """Test the ranked summary with hashed report name and incrementally generated detail pages."""
+    import json
+    import os
+    import re
+    import shutil
+    import pytest
+    from langgraph_compare.create_html import _ArchitectureComparisonReport
+
+    # Seven architectures, with average durations 7, 6, ..., 1 s
+    infrastructures = {}
+    for i in range(7):
+        path = setup_cleanup / f"experiments/arch_{i}"
+        shutil.copytree(test_infrastructure, path)
+        metrics_path = path / "reports" / "metrics_report.json"
+        metrics = json.loads(metrics_path.read_text())
+        metrics["avg_graph_duration"] = 7.0 - i
+        metrics_path.write_text(json.dumps(metrics))
+        infrastructures[f"arch_{i}"] = str(path)
+
+    output_dir = setup_cleanup / "output"
+    compare(infrastructures, output_dir=str(output_dir), layout="summary")
+    assert "Detail pages: 7 generated, 0 unchanged" in capsys.readouterr().out
+
+    # Too many names for the file name - the report is named by their hash
+    (report_path,) = output_dir.glob("*.html")
+    assert re.fullmatch(r"comparison_[0-9a-f]{12}\.html", report_path.name)
+
+    # Ranked by the average duration, linking to the detail pages
+    html = report_path.read_text(encoding="utf-8")
+    links = re.findall(r'<a href="([^"]+)"', html)
+    assert links == [f"{report_path.stem}_files/{_ArchitectureComparisonReport._infra_folder(f'arch_{i}')}.html"
+                     for i in reversed(range(7))]
+    for link in links:
+        page = (output_dir / link).read_text(encoding="utf-8")
+        assert f'href="../{report_path.name}"' in page
+
+    # Only the detail page of the changed architecture is generated again
+    metrics_path = setup_cleanup / "experiments/arch_3/reports/metrics_report.json"
+    stat = metrics_path.stat()
+    os.utime(metrics_path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 10**9))
+    compare(infrastructures, output_dir=str(output_dir), layout="summary", rank_by="cases")
+    assert "Detail pages: 1 generated, 6 unchanged" in capsys.readouterr().out
+
+    with pytest.raises(ValueError):
+        _ArchitectureComparisonReport(infrastructures, output_dir=str(output_dir), rank_by="unknown")
+    with pytest.raises(ValueError):
+        _ArchitectureComparisonReport(infrastructures, output_dir=str(output_dir), layout="unknown")
+
+
+def test_report_filename_and_infra_folders(setup_cleanup):
+    """Test that only summaries of many or overly long names are hashed, and that infrastructure folders are unique."""
+    from langgraph_compare.create_html import _ArchitectureComparisonReport
+
+    names = {f"arch_{i}": str(setup_cleanup / f"arch_{i}") for i in range(7)}
+    output_dir = str(setup_cleanup / "output")
+
+    # Side by side columns keep the readable name, the summary of many architectures is hashed
+    columns = _ArchitectureComparisonReport(names, output_dir=output_dir)
+    assert columns.generate_report_filename() == "_vs_".join(names) + ".html"
+    summary = _ArchitectureComparisonReport(names, output_dir=output_dir, layout="summary")
+    assert summary.generate_report_filename().startswith("comparison_")
+
+    # Names too long for a file name are hashed in any layout
+    long_names = {name * 20: path for name, path in list(names.items())[:2]}
+    assert _ArchitectureComparisonReport(long_names, output_dir=output_dir).generate_report_filename() \
+        .startswith("comparison_")
+
+    # Names that sanitize to the same string still get their own folders
+    assert _ArchitectureComparisonReport._infra_folder("a/b") != _ArchitectureComparisonReport._infra_folder("a_b")
+    assert _ArchitectureComparisonReport._infra_folder("a/b").startswith("a_b_")
+
+
+def test_summary_counts_all_sequences():
+    """Test that the distinct sequences column counts every sequence, not only those left after the cutoffs."""
+    from langgraph_compare.create_html import _summarize
+
+    sequences_data = {
+        "start_activities": {"__start__": 10},
+        "end_activities": {"end": 10},
+        "distinct_sequences": 7,
+        "sequence_probabilities": [[1, ["__start__", "end"], 0.4], [2, ["__start__", "a", "end"], 0.3]]
+    }
+    summary = _summarize({"activities_count": {"__start__": 10, "end": 10}}, sequences_data)
+    assert summary["sequences"] == 7
+    assert summary["cases"] == 10
@@ -49,4 +49,135 @@ def test_generate_reports(sample_event_log, reference_metrics, reference_sequenc
     # Check sequences report
     sequences_file = test_dir / "sequences_report.json"
     with open(sequences_file) as f:
-        assert json.load(f) == reference_sequences
\ No newline at end of file
+        assert json.load(f) == reference_sequences
+
+def test_shared_analysis_matches_analyze_functions(sample_event_log):
+    """Test that the shared analysis of both reports returns the same values as the analyze functions."""
+    import pandas as pd
+    import pm4py
+    from langgraph_compare.analyze import (get_act_counts, get_global_act_reworks, get_mean_act_times,
+                                           get_avg_duration, get_starts, get_ends, get_sequence_probs)
+    from langgraph_compare.create_report import _analyze_event_log, _iter_sequence_probabilities
+
+    # More cases and variants - a repeated case, and a case with some events missing
+    columns = ['case_id', 'timestamp', 'end_timestamp', 'cost', 'activity', 'org:resource']
+    base = sample_event_log[columns]
+    repeated = base.assign(case_id=base['case_id'] + 10)
+    shortened = base[base.index % 3 != 0].assign(case_id=base['case_id'] + 20)
+    event_log = pm4py.format_dataframe(pd.concat([base, repeated, shortened], ignore_index=True),
+                                       case_id='case_id', activity_key='activity', timestamp_key='timestamp')
+    original = event_log.copy()
+
+    analysis = _analyze_event_log(event_log)
+
+    # The event log is not modified
+    pd.testing.assert_frame_equal(event_log, original)
+
+    metrics = {key: analysis["metrics"][key] for key in
+               ("activities_count", "rework_counts", "activities_mean_service_time", "avg_graph_duration")}
+    assert metrics == {
+        "activities_count": get_act_counts(original.copy()),
+        "rework_counts": get_global_act_reworks(original.copy()),
+        "activities_mean_service_time": get_mean_act_times(original.copy()),
+        "avg_graph_duration": get_avg_duration(original.copy())
+    }
+    assert analysis["sequences"]["start_activities"] == get_starts(original.copy())
+    assert analysis["sequences"]["end_activities"] == get_ends(original.copy())
+    assert list(_iter_sequence_probabilities(analysis["sequences"])) == get_sequence_probs(original.copy())
+
+
+def test_metrics_report_distributions_and_case_table(sample_event_log, setup_cleanup):
+    """Test the duration distributions of the metrics report and the optional per-case table."""
+    import pandas as pd
+
+    test_dir = setup_cleanup / "reports"
+    test_dir.mkdir(exist_ok=True)
+
+    write_metrics_report(sample_event_log, str(test_dir), case_table=True)
+
+    with open(test_dir / "metrics_report.json") as f:
+        metrics = json.load(f)
+
+    case_table = pd.read_csv(test_dir / "case_table.csv")
+    assert list(case_table.columns) == ["case_id", "events", "reworks", "start", "duration"]
+    assert case_table["events"].sum() == len(sample_event_log)
+    assert case_table["reworks"].sum() == sum(metrics["rework_counts"].values())
+
+    # Case distribution agrees with the per-case table and the mean
+    distribution = metrics["case_duration_distribution"]
+    assert distribution["min"] == case_table["duration"].min()
+    assert distribution["max"] == case_table["duration"].max()
+    assert distribution["min"] <= distribution["p50"] <= distribution["p90"] <= distribution["p99"] \
+           <= distribution["max"]
+    assert abs(case_table["duration"].mean() - metrics["avg_graph_duration"]) < 1e-9
+
+    assert set(metrics["activities_duration_distribution"]) == set(metrics["activities_count"])
+    for activity, stats in metrics["activities_duration_distribution"].items():
+        assert stats["min"] <= stats["p50"] <= stats["max"]
+
+
+def test_sequences_report_cutoffs(sample_event_log, reference_sequences, setup_cleanup):
+    """Test the streamed sequences report with top_k and min_probability cutoffs."""
+    test_dir = setup_cleanup / "reports"
+    test_dir.mkdir(exist_ok=True)
+    sequences_file = test_dir / "sequences_report.json"
+
+    # Every sequence is written on its own line
+    write_sequences_report(sample_event_log, str(test_dir))
+    lines = sequences_file.read_text().splitlines()
+    for case_id, sequence, probability in reference_sequences["sequence_probabilities"]:
+        assert f"        {json.dumps([case_id, sequence, probability])}," in lines \
+               or f"        {json.dumps([case_id, sequence, probability])}" in lines
+
+    # Equal probabilities - ties are broken by the lower case ID
+    write_sequences_report(sample_event_log, str(test_dir), top_k=2)
+    with open(sequences_file) as f:
+        report = json.load(f)
+    assert report["sequence_probabilities"] == reference_sequences["sequence_probabilities"][:2]
+    # The count covers every sequence, not only the listed ones
+    assert report["distinct_sequences"] == len(reference_sequences["sequence_probabilities"])
+    assert report["start_activities"] == reference_sequences["start_activities"]
+
+    write_sequences_report(sample_event_log, str(test_dir), min_probability=0.5)
+    with open(sequences_file) as f:
+        assert json.load(f)["sequence_probabilities"] == []
+
+
+def test_sequence_cutoffs_validated_before_analysis(sample_event_log, setup_cleanup, monkeypatch):
+    """Test that invalid cutoffs are rejected before the event log is analyzed."""
+    import pytest
+
+    test_dir = setup_cleanup / "reports"
+    test_dir.mkdir(exist_ok=True)
+
+    def fail_analysis(event_log):
+        raise AssertionError("the event log was analyzed")
+
+    monkeypatch.setattr("langgraph_compare.create_report._analyze_event_log", fail_analysis)
+
+    with pytest.raises(ValueError):
+        write_sequences_report(sample_event_log, str(test_dir), top_k=0)
+    with pytest.raises(ValueError):
+        write_sequences_report(sample_event_log, str(test_dir), min_probability=1.5)
+    with pytest.raises(ValueError):
+        generate_reports(sample_event_log, str(test_dir), sequences_top_k=0)
+
+
+def test_select_sequences_consumes_lazily():
+    """Test that the cutoffs consume the sequences one at a time instead of requiring a materialized list."""
+    from langgraph_compare.create_report import _select_sequences
+
+    consumed = []
+
+    def generate():
+        for case_id in range(1, 6):
+            consumed.append(case_id)
+            yield case_id, ("a",) * case_id, case_id / 15
+
+    # Without top_k the sequences are passed on as they are generated
+    selected = iter(_select_sequences(generate(), min_probability=0.2))
+    assert next(selected) == (3, ("a",) * 3, 0.2)
+    assert consumed == [1, 2, 3]
+
+    # With top_k only the best k are kept, ordered by case ID
+    assert [item[0] for item in _select_sequences(generate(), top_k=2)] == [4, 5]
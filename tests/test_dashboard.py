@@ -0,0 +1,127 @@
+import json
+import shutil
+import sqlite3
+import urllib.error
+import urllib.request
+import pytest
+from langgraph_compare.dashboard import DashboardServer
+from langgraph_compare.sql_to_jsons import export_sqlite_to_jsons
+from langgraph_compare.jsons_to_csv import export_jsons_to_csv
+from langgraph_compare.load_events import load_event_log
+from langgraph_compare.create_report import _analyze_event_log
+
+
+def test_dashboard_tails_database(sample_db_path, graph_config, project_root, setup_cleanup):
+    """Test that the dashboard picks up new checkpoints and matches the metrics of the full pipeline."""
+    # Database of a run in progress - the third thread hasn't been saved yet
+    database = setup_cleanup / "live.sqlite"
+    shutil.copy2(project_root / sample_db_path, database)
+    conn = sqlite3.connect(database)
+    conn.execute("CREATE TABLE pending AS SELECT * FROM checkpoints WHERE thread_id = '3' ORDER BY rowid")
+    conn.execute("DELETE FROM checkpoints WHERE thread_id = '3'")
+    conn.commit()
+
+    dashboard = DashboardServer({"live": str(database)}, graph_config, port=0)
+    try:
+        log = dashboard.logs["live"]
+        assert log.poll() == 2
+        assert dashboard.metrics()["live"]["cases"] == 2
+        assert log.poll() == 0
+
+        # Only the thread with new checkpoints is updated
+        conn.execute("INSERT INTO checkpoints SELECT * FROM pending")
+        conn.commit()
+        assert log.poll() == 1
+    finally:
+        dashboard.httpd.server_close()
+        conn.close()
+
+    # Same metrics as the reports generated from the finished run
+    json_dir, csv_dir = setup_cleanup / "json", setup_cleanup / "csv"
+    json_dir.mkdir()
+    csv_dir.mkdir()
+    export_sqlite_to_jsons(str(database), str(json_dir))
+    export_jsons_to_csv(str(json_dir), graph_config, str(csv_dir))
+    expected = _analyze_event_log(load_event_log(str(csv_dir / "csv_output.csv")))["metrics"]
+
+    metrics = log.metrics()
+    assert metrics["cases"] == 3
+    assert metrics["activities_count"] == expected["activities_count"]
+    assert metrics["rework_counts"] == expected["rework_counts"]
+    assert metrics["avg_graph_duration"] == pytest.approx(expected["avg_graph_duration"])
+    assert metrics["activities_mean_service_time"] == pytest.approx(expected["activities_mean_service_time"])
+    assert metrics["case_duration_distribution"] == pytest.approx(expected["case_duration_distribution"])
+
+
+def test_dashboard_serves_pages(sample_db_path, graph_config, project_root, setup_cleanup):
+    """Test the auto-refreshing page and the raw metrics served by the dashboard."""
+    database = setup_cleanup / "live.sqlite"
+    shutil.copy2(project_root / sample_db_path, database)
+
+    dashboard = DashboardServer({"live": str(database)}, graph_config, port=0, poll_interval=0.1, refresh=3)
+    dashboard.poll()
+    dashboard.start()
+    try:
+        with urllib.request.urlopen(dashboard.url) as response:
+            page = response.read().decode("utf-8")
+        assert '<meta http-equiv="refresh" content="3">' in page
+        assert "Live Dashboard" in page and "cases_per_minute" in page
+
+        with urllib.request.urlopen(f"{dashboard.url}metrics.json") as response:
+            assert json.load(response)["live"]["cases"] == 3
+
+        with pytest.raises(urllib.error.HTTPError):
+            urllib.request.urlopen(f"{dashboard.url}missing")
+    finally:
+        dashboard.stop()
+
+
+def test_dashboard_keeps_only_unfinished_checkpoints(sample_db_path, graph_config, project_root, setup_cleanup):
+    """Test that finished threads drop their checkpoints and that rewritten checkpoints are not counted twice."""
+    database = setup_cleanup / "live.sqlite"
+    shutil.copy2(project_root / sample_db_path, database)
+    conn = sqlite3.connect(database)
+    # The third thread is still running - its last checkpoint hasn't been saved yet
+    conn.execute("CREATE TABLE pending AS SELECT * FROM checkpoints WHERE thread_id = '3' "
+                 "AND checkpoint_id = (SELECT MAX(checkpoint_id) FROM checkpoints WHERE thread_id = '3')")
+    conn.execute("DELETE FROM checkpoints WHERE rowid IN (SELECT c.rowid FROM checkpoints c JOIN pending p "
+                 "ON c.thread_id = p.thread_id AND c.checkpoint_id = p.checkpoint_id)")
+    conn.commit()
+
+    dashboard = DashboardServer({"live": str(database)}, graph_config, port=0)
+    try:
+        log = dashboard.logs["live"]
+        assert log.poll() == 3
+        assert set(log.finished) == {"1", "2"}
+        assert set(log.checkpoints) == {"3"}
+        metrics = log.metrics()
+
+        # A checkpoint stored again gets a new rowid - it replaces its previous copy
+        conn.execute("INSERT OR REPLACE INTO checkpoints SELECT * FROM checkpoints WHERE thread_id = '1' "
+                     "ORDER BY checkpoint_id LIMIT 1")
+        conn.execute("INSERT OR REPLACE INTO checkpoints SELECT * FROM checkpoints WHERE thread_id = '3' "
+                     "ORDER BY checkpoint_id LIMIT 1")
+        conn.commit()
+        assert log.poll() == 0
+        assert log.metrics() == metrics
+
+        # The table is rewritten with new rowids (as VACUUM may do) - it is read again without counting
+        # anything twice
+        conn.execute("CREATE TABLE rewritten AS SELECT * FROM checkpoints ORDER BY thread_id DESC, checkpoint_id")
+        conn.execute("DELETE FROM checkpoints")
+        conn.execute("INSERT INTO checkpoints SELECT * FROM rewritten")
+        conn.commit()
+        conn.execute("VACUUM")
+        assert log.poll() == 0
+        assert log.metrics() == metrics
+
+        # The last checkpoint of the third thread finishes it
+        conn.execute("INSERT INTO checkpoints SELECT * FROM pending")
+        conn.commit()
+        assert log.poll() == 1
+        assert set(log.finished) == {"1", "2", "3"}
+        assert log.checkpoints == {}
+        assert log.metrics()["cases"] == 3
+    finally:
+        dashboard.httpd.server_close()
+        conn.close()
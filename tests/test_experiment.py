@@ -1,4 +1,7 @@
 import os
+import pytest
+import sqlite3
+import threading
 from pathlib import Path
 from langgraph_compare import create_experiment, ExperimentPaths
 
@@ -59,4 +62,87 @@ def test_create_experiment_paths_validation(setup_cleanup: Path):
     assert os.path.exists(temp_base / "json")
     assert os.path.exists(temp_base / "csv")
     assert os.path.exists(temp_base / "img")
-    assert os.path.exists(temp_base / "reports")
\ No newline at end of file
+    assert os.path.exists(temp_base / "reports")
+
+def test_tuned_connection_profile(setup_cleanup: Path):
+    """
+    Test that the tuned connection profile is applied to the experiment database connection.
+    """
+    paths = create_experiment("tuned_test", connection_profile="tuned")
+    conn = paths.connection
+
+    assert conn.execute("PRAGMA journal_mode").fetchone()[0] == "wal"
+    # NORMAL
+    assert conn.execute("PRAGMA synchronous").fetchone()[0] == 1
+    assert conn.execute("PRAGMA busy_timeout").fetchone()[0] == 5000
+    assert conn.execute("PRAGMA cache_size").fetchone()[0] == -65536
+
+
+def test_unknown_connection_profile(setup_cleanup: Path):
+    """
+    Test that an unknown connection profile is rejected before the experiment folder is created.
+    """
+    with pytest.raises(ValueError):
+        create_experiment("unknown_profile", connection_profile="fastest")
+
+    assert not os.path.exists(setup_cleanup / "experiments" / "unknown_profile")
+
+
+def test_custom_connection_profile_validated(setup_cleanup: Path):
+    """
+    Test that PRAGMA names and values of a custom profile are validated before they reach SQL.
+    """
+    paths = create_experiment("custom_profile", connection_profile={"Journal_Mode": "wal", "busy_timeout": 250})
+    assert paths.connection.execute("PRAGMA journal_mode").fetchone()[0] == "wal"
+    assert paths.connection.execute("PRAGMA busy_timeout").fetchone()[0] == 250
+
+    invalid_profiles = [
+        {"journal_mode=OFF; DROP TABLE checkpoints; --": "WAL"},
+        {"journal_mode": "WAL; DROP TABLE checkpoints"},
+        {"busy_timeout": "5000"},
+        {"cache_size": 1.5},
+        {"busy_timeout": True}
+    ]
+    for profile in invalid_profiles:
+        with pytest.raises(ValueError):
+            create_experiment("invalid_profile", connection_profile=profile)
+    assert not os.path.exists(setup_cleanup / "experiments" / "invalid_profile")
+
+
+def test_read_only_readers(setup_cleanup: Path):
+    """
+    Test that readers are read-only, reused per thread, separate across threads,
+    and can read while the writer holds an open write transaction.
+    """
+    paths = create_experiment("reader_test", connection_profile="tuned")
+    writer = paths.connection
+    writer.execute("CREATE TABLE items (value INTEGER)")
+    writer.execute("INSERT INTO items VALUES (1)")
+    writer.commit()
+
+    reader = paths.get_reader()
+    assert paths.get_reader() is reader
+
+    with pytest.raises(sqlite3.OperationalError):
+        reader.execute("INSERT INTO items VALUES (2)")
+
+    # Uncommitted write keeps the write lock - readers still see the last committed state
+    writer.execute("INSERT INTO items VALUES (3)")
+    other_thread_readers = []
+
+    def read_in_thread():
+        thread_reader = paths.get_reader()
+        other_thread_readers.append(thread_reader)
+        other_thread_readers.append(thread_reader.execute("SELECT COUNT(*) FROM items").fetchone()[0])
+
+    thread = threading.Thread(target=read_in_thread)
+    thread.start()
+    thread.join()
+
+    assert other_thread_readers[0] is not reader
+    assert other_thread_readers[1] == 1
+    writer.commit()
+
+    paths.close_readers()
+    with pytest.raises(sqlite3.ProgrammingError):
+        reader.execute("SELECT 1")
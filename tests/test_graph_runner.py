@@ -1,4 +1,20 @@
-from langgraph_compare.graph_runner import run_multiple_iterations
+import asyncio
+import json
+import os
+import sqlite3
+import pytest
+from typing import TypedDict
+from langgraph.graph import StateGraph, START, END
+from langgraph.checkpoint.memory import MemorySaver
+
+from langgraph_compare import create_experiment, export_sqlite_to_jsons
+from langgraph_compare.graph_runner import (run_multiple_iterations, arun_multiple_iterations, run_sharded_iterations,
+                                           StepEvent, _IterationTimer, _RunMetrics, _SweepManifest)
+
+
+class State(TypedDict):
+    value: str
+
 
 def test_run_graph_iterations(mock_state_graph, capsys):
     """
@@ -46,6 +62,405 @@ def test_run_graph_iterations(mock_state_graph, capsys):
         "configurable": {"thread_id": str(starting_thread_id + 1)},
         "recursion_limit": recursion_limit
     }
-    mock_state_graph.stream.assert_any_call(user_input_template, expected_config1)
-    mock_state_graph.stream.assert_any_call(user_input_template, expected_config2)
-    assert mock_state_graph.stream.call_count == num_repetitions, f"Expected {num_repetitions} calls to stream(), but got {mock_state_graph.stream.call_count}"
\ No newline at end of file
+    mock_state_graph.stream.assert_any_call(user_input_template, expected_config1, stream_mode="values")
+    mock_state_graph.stream.assert_any_call(user_input_template, expected_config2, stream_mode="values")
+    assert mock_state_graph.stream.call_count == num_repetitions, f"Expected {num_repetitions} calls to stream(), but got {mock_state_graph.stream.call_count}"
+
+def test_run_multiple_iterations_silent_with_callback(mock_state_graph, capsys):
+    """
+    Test that silent mode prints nothing while the `on_step` callback still receives every step.
+    """
+    steps = []
+
+    run_multiple_iterations(graph=mock_state_graph, starting_thread_id=3, num_repetitions=2,
+                            user_input_template={"input_key": "input_value"}, verbosity="silent",
+                            on_step=steps.append)
+
+    captured = capsys.readouterr()
+    assert captured.out == ""
+
+    # 3 streamed events per run, 2 runs
+    assert len(steps) == 6
+    assert steps[0] == StepEvent(iteration=1, thread_id="3", step=0, values={"event_1": "output_1"})
+    assert steps[-1] == StepEvent(iteration=2, thread_id="4", step=2, values={"event_3": "__end__"})
+
+
+def test_run_multiple_iterations_progress_only(mock_state_graph, capsys):
+    """
+    Test that progress mode prints iteration headers but no step values.
+    """
+    run_multiple_iterations(graph=mock_state_graph, starting_thread_id=1, num_repetitions=2,
+                            user_input_template={"input_key": "input_value"}, verbosity="progress")
+
+    captured = capsys.readouterr()
+    assert "Iteration: 2, Thread_ID 2" in captured.out
+    assert "output_1" not in captured.out
+    assert "Step 0:" not in captured.out
+
+
+def test_run_multiple_iterations_invalid_verbosity(mock_state_graph):
+    """
+    Test that an unsupported verbosity level is rejected before the graph is run.
+    """
+    with pytest.raises(ValueError):
+        run_multiple_iterations(mock_state_graph, 1, 1, {}, verbosity="loud")
+    mock_state_graph.stream.assert_not_called()
+
+
+def test_arun_multiple_iterations_respects_concurrency_limit(mock_state_graph, capsys):
+    """
+    Test that `arun_multiple_iterations` runs every iteration through `astream`
+    while never exceeding `max_concurrency` runs in flight.
+    """
+    in_flight = 0
+    peak_in_flight = 0
+    seen_thread_ids = []
+
+    async def fake_astream(user_input, config, stream_mode):
+        nonlocal in_flight, peak_in_flight
+        in_flight += 1
+        peak_in_flight = max(peak_in_flight, in_flight)
+        seen_thread_ids.append(config["configurable"]["thread_id"])
+        # Yield control so other iterations get a chance to start
+        await asyncio.sleep(0.01)
+        yield {"event_1": "output_1"}
+        in_flight -= 1
+
+    mock_state_graph.astream = fake_astream
+
+    asyncio.run(arun_multiple_iterations(graph=mock_state_graph, starting_thread_id=5, num_repetitions=6,
+                                         user_input_template={"input_key": "input_value"}, max_concurrency=2))
+
+    captured = capsys.readouterr()
+
+    assert sorted(seen_thread_ids, key=int) == [str(i) for i in range(5, 11)]
+    assert peak_in_flight == 2
+    assert "Thread_ID 10, Step 0:" in captured.out
+    assert "output_1" in captured.out
+
+
+def test_arun_multiple_iterations_cancels_other_runs_on_failure(mock_state_graph, setup_cleanup):
+    """
+    Test that a failing run without resume cancels the runs still in flight before the sweep is finalized.
+    """
+    finished = []
+    cancelled = []
+
+    async def fake_astream(user_input, config, stream_mode):
+        thread_id = config["configurable"]["thread_id"]
+        if thread_id == "1":
+            raise RuntimeError("node failed")
+        try:
+            await asyncio.sleep(0.05)
+        except asyncio.CancelledError:
+            cancelled.append(thread_id)
+            raise
+        finished.append(thread_id)
+        yield {"event_1": "output_1"}
+
+    mock_state_graph.astream = fake_astream
+
+    async def sweep():
+        with pytest.raises(RuntimeError, match="node failed"):
+            await arun_multiple_iterations(graph=mock_state_graph, starting_thread_id=1, num_repetitions=3,
+                                           user_input_template={}, max_concurrency=3, verbosity="silent",
+                                           output_dir=str(setup_cleanup))
+        # Nothing keeps running after the runner returned
+        await asyncio.sleep(0.1)
+
+    asyncio.run(sweep())
+
+    assert finished == []
+    assert sorted(cancelled) == ["2", "3"]
+    with open(setup_cleanup / "sweep_manifest.json") as f:
+        manifest = json.load(f)
+    assert manifest["completed"] == []
+    assert set(manifest["failed"]) == {"1"}
+
+
+def test_arun_multiple_iterations_with_async_memory(setup_cleanup):
+    """
+    Test that `arun_multiple_iterations` persists every run through the experiment's async checkpointer.
+    """
+    exp = create_experiment("async_test")
+
+    def node(state: State) -> State:
+        return {"value": state["value"] + "!"}
+
+    builder = StateGraph(State)
+    builder.add_node("node", node)
+    builder.add_edge(START, "node")
+    builder.add_edge("node", END)
+
+    async def main():
+        async with exp.async_memory() as memory:
+            graph = builder.compile(checkpointer=memory)
+            await arun_multiple_iterations(graph, 1, 4, {"value": "run"}, max_concurrency=2)
+
+    asyncio.run(main())
+
+    with sqlite3.connect(exp.database) as conn:
+        thread_ids = {row[0] for row in conn.execute("SELECT DISTINCT thread_id FROM checkpoints")}
+    assert thread_ids == {"1", "2", "3", "4"}
+
+
+def test_run_multiple_iterations_records_node_metrics(setup_cleanup):
+    """
+    Test that passing `output_dir` writes per node and per iteration timings to `run_metrics.json`.
+    """
+    def first(state: State) -> State:
+        return {"value": state["value"] + "a"}
+
+    def second(state: State) -> State:
+        return {"value": state["value"] + "b"}
+
+    builder = StateGraph(State)
+    builder.add_node("first", first)
+    builder.add_node("second", second)
+    builder.add_edge(START, "first")
+    builder.add_edge("first", "second")
+    builder.add_edge("second", END)
+    graph = builder.compile(checkpointer=MemorySaver())
+
+    steps = []
+    output_dir = setup_cleanup / "metrics"
+    output_dir.mkdir()
+
+    run_multiple_iterations(graph, 1, 3, {"value": "run"}, verbosity="silent", on_step=steps.append,
+                            output_dir=str(output_dir))
+
+    with open(output_dir / "run_metrics.json") as f:
+        metrics = json.load(f)
+
+    assert metrics["iterations"] == 3
+    assert set(metrics["thread_durations"]) == {"1", "2", "3"}
+    assert set(metrics["node_durations"]) == {"first", "second"}
+    assert metrics["node_durations"]["first"]["count"] == 3
+    for key in ["mean", "p50", "p95", "p99", "max"]:
+        assert key in metrics["iteration_durations"]
+
+    # Values are still forwarded to the callback: input + one state per node, for every run
+    assert len(steps) == 9
+    assert steps[-1].values == {"value": "runab"}
+
+
+def test_run_metrics_written_periodically(setup_cleanup):
+    """
+    Test that the metrics file isn't rewritten after every run, only once enough runs finished and at the end.
+    """
+    metrics = _RunMetrics(str(setup_cleanup))
+    metrics.WRITE_EVERY_RUNS = 3
+    metrics_file = setup_cleanup / "run_metrics.json"
+
+    for thread_id in ["1", "2"]:
+        metrics.finish(_IterationTimer(thread_id))
+    assert not metrics_file.exists()
+
+    metrics.finish(_IterationTimer("3"))
+    with open(metrics_file) as f:
+        assert json.load(f)["iterations"] == 3
+
+    metrics.finish(_IterationTimer("4"))
+    metrics.write()
+    with open(metrics_file) as f:
+        assert json.load(f)["iterations"] == 4
+
+
+def test_sweep_manifest_batches_completed_runs(setup_cleanup):
+    """
+    Test that completed runs are written to the manifest in batches, while failures are written immediately.
+    """
+    manifest = _SweepManifest(str(setup_cleanup))
+    manifest.WRITE_EVERY_RUNS = 3
+    manifest_file = setup_cleanup / "sweep_manifest.json"
+
+    for thread_id in ["1", "2"]:
+        manifest.complete(thread_id)
+    assert not manifest_file.exists()
+
+    manifest.fail("3", 3, 1, RuntimeError("rate limited"))
+    with open(manifest_file) as f:
+        data = json.load(f)
+    assert data["completed"] == ["1", "2"]
+    assert set(data["failed"]) == {"3"}
+
+    # The failure's write reset the batch
+    for thread_id in ["4", "5"]:
+        manifest.complete(thread_id)
+    with open(manifest_file) as f:
+        assert json.load(f)["completed"] == ["1", "2"]
+    manifest.complete("6")
+    with open(manifest_file) as f:
+        assert json.load(f)["completed"] == ["1", "2", "4", "5", "6"]
+
+
+def _build_flaky_graph(failures: dict):
+    """
+    Build a two node graph whose second node raises while `failures[thread_id]` is positive.
+    """
+    def first(state: State) -> State:
+        return {"value": state["value"] + "a"}
+
+    def flaky(state: State, config) -> State:
+        thread_id = config["configurable"]["thread_id"]
+        if failures.get(thread_id, 0) > 0:
+            failures[thread_id] -= 1
+            raise RuntimeError(f"rate limited on {thread_id}")
+        return {"value": state["value"] + "b"}
+
+    builder = StateGraph(State)
+    builder.add_node("first", first)
+    builder.add_node("flaky", flaky)
+    builder.add_edge(START, "first")
+    builder.add_edge("first", "flaky")
+    builder.add_edge("flaky", END)
+    return builder.compile(checkpointer=MemorySaver())
+
+
+def test_run_multiple_iterations_retries_and_resumes(setup_cleanup):
+    """
+    Test that failed runs are retried from their latest checkpoint, exhausted runs are recorded in the manifest
+    without aborting the sweep, and completed threads are skipped on the next resumed sweep.
+    """
+    failures = {"2": 1, "3": 10}
+    graph = _build_flaky_graph(failures)
+    output_dir = setup_cleanup / "sweep"
+    output_dir.mkdir()
+
+    run_multiple_iterations(graph, 1, 4, {"value": "run"}, verbosity="silent", output_dir=str(output_dir),
+                            resume=True, max_retries=1, retry_backoff=0)
+
+    with open(output_dir / "sweep_manifest.json") as f:
+        manifest = json.load(f)
+    assert manifest["completed"] == ["1", "2", "4"]
+    assert manifest["failed"]["3"]["attempts"] == 2
+    assert "rate limited on 3" in manifest["failed"]["3"]["error"]
+
+    # The retried thread was continued, so `first` ran only once
+    assert graph.get_state({"configurable": {"thread_id": "2"}}).values == {"value": "runab"}
+
+    # Second sweep only finishes the failed thread
+    failures["3"] = 0
+    steps = []
+    run_multiple_iterations(graph, 1, 4, {"value": "run"}, verbosity="silent", on_step=steps.append,
+                            output_dir=str(output_dir), resume=True)
+
+    with open(output_dir / "sweep_manifest.json") as f:
+        manifest = json.load(f)
+    assert manifest["skipped"] == ["1", "2", "4"]
+    assert manifest["completed"] == ["3"]
+    assert manifest["failed"] == {}
+    assert {step.thread_id for step in steps} == {"3"}
+    assert graph.get_state({"configurable": {"thread_id": "3"}}).values == {"value": "runab"}
+
+
+def test_run_multiple_iterations_raises_without_resume(setup_cleanup):
+    """
+    Test that without `resume` a run failing after all retries still aborts the sweep.
+    """
+    graph = _build_flaky_graph({"1": 5})
+
+    with pytest.raises(RuntimeError):
+        run_multiple_iterations(graph, 1, 2, {"value": "run"}, verbosity="silent", max_retries=1, retry_backoff=0)
+
+    assert graph.get_state({"configurable": {"thread_id": "2"}}).created_at is None
+
+
+def _build_sharded_graph(checkpointer):
+    """
+    Graph factory for the sharded sweep test - defined at module level, so it can be sent to worker processes.
+    """
+    def node(state: State) -> State:
+        return {"value": state["value"] + "!"}
+
+    builder = StateGraph(State)
+    builder.add_node("node", node)
+    builder.add_edge(START, "node")
+    builder.add_edge("node", END)
+    return builder.compile(checkpointer=checkpointer)
+
+
+def _build_failing_sharded_graph(checkpointer):
+    """
+    Graph factory whose node always fails for thread ID 2 - defined at module level, so it can be sent to workers.
+    """
+    def node(state: State, config) -> State:
+        if config["configurable"]["thread_id"] == "2":
+            raise RuntimeError("always fails")
+        return {"value": state["value"] + "!"}
+
+    builder = StateGraph(State)
+    builder.add_node("node", node)
+    builder.add_edge(START, "node")
+    builder.add_edge("node", END)
+    return builder.compile(checkpointer=checkpointer)
+
+
+def test_run_sharded_iterations(setup_cleanup):
+    """
+    Test that a sharded sweep writes disjoint thread ID ranges to per worker databases
+    and that the export reads all of them.
+    """
+    exp = create_experiment("sharded")
+
+    run_sharded_iterations(_build_sharded_graph, exp, 1, 5, {"value": "run"}, num_workers=2, verbosity="silent")
+
+    assert exp.databases == [exp.get_shard_database(0), exp.get_shard_database(1)]
+
+    shard_threads = []
+    for database in exp.databases:
+        with sqlite3.connect(database) as conn:
+            shard_threads.append({row[0] for row in conn.execute("SELECT DISTINCT thread_id FROM checkpoints")})
+    assert shard_threads == [{"1", "2", "3"}, {"4", "5"}]
+
+    export_sqlite_to_jsons(exp)
+    exported = sorted(os.listdir(exp.json_dir))
+    assert exported == [f"thread_{i}.json" for i in range(1, 6)]
+
+
+def test_run_sharded_iterations_resume(setup_cleanup, capsys):
+    """
+    Test that a resumed sharded sweep keeps the shard count, runs every thread against the shard that stores it,
+    and merges the shard manifests including the failures.
+    """
+    exp = create_experiment("sharded_resume")
+
+    run_sharded_iterations(_build_failing_sharded_graph, exp, 1, 4, {"value": "run"}, num_workers=2,
+                           verbosity="silent", resume=True)
+
+    with open(os.path.join(exp.reports_dir, "sweep_manifest.json")) as f:
+        manifest = json.load(f)
+    assert sorted(manifest["completed"]) == ["1", "3", "4"]
+    assert list(manifest["failed"]) == ["2"]
+
+    # A different worker count would move threads to other shards
+    with pytest.raises(ValueError):
+        run_sharded_iterations(_build_sharded_graph, exp, 1, 4, {"value": "run"}, num_workers=3, resume=True)
+
+    # Extended sweep - the range of every shard changes, but stored threads stay in their shard
+    capsys.readouterr()
+    run_sharded_iterations(_build_sharded_graph, exp, 1, 6, {"value": "run"}, resume=True)
+    assert "2 shards: 3 runs completed, 3 skipped, 0 failed" in capsys.readouterr().out
+
+    with open(os.path.join(exp.reports_dir, "sweep_manifest.json")) as f:
+        manifest = json.load(f)
+    assert sorted(manifest["completed"]) == ["2", "5", "6"]
+    assert sorted(manifest["skipped"]) == ["1", "3", "4"]
+
+    export_sqlite_to_jsons(exp)
+    assert sorted(os.listdir(exp.json_dir)) == [f"thread_{i}.json" for i in range(1, 7)]
+
+
+def test_export_rejects_thread_in_two_shards(setup_cleanup):
+    """
+    Test that the export refuses to merge checkpoints of one thread stored in two shard databases.
+    """
+    exp = create_experiment("sharded_duplicate")
+    run_sharded_iterations(_build_sharded_graph, exp, 1, 2, {"value": "run"}, num_workers=2, verbosity="silent")
+
+    with sqlite3.connect(exp.get_shard_database(1)) as conn:
+        conn.execute("ATTACH DATABASE ? AS shard0", (exp.get_shard_database(0),))
+        conn.execute("INSERT INTO checkpoints SELECT * FROM shard0.checkpoints")
+
+    with pytest.raises(ValueError, match="Thread_ID 1"):
+        export_sqlite_to_jsons(exp)
@@ -1,4 +1,6 @@
 import json
+import shutil
+from langgraph_compare import create_experiment
 from langgraph_compare.sql_to_jsons import export_sqlite_to_jsons
 
 
@@ -46,4 +48,21 @@ def test_export_sqlite_to_jsons(sample_db_path, log_file_paths, tmp_path):
             # Compare each key separately for better error messages
             for key in ['thread_ID', 'checkpoint', 'metadata']:
                 assert actual_record[key] == expected_record[key], \
-                    f"Mismatch in {key} for {created_path}"
\ No newline at end of file
+                    f"Mismatch in {key} for {created_path}"
+
+
+def test_export_closes_its_connections(sample_db_path, project_root, setup_cleanup):
+    """
+    Test that exporting an experiment doesn't leave pooled read-only connections open.
+
+    :param sample_db_path: Path to the test SQLite database
+    :param project_root: Path to the project root directory
+    :param setup_cleanup: Temporary working directory
+    """
+    exp = create_experiment("exported")
+    shutil.copy(project_root / sample_db_path, exp.database)
+
+    export_sqlite_to_jsons(exp)
+
+    assert len(list((setup_cleanup / exp.json_dir).glob("thread_*.json"))) == 3
+    assert exp._readers == {}
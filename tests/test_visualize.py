@@ -1,7 +1,11 @@
 from unittest.mock import MagicMock
+import pytest
 import os
 
+import pm4py
+
 from langgraph_compare import generate_mermaid, generate_prefix_tree, generate_performance_dfg, generate_visualizations
+from langgraph_compare.visualize import _build_prefix_tree
 
 def test_generate_mermaid(mock_state_graph, setup_cleanup):
     """
@@ -95,4 +99,177 @@ def test_generate_visualizations(sample_event_log, mock_state_graph, setup_clean
 
     for file_name in expected_files:
         file_path = output_dir / file_name
-        assert file_path.exists(), f"Expected visualization file {file_name} was not generated"
\ No newline at end of file
+        assert file_path.exists(), f"Expected visualization file {file_name} was not generated"
+
+def test_generate_visualizations_parallel_reports_failures(sample_event_log, mock_state_graph, setup_cleanup,
+                                                           monkeypatch):
+    """
+    Test that in parallel mode every visualization is rendered and failures are reported per artifact.
+
+    :param sample_event_log: The sample event log DataFrame provided by the fixture
+    :type sample_event_log: pd.DataFrame
+    :param mock_state_graph: Mock CompiledStateGraph object from fixture
+    :type mock_state_graph: MagicMock
+    """
+    output_dir = setup_cleanup / "visualizations"
+    os.makedirs(output_dir, exist_ok=True)
+
+    def render(filename):
+        def visualize(event_log, graph, output, options):
+            (output_dir / filename).write_bytes(b"mock png data")
+        return visualize
+
+    def fail(event_log, graph, output, options):
+        raise ValueError("layout failed")
+
+    monkeypatch.setattr("langgraph_compare.visualize._VISUALIZATIONS", {
+        "mermaid": render("mermaid.png"),
+        "prefix_tree": fail,
+        "dfg_performance": render("dfg_performance.png")
+    })
+
+    with pytest.raises(RuntimeError, match="1 of 3 visualizations:\n  prefix_tree: ValueError: layout failed"):
+        generate_visualizations(sample_event_log, mock_state_graph, str(output_dir), parallel=True)
+
+    # The remaining visualizations are still generated
+    assert (output_dir / "mermaid.png").exists()
+    assert (output_dir / "dfg_performance.png").exists()
+
+
+def test_generate_visualizations_passes_options(sample_event_log, mock_state_graph, setup_cleanup,
+                                                       monkeypatch):
+    """
+    Test that the DFG percentile and the prefix tree limits are passed through and validated before rendering.
+
+    :param sample_event_log: The sample event log DataFrame provided by the fixture
+    :type sample_event_log: pd.DataFrame
+    :param mock_state_graph: Mock CompiledStateGraph object from fixture
+    :type mock_state_graph: MagicMock
+    """
+    output_dir = setup_cleanup / "visualizations"
+    os.makedirs(output_dir, exist_ok=True)
+
+    percentiles = []
+    monkeypatch.setattr("langgraph_compare.visualize.generate_mermaid", lambda *args, **kwargs: None)
+    prefix_tree_limits = []
+    monkeypatch.setattr("langgraph_compare.visualize.generate_prefix_tree",
+                        lambda event_log, output, min_frequency, max_depth, top_k, image_format:
+                        prefix_tree_limits.append((min_frequency, max_depth, top_k)))
+    monkeypatch.setattr("langgraph_compare.visualize.generate_performance_dfg",
+                        lambda event_log, output, image_format, percentile: percentiles.append(percentile))
+
+    generate_visualizations(sample_event_log, mock_state_graph, str(output_dir), dfg_percentile=95)
+    assert percentiles == [95]
+
+    generate_visualizations(sample_event_log, mock_state_graph, str(output_dir), prefix_tree_min_frequency=2,
+                            prefix_tree_max_depth=5, prefix_tree_top_k=10)
+    assert prefix_tree_limits == [(1, None, None), (2, 5, 10)]
+
+    with pytest.raises(ValueError, match="percentile must be between 0 and 100"):
+        generate_visualizations(sample_event_log, mock_state_graph, str(output_dir), dfg_percentile=101)
+    with pytest.raises(ValueError, match="top_k must be at least 1"):
+        generate_visualizations(sample_event_log, mock_state_graph, str(output_dir), prefix_tree_top_k=0)
+    assert percentiles == [95, None]
+    assert len(prefix_tree_limits) == 2
+
+
+def test_build_prefix_tree_matches_pm4py_and_prunes(sample_event_log):
+    """
+    Test that the prefix tree built from the variant table matches pm4py's when nothing is pruned,
+    and that pruning by frequency, depth and top-k limits the tree.
+
+    :param sample_event_log: The sample event log DataFrame provided by the fixture
+    :type sample_event_log: pd.DataFrame
+    """
+    keys = dict(activity_key='concept:name', case_id_key='case:concept:name', timestamp_key='time:timestamp')
+    variants = pm4py.get_variants(sample_event_log, **keys)
+
+    assert _build_prefix_tree(variants) == pm4py.discover_prefix_tree(sample_event_log, **keys)
+
+    def depth(node):
+        return max((depth(child) for child in node.children), default=0) + (1 if node.label else 0)
+
+    def leaves(node):
+        return 1 if not node.children else sum(leaves(child) for child in node.children)
+
+    # Prefixes shared by at least 2 of the 3 cases form a single path, none of them is the end of a case
+    shared = _build_prefix_tree(variants, min_frequency=2)
+    assert leaves(shared) == 1
+    assert depth(shared) == 10
+
+    assert depth(_build_prefix_tree(variants, max_depth=4)) == 4
+    assert leaves(_build_prefix_tree(variants, top_k=1)) == 1
+    assert leaves(_build_prefix_tree(variants, top_k=2)) == 2
+
+
+def test_generate_prefix_tree_rejects_invalid_limits(sample_event_log, setup_cleanup):
+    """
+    Test that the prefix tree limits must be positive.
+    """
+    with pytest.raises(ValueError, match="max_depth must be at least 1"):
+        generate_prefix_tree(sample_event_log, str(setup_cleanup), max_depth=0)
+
+
+def test_generate_mermaid_reuses_unchanged_graph(mock_state_graph, setup_cleanup):
+    """
+    Test that an unchanged graph isn't rendered again, and that renders are shared through the cache directory.
+
+    :param mock_state_graph: Mock CompiledStateGraph object from fixture
+    :type mock_state_graph: MagicMock
+    """
+    mock_mermaid = MagicMock()
+    mock_mermaid.draw_mermaid.return_value = "graph TD;\n\t__start__ --> agent;"
+    mock_mermaid.draw_mermaid_png.return_value = b"mock png data"
+    mock_state_graph.get_graph.return_value = mock_mermaid
+
+    first_dir = setup_cleanup / "first"
+    second_dir = setup_cleanup / "second"
+    cache_dir = setup_cleanup / "cache"
+    os.makedirs(first_dir)
+    os.makedirs(second_dir)
+
+    generate_mermaid(mock_state_graph, str(first_dir), cache_dir=str(cache_dir))
+    generate_mermaid(mock_state_graph, str(first_dir), cache_dir=str(cache_dir))
+    generate_mermaid(mock_state_graph, str(second_dir), cache_dir=str(cache_dir))
+    assert mock_mermaid.draw_mermaid_png.call_count == 1
+    assert (second_dir / "mermaid.png").read_bytes() == b"mock png data"
+
+    # A changed structure is rendered again
+    mock_mermaid.draw_mermaid.return_value = "graph TD;\n\t__start__ --> other;"
+    generate_mermaid(mock_state_graph, str(first_dir), cache_dir=str(cache_dir))
+    assert mock_mermaid.draw_mermaid_png.call_count == 2
+
+
+def test_mermaid_dot_mirrors_graph_structure():
+    """
+    Test that the local renderer's DOT source contains every node and edge, with conditional edges dashed.
+    """
+    from typing import TypedDict
+    from langgraph.graph import StateGraph, START, END
+    from langgraph_compare.visualize import _mermaid_dot
+
+    class State(TypedDict):
+        value: str
+
+    workflow = StateGraph(State)
+    workflow.add_node("agent", lambda state: state)
+    workflow.add_node("tool", lambda state: state)
+    workflow.add_edge(START, "agent")
+    workflow.add_conditional_edges("agent", lambda state: "tool", {"tool": "tool", "finish": END})
+    workflow.add_edge("tool", "agent")
+
+    source = _mermaid_dot(workflow.compile()).source
+
+    for node in ("__start__", "agent", "tool", "__end__"):
+        assert node in source
+    assert "__start__ -> agent" in source
+    assert "tool -> agent" in source
+    assert "agent -> __end__ [label=finish style=dashed]" in source
+
+
+def test_generate_mermaid_rejects_unknown_renderer(mock_state_graph, setup_cleanup):
+    """
+    Test that an unknown mermaid renderer raises a ValueError.
+    """
+    with pytest.raises(ValueError, match="Unknown renderer"):
+        generate_mermaid(mock_state_graph, str(setup_cleanup), renderer="browser")